@@ -13,14 +13,15 @@ try {
     exit 1
 }
 
-# Rebuild dynamic indexes
-Write-Host "`n📝 Rebuilding dynamic indexes..." -ForegroundColor Yellow
-python scripts/build_index.py
+# Rebuild changed issue pages and the dynamic indexes (scripts/build.py runs
+# only the out-of-date tasks of the pipeline, independent ones in parallel)
+Write-Host "`n📝 Rebuilding pages and indexes..." -ForegroundColor Yellow
+python scripts/build.py @args
 
 if ($LASTEXITCODE -eq 0) {
-    Write-Host "✅ Indexes rebuilt successfully!" -ForegroundColor Green
+    Write-Host "✅ Site rebuilt successfully!" -ForegroundColor Green
 } else {
-    Write-Host "❌ Failed to rebuild indexes" -ForegroundColor Red
+    Write-Host "❌ Build failed" -ForegroundColor Red
     exit 1
 }
 
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: repeated analytics over JSON reports vs. the columnar item cache.
+
+Writes a synthetic report, then times the meta-page counts (top secondary
+tags and instruments), a score histogram and a per-tag filter three ways:
+  - json.load + Counter over the nested item dicts (what every run did before)
+  - a cold columnar build (parse, flatten, save the .npy files)
+  - warm runs that memory-map the cached arrays
+
+Usage:
+  python scripts/benchmarks/bench_columns.py
+  python scripts/benchmarks/bench_columns.py --items 50000 --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'converters'))
+
+import item_columns  # noqa: E402
+from entities import ENTITIES_BY_CODE  # noqa: E402
+from item_columns import ItemColumns  # noqa: E402
+
+EDGES = [0, 5, 10, 15, 20, 25, 30]
+
+
+def synthetic_report(n_items: int, n_tags: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    tags = [f'tag {i}' for i in range(n_tags)]
+    weights = [1 / (i + 1) for i in range(n_tags)]
+    instruments = [f'instrument {i}' for i in range(40)]
+    countries = sorted(ENTITIES_BY_CODE)
+    return {
+        'metadata': {'title': 'Synthetic report'},
+        'items': [
+            {
+                'item_id': f'item-{i}',
+                'headline': f'Headline {i}',
+                'publication_date': f'{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-2025',
+                'countries': rng.sample(countries, k=rng.randint(1, 3)),
+                'classification': {
+                    'primary_category': f'category_{rng.randrange(12)}',
+                    'secondary_tags': rng.choices(tags, weights, k=4),
+                    'instruments': rng.sample(instruments, k=2),
+                },
+                'scoring': {'total_score': rng.randint(0, 29)},
+            }
+            for i in range(n_items)
+        ],
+    }
+
+
+def dict_analytics(path: Path) -> tuple:
+    with open(path, 'r', encoding='utf-8') as f:
+        items = json.load(f)['items']
+    tags: Counter = Counter()
+    instruments: Counter = Counter()
+    histogram = [0] * (len(EDGES) - 1)
+    tagged = 0
+    for item in items:
+        classification = item.get('classification', {})
+        tags.update(classification.get('secondary_tags', []))
+        instruments.update(classification.get('instruments', []))
+        score = item.get('scoring', {}).get('total_score')
+        for b in range(len(EDGES) - 1):
+            if EDGES[b] <= score < EDGES[b + 1] or (b == len(EDGES) - 2 and score == EDGES[-1]):
+                histogram[b] += 1
+                break
+        tagged += 'tag 0' in classification.get('secondary_tags', [])
+    return tags.most_common(10), instruments.most_common(8), histogram, tagged
+
+
+def column_analytics(columns: ItemColumns) -> tuple:
+    return (
+        columns.most_common('secondary_tag', 10),
+        columns.most_common('instrument', 8),
+        [int(v) for v in columns.score_histogram(EDGES)],
+        int(columns.item_mask('secondary_tag', 'tag 0').sum()),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=20000)
+    parser.add_argument('--tags', type=int, default=1500, help='tag vocabulary size')
+    parser.add_argument('--repeat', type=int, default=5, help='warm runs to average')
+    args = parser.parse_args()
+
+    if item_columns.np is None:
+        print('NumPy is not installed; nothing to benchmark.')
+        return 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / 'report.json'
+        cache = Path(tmp) / 'columns'
+        report.write_text(json.dumps(synthetic_report(args.items, args.tags)), encoding='utf-8')
+        print(f'{args.items:,} items, {report.stat().st_size / 1e6:.1f} MB of JSON')
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            expected = dict_analytics(report)
+        t_dict = (time.perf_counter() - t0) / args.repeat
+
+        t0 = time.perf_counter()
+        column_analytics(ItemColumns.for_file(report, cache))
+        t_cold = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            result = column_analytics(ItemColumns.for_file(report, cache))
+        t_warm = (time.perf_counter() - t0) / args.repeat
+
+        if result != expected:
+            print('MISMATCH between dict and column analytics')
+            return 1
+        print(f'  json.load + Counter  {1000 * t_dict:8.1f} ms')
+        print(f'  columns, cold build  {1000 * t_cold:8.1f} ms')
+        print(f'  columns, mmap warm   {1000 * t_warm:8.1f} ms   ({t_dict / t_warm:.0f}x)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
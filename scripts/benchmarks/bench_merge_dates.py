@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: date handling in merge_items sorting.
+
+Compares the previous approach (parse_date + timestamp for every item, inside the
+sort key) with the memoised date_ordinal stage on synthetic items whose dates are
+drawn from a realistic pool of distinct strings in every supported format.
+
+Usage:
+  python scripts/benchmarks/bench_merge_dates.py
+  python scripts/benchmarks/bench_merge_dates.py --items 100000 --distinct 730
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'converters'))
+
+from dates import date_ordinal, parse_date  # noqa: E402
+from merge_artlaw_reports import normalize_dates  # noqa: E402
+
+FORMATS = ('%d-%m-%Y', '%Y-%m-%d', '%d/%m/%Y')
+
+
+def synthetic_items(count: int, distinct: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    start = date(2023, 1, 1)
+    pool = [
+        (start + timedelta(days=i)).strftime(FORMATS[i % len(FORMATS)])
+        for i in range(distinct)
+    ]
+    pool.append(None)  # some items have no date at all
+    return [
+        {
+            'item_id': f'SYN-{i:06d}',
+            'rank': rng.randint(1, 25),
+            'headline': f'Synthetic headline {rng.randint(0, 10_000)}',
+            'publication_date': rng.choice(pool),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_sort(items: list[dict]) -> list[dict]:
+    def sort_key(it):
+        pub = parse_date(it.get('publication_date')) or datetime.min
+        return (it['rank'], -int(pub.timestamp()) if pub != datetime.min else 0, it['headline'])
+    return sorted(items, key=sort_key)
+
+
+def ordinal_sort(items: list[dict]) -> list[dict]:
+    normalize_dates(items)
+
+    def sort_key(it):
+        ordinal = it['date_ordinal']
+        return (it['rank'], -ordinal if ordinal else 0, it['headline'])
+    return sorted(items, key=sort_key)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=100_000)
+    parser.add_argument('--distinct', type=int, default=730, help='distinct date strings in the pool')
+    args = parser.parse_args()
+
+    items = synthetic_items(args.items, args.distinct)
+    print(f'{args.items:,} items, {args.distinct} distinct date strings')
+
+    legacy, t_legacy = timed(legacy_sort, [dict(it) for it in items])
+    date_ordinal.cache_clear()
+    cold, t_cold = timed(ordinal_sort, [dict(it) for it in items])
+    warm, t_warm = timed(ordinal_sort, [dict(it) for it in items])
+
+    same = [it['item_id'] for it in legacy] == [it['item_id'] for it in cold] == [it['item_id'] for it in warm]
+    print(f'  parse_date in sort key : {t_legacy * 1000:8.1f} ms')
+    print(f'  date_ordinal (cold)    : {t_cold * 1000:8.1f} ms  ({t_legacy / t_cold:.1f}x)')
+    print(f'  date_ordinal (warm)    : {t_warm * 1000:8.1f} ms  ({t_legacy / t_warm:.1f}x)')
+    print(f'  identical order        : {same}')
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
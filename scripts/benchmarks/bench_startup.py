@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start import time of every entry point.
+
+Imports each script in a fresh interpreter under ``python -X importtime``,
+parses the cumulative time of the module from the report and compares the
+median of several runs with its budget. Budgets are multiples of the
+interpreter's own start-up imports (``python -X importtime -c pass``),
+measured in the same run, so a slower or busier machine moves both alike.
+The modules with the most self time are listed, so a regression points at
+the import that caused it. Exits 1 when an entry point is over budget.
+
+Usage:
+  python scripts/benchmarks/bench_startup.py
+  python scripts/benchmarks/bench_startup.py --runs 9 --top 5 json_to_html_converter_v2 build
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+CONVERTERS_DIR = SCRIPTS_DIR / 'converters'
+
+# entry point -> cumulative import budget, in multiples of the interpreter start-up
+# imports (~9 ms on a laptop), 2-2.5 times what each measured. NumPy (~8 units) is
+# part of every converter that renders analytics: item_columns needs it on each run.
+BUDGETS = {
+    'build': 15,
+    'build_index': 10,
+    'build_feeds': 10,
+    'build_search_index': 10,
+    'converter_daemon': 8,
+    'preview_server': 14,
+    'deploy_sync': 10,
+    'check_reproducible': 8,
+    'client_review_workflow': 12,
+    'json_to_html_converter': 10,
+    'json_to_html_converter_v2': 28,
+    'json_to_html_converter_cl': 10,
+    'json_to_html_converter_artlaw': 28,
+    'json_to_html_converter_datagovernance': 30,
+    'json_to_html_converter_merged': 12,
+    'merge_artlaw_reports': 20,
+    'trend_analytics': 35,
+    'item_archive': 10,
+}
+
+# "import time:       self [us] |  cumulative | imported package", nested imports indented by two
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\| ( *)(\S+)')
+
+
+def import_times(module: str | None) -> tuple[int, dict[str, int]]:
+    """
+    Cumulative import time of ``module`` and the self time of every module it
+    pulled in (microseconds). With None, the interpreter's start-up imports.
+    """
+    code = 'pass' if module is None else \
+        f'import sys; sys.path[:0] = [{str(CONVERTERS_DIR)!r}, {str(SCRIPTS_DIR)!r}]; import {module}'
+    # Bytecode is written and reused, as on a normal start; compiling is not start-up cost
+    env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, cwd=SCRIPTS_DIR.parent, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else module)
+    cumulative, self_times = 0 if module is None else None, {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        self_times[name] = int(self_us)
+        if module is None and not indent:
+            cumulative += int(cumulative_us)
+        elif name == module and not indent:
+            cumulative = int(cumulative_us)
+    if cumulative is None:
+        raise RuntimeError(f'{module} missing from the -X importtime report')
+    return cumulative, self_times
+
+
+def median_ms(module: str | None, runs: int) -> tuple[float, dict[str, float]]:
+    """Median cumulative import time and median self time per imported module, in ms."""
+    totals, self_times = [], defaultdict(list)
+    import_times(module)  # warm-up: writes any stale .pyc and fills the OS file cache
+    for _ in range(runs):
+        cumulative, selfs = import_times(module)
+        totals.append(cumulative / 1000)
+        for name, us in selfs.items():
+            self_times[name].append(us / 1000)
+    return statistics.median(totals), {name: statistics.median(v) for name, v in self_times.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('modules', nargs='*', help='entry points to measure (default: all budgeted)')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=3, help='heaviest imports listed per entry point')
+    args = parser.parse_args()
+
+    modules = args.modules or list(BUDGETS)
+    baseline, _ = median_ms(None, args.runs)
+    print(f'interpreter start-up imports: {baseline:.1f} ms (budget unit)')
+    over = []
+    print(f'{"entry point":<40} {"median":>8} {"units":>6} {"budget":>6}   heaviest imports (self ms)')
+    for module in modules:
+        try:
+            median, self_times = median_ms(module, args.runs)
+        except RuntimeError as e:
+            print(f'{module:<40} {"error":>8}   {e}')
+            over.append(module)
+            continue
+        units = median / baseline
+        budget = BUDGETS.get(module)
+        heaviest = sorted(((ms, name) for name, ms in self_times.items()), reverse=True)[:args.top]
+        status = '' if budget is None or units <= budget else '  OVER'
+        if status:
+            over.append(module)
+        print(f'{module:<40} {median:6.1f}ms {units:6.1f} {budget if budget else "-":>6}   '
+              + ', '.join(f'{name} {ms:.1f}' for ms, name in heaviest) + status)
+    if over:
+        print(f'\nOver budget: {", ".join(over)}')
+    return 1 if over else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
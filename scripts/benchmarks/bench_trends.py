@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cross-issue trend analytics on a synthetic multi-year archive.
+
+Generates weekly issues with realistic vocabularies (categories, countries,
+long-tailed tags), then times matrix construction and the vectorised trend
+computations of trend_analytics for every facet.
+
+Usage:
+  python scripts/benchmarks/bench_trends.py
+  python scripts/benchmarks/bench_trends.py --years 10 --items 25 --tags 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'converters'))
+
+import trend_analytics  # noqa: E402
+from entities import ENTITIES_BY_CODE  # noqa: E402
+from trend_analytics import FACETS, Issue, compute_trends, count_matrix  # noqa: E402
+
+
+def synthetic_issues(years: int, items_per_issue: int, n_tags: int, seed: int = 11) -> list[Issue]:
+    rng = random.Random(seed)
+    categories = [f'category_{i}' for i in range(20)]
+    countries = sorted(ENTITIES_BY_CODE)
+    tags = [f'tag {i}' for i in range(n_tags)]
+    weights = [1 / (i + 1) for i in range(n_tags)]  # Zipf-like tag popularity
+    issues = []
+    start = 739000
+    for week in range(years * 52):
+        items = [
+            {
+                'classification': {
+                    'primary_category': rng.choice(categories),
+                    'secondary_tags': rng.choices(tags, weights, k=4),
+                },
+                'countries': rng.sample(countries, k=rng.randint(1, 3)),
+            }
+            for _ in range(items_per_issue)
+        ]
+        issues.append(Issue(f'issue-{week:04d}', start + 7 * week, f'Issue {week}', items))
+    return issues
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--items', type=int, default=20, help='items per weekly issue')
+    parser.add_argument('--tags', type=int, default=2000, help='tag vocabulary size')
+    args = parser.parse_args()
+
+    if trend_analytics.np is None:
+        print('NumPy is not installed; nothing to benchmark.')
+        return 2
+
+    issues = synthetic_issues(args.years, args.items, args.tags)
+    counts = [len(i.items) for i in issues]
+    print(f'{len(issues)} weekly issues, {sum(counts):,} items')
+
+    total = 0.0
+    for facet, extract in FACETS.items():
+        t0 = time.perf_counter()
+        matrix = count_matrix(issues, extract)
+        t1 = time.perf_counter()
+        compute_trends(matrix, counts)
+        t2 = time.perf_counter()
+        total += t2 - t0
+        print(f'  {facet:<9} {matrix.counts.shape[0]}x{matrix.counts.shape[1]:<5} '
+              f'matrix {1000 * (t1 - t0):7.1f} ms   trends {1000 * (t2 - t1):6.1f} ms')
+    print(f'  total     {1000 * total:7.1f} ms')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load test: concurrent reviewers against the client review server.
+
+Starts the review server in-process on a free port with a temporary set of
+drafts (or targets a running server with --url), then lets every simulated
+reviewer hold one keep-alive connection and alternate page loads with
+POST /save of its own issue. Reports throughput, latency percentiles and
+errors, and checks that every draft ends up holding one complete saved body.
+
+Usage:
+  python scripts/benchmarks/load_review_server.py
+  python scripts/benchmarks/load_review_server.py --clients 32 --requests 200 --draft-kb 512
+  python scripts/benchmarks/load_review_server.py --url http://localhost:8080 --drafts a_draft.md b_draft.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from client_review_workflow import ClientReviewWorkflow  # noqa: E402
+
+
+def reviewer(host: str, port: int, draft: str, requests: int, body_size: int, client_id: int,
+             latencies: dict, errors: list, lock: threading.Lock) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    local = {'GET': [], 'POST': []}
+    for n in range(requests):
+        if n % 2:
+            content = f'<!-- client {client_id} save {n} -->\n' + 'x' * body_size
+            payload = json.dumps({'draft': draft, 'content': content})
+            method, path = 'POST', '/save'
+            args = {'body': payload, 'headers': {'Content-Type': 'application/json'}}
+        else:
+            method, path, args = 'GET', f'/review/{draft}', {}
+        t0 = time.perf_counter()
+        try:
+            conn.request(method, path, **args)
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200 or (method == 'POST' and not json.loads(body).get('success')):
+                raise RuntimeError(f'{method} {path}: HTTP {response.status} {body[:120]!r}')
+        except Exception as e:  # keep going; the summary reports every failure
+            with lock:
+                errors.append(str(e))
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        local[method].append(time.perf_counter() - t0)
+    conn.close()
+    with lock:
+        for method, values in local.items():
+            latencies[method].extend(values)
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=16, help='concurrent reviewers')
+    parser.add_argument('--requests', type=int, default=100, help='requests per reviewer')
+    parser.add_argument('--issues', type=int, default=4, help='drafts shared among the reviewers')
+    parser.add_argument('--draft-kb', type=int, default=256, help='size of each saved draft')
+    parser.add_argument('--url', help='running review server (default: start one in-process)')
+    parser.add_argument('--drafts', nargs='*', help='draft names on the running server (with --url)')
+    args = parser.parse_args()
+
+    server = None
+    tmp = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+        drafts = args.drafts or []
+        if not drafts:
+            print('--drafts is required with --url')
+            return 2
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        workflow = ClientReviewWorkflow(Path(tmp.name) / 'drafts', quiet=True)
+        drafts = [f'issue_{i}_draft.md' for i in range(args.issues)]
+        for name in drafts:
+            (workflow.drafts_dir / name).write_text('# draft\n' + 'x' * args.draft_kb * 1024, encoding='utf-8')
+        server = workflow.make_review_server('127.0.0.1', 0)
+        host, port = server.server_address[:2]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    latencies: dict = {'GET': [], 'POST': []}
+    errors: list = []
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=reviewer, args=(host, port, drafts[i % len(drafts)], args.requests,
+                                                args.draft_kb * 1024, i, latencies, errors, lock))
+        for i in range(args.clients)
+    ]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    total = sum(len(v) for v in latencies.values())
+    print(f'{args.clients} reviewers x {args.requests} requests on {len(drafts)} drafts '
+          f'({args.draft_kb} KB each): {total} ok, {len(errors)} errors in {elapsed:.2f} s '
+          f'({total / elapsed:.0f} req/s)')
+    for method, values in latencies.items():
+        if values:
+            print(f'  {method:<4} p50 {1000 * statistics.median(values):7.1f} ms   '
+                  f'p95 {1000 * percentile(values, 0.95):7.1f} ms   max {1000 * max(values):7.1f} ms')
+    for message in errors[:5]:
+        print(f'  error: {message}')
+
+    status = 1 if errors else 0
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+        # Atomic saves: each draft holds exactly one reviewer's last complete body
+        for name in drafts:
+            text = (workflow.drafts_dir / name).read_text(encoding='utf-8')
+            if not text.startswith('<!-- client ') or len(text.split('\n', 1)[1]) != args.draft_kb * 1024:
+                print(f'  torn or missing save in {name}')
+                status = 1
+        tmp.cleanup()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Site build orchestrator.
+
+Models the publishing pipeline as a dependency graph of tasks:
+
+  data/<newsletter>/<issue>.json
+    -> items:<newsletter>/<issue>   normalised item caches (.cache/columns, .cache/analytics)
+    -> pages:<newsletter>/<issue>   issue page and _meta page, by the converter that published the issue
+  data/<newsletter>/*.json, after the items tasks of its issues
+    -> trends:<newsletter>          the cross-issue trends dashboard (trend_analytics.py)
+  pages and trends
+    -> landing                      search shards, feeds, landing pages and sitemap.xml
+                                    (build_index.py)
+  Headers/, Fonts/
+    -> assets:<newsletter>          the copies published under docs/<newsletter>/assets/
+  all of the above
+    -> compress                     .gz (and .br, with the brotli module) siblings of
+                                    the text files and fonts under docs/
+
+Every task declares its input and output files. A task runs only when the
+content of an input changed, or an output is missing or was edited since the
+last build; tasks whose dependencies are done run in parallel. File hashes
+are memoised by (size, mtime) in .cache/build_state.json, so a no-op rebuild
+only stats the files.
+
+The issues are the JSON reports that already have a published page; pass a
+new report on the command line to publish it.
+
+After each build, .cache/deploy_manifest.json lists every file under docs/
+with its hash and size, and what was added, changed or deleted since the
+previous build; scripts/deploy_sync.py publishes from it.
+
+--reproducible stamps every output with the time of the last commit
+(SOURCE_DATE_EPOCH, unless already set) instead of the wall clock, so the
+same sources give byte-identical pages; scripts/check_reproducible.py
+verifies that.
+
+Pages are rendered by the warm converter daemon (scripts/converter_daemon.py)
+when one is running, and by a fresh interpreter per converter otherwise.
+
+With --watch the build stays running: it watches data/, Headers/, Fonts/ and
+scripts/, waits for a burst of saves to settle, and reruns the out-of-date
+tasks in the same process, with the converter modules already imported; it
+also hosts the converter daemon for other builds and command-line
+conversions. A change to the build scripts or converters restarts the watcher. With
+--serve it also runs the preview server (scripts/preview_server.py) and
+reloads the open pages that a build rewrote.
+
+Usage:
+  python scripts/build.py
+  python scripts/build.py data/art-law/new_report.json
+  python scripts/build.py --dry-run
+  python scripts/build.py --force --jobs 4
+  python scripts/build.py --reproducible
+  python scripts/build.py --watch
+  python scripts/build.py --watch --serve 8000
+"""
+
+import argparse
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = Path('scripts')
+CONVERTERS_DIR = SCRIPTS_DIR / 'converters'
+DATA_DIR = Path('data')
+DOCS_DIR = Path('docs')
+STATE_FILE = Path('.cache') / 'build_state.json'
+DEPLOY_MANIFEST = Path('.cache') / 'deploy_manifest.json'
+FORMAT_VERSION = 1
+
+NEWSLETTERS = ('sovereign-debt', 'art-law', 'data-governance')
+ANALYTICS_LANG = {'sovereign-debt': 'en', 'art-law': 'es', 'data-governance': 'es'}
+
+# (newsletter, report file pattern, converter); the first match wins
+CONVERTER_RULES = [
+    ('sovereign-debt', '*cl.json', 'json_to_html_converter_cl.py'),
+    ('sovereign-debt', '*.json', 'json_to_html_converter_v2.py'),
+    ('art-law', '*_all_merged.json', 'json_to_html_converter_merged.py'),
+    ('art-law', '*.json', 'json_to_html_converter_artlaw.py'),
+    ('data-governance', '*.json', 'json_to_html_converter_datagovernance.py'),
+]
+# Issues published with another converter than their rule's: (newsletter, report stem) -> converter
+CONVERTER_OVERRIDES = {
+    ('sovereign-debt', '05082025'): 'json_to_html_converter.py',
+    ('sovereign-debt', '14082025'): 'json_to_html_converter.py',
+    ('art-law', 'arte_derecho_report_2025_08_20_cl'): 'json_to_html_converter_artlaw_simple.py',
+}
+# Issues whose published page predates the current version of its converter: a rebuild would
+# restyle them, so they are only rendered when named on the command line
+FROZEN_ISSUES = {
+    ('sovereign-debt', '05082025'),
+    ('sovereign-debt', '14082025'),
+    ('art-law', 'arte_derecho_report_2025_08_20_cl'),
+}
+# Converters that write the issue page only, no _meta page
+SINGLE_PAGE_CONVERTERS = ('json_to_html_converter.py', 'json_to_html_converter_artlaw_simple.py')
+
+# Landing pages written by build_index.py; each links its newsletter's trends dashboard
+LANDING_PAGES = ('sovereign-debt', 'art-law')
+TRENDS_PAGE = 'trends_meta.html'
+
+# Published asset folders and the sources they are copied from
+ASSET_SOURCES = {'headers': Path('Headers'), 'fonts': Path('Fonts')}
+
+# Precompressed for the preview server; JPEGs are already compressed
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg', '.xml', '.txt', '.ttf', '.otf')
+COMPRESSED = ('.gz', '.br')
+MIN_COMPRESS_SIZE = 1024
+
+WATCH_DIRS = (DATA_DIR, Path('Headers'), Path('Fonts'), SCRIPTS_DIR)
+DEBOUNCE = 0.1
+
+
+class Task(NamedTuple):
+    name: str
+    inputs: List[Path]
+    outputs: List[Path]
+    deps: List[str]
+    run: Callable[[], None]
+    # Recomputes (inputs, outputs) once the dependencies finished, for files they create
+    refresh: Optional[Callable[[], Tuple[List[Path], List[Path]]]] = None
+
+
+class FileHashes:
+    """sha256 of files, memoised by (size, mtime) across builds."""
+
+    def __init__(self, memo: Dict[str, list]):
+        self.memo = memo
+
+    def __call__(self, path: Path) -> Optional[str]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = path.as_posix()
+        entry = self.memo.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.memo[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def snapshot(self, paths: List[Path]) -> Dict[str, Optional[str]]:
+        return {path.as_posix(): self(path) for path in paths}
+
+
+def load_state() -> dict:
+    try:
+        with STATE_FILE.open('r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == FORMAT_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': FORMAT_VERSION, 'files': {}, 'tasks': {}}
+
+
+def save_state(state: dict) -> None:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(',', ':'))
+    os.replace(tmp, STATE_FILE)
+
+
+def write_deploy_manifest(hashes: FileHashes) -> dict:
+    """Record every published file's hash and size, and the differences to the previous build."""
+    from output_files import canonical_json, write_if_changed
+    try:
+        with DEPLOY_MANIFEST.open('r', encoding='utf-8') as f:
+            previous = json.load(f).get('files', {})
+    except (OSError, ValueError):
+        previous = {}
+    files = {}
+    for path in sorted(DOCS_DIR.rglob('*')):
+        if path.is_file() and not path.name.startswith('.'):
+            files[path.relative_to(DOCS_DIR).as_posix()] = {'sha256': hashes(path), 'size': path.stat().st_size}
+    manifest = {
+        'version': FORMAT_VERSION,
+        'root': DOCS_DIR.as_posix(),
+        'added': sorted(files.keys() - previous.keys()),
+        'changed': sorted(name for name in files.keys() & previous.keys() if files[name] != previous[name]),
+        'deleted': sorted(previous.keys() - files.keys()),
+        'files': files,
+    }
+    write_if_changed(DEPLOY_MANIFEST, canonical_json(manifest, indent=1))
+    return manifest
+
+
+# -- tasks --------------------------------------------------------------------
+
+def converter_for(newsletter: str, report: Path) -> Optional[Path]:
+    override = CONVERTER_OVERRIDES.get((newsletter, report.stem))
+    if override:
+        return CONVERTERS_DIR / override
+    for rule_newsletter, pattern, converter in CONVERTER_RULES:
+        if rule_newsletter == newsletter and fnmatch(report.name, pattern):
+            return CONVERTERS_DIR / converter
+    return None
+
+
+def published_reports(extra: List[Path]) -> List[Path]:
+    """Reports with a published issue page (except FROZEN_ISSUES), plus the ones asked for explicitly."""
+    reports = set(extra)
+    for newsletter in NEWSLETTERS:
+        issues_dir = DOCS_DIR / newsletter / 'issues'
+        for report in (DATA_DIR / newsletter).glob('*.json'):
+            if (newsletter, report.stem) in FROZEN_ISSUES:
+                continue
+            if (issues_dir / f'{report.stem}.html').exists():
+                reports.add(report)
+    return sorted(reports)
+
+
+def source_date_epoch() -> str:
+    """Commit time of HEAD, the conventional SOURCE_DATE_EPOCH; 0 outside a git checkout."""
+    result = subprocess.run(['git', 'log', '-1', '--format=%ct'], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 and result.stdout.strip() else '0'
+
+
+def run_script(*args: object) -> None:
+    result = subprocess.run([sys.executable, *map(str, args)], capture_output=True, text=True)
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(output[-1] if output else f'exit status {result.returncode}')
+
+
+def run_warm(script: Path, *args: object) -> None:
+    """Run a script as __main__ in this process, reusing the modules earlier runs imported.
+    
+    Only safe one task at a time: argv, sys.path and stdout are process-wide.
+    """
+    from converter_daemon import PROCESS_LOCK
+    with PROCESS_LOCK:
+        argv, path = sys.argv, list(sys.path)
+        sys.argv = [str(script), *map(str, args)]
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                runpy.run_path(str(script), run_name='__main__')
+        except SystemExit as e:
+            if e.code not in (0, None):
+                lines = output.getvalue().strip().splitlines()
+                raise RuntimeError(lines[-1] if lines else f'exit status {e.code}')
+        finally:
+            sys.argv, sys.path[:] = argv, path
+
+
+def run_converter(converter: Path, *args: object, warm: bool = False) -> None:
+    """Render through the converter daemon when one is running; otherwise in this
+    process (watch mode) or in a fresh interpreter."""
+    from converter_daemon import convert
+    result = convert(converter, *args, local=warm)
+    if result is None:
+        return run_script(converter, *args)
+    status, output = result
+    if status != 0:
+        lines = output.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f'exit status {status}')
+
+
+def copy_assets(pairs: List[tuple]) -> None:
+    from output_files import write_if_changed
+    for source, target in pairs:
+        write_if_changed(target, source.read_bytes())
+
+
+def compressible_files() -> List[Path]:
+    return sorted(path for path in DOCS_DIR.rglob('*')
+                  if path.suffix in COMPRESSIBLE and path.is_file() and path.stat().st_size >= MIN_COMPRESS_SIZE)
+
+
+def _write_if_stale(source: Path, target: Path, compress: Callable[[bytes], bytes]) -> None:
+    from output_files import write_if_changed
+    if target.exists() and target.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+        return
+    if not write_if_changed(target, compress(source.read_bytes())):
+        # Same bytes: mark the sibling fresh so the source is not recompressed next time
+        os.utime(target)
+
+
+def precompress() -> None:
+    """Write compressed siblings of the files under docs/ and drop orphaned ones."""
+    sources = compressible_files()
+    for source in sources:
+        # mtime=0 keeps the .gz bytes a function of the content alone
+        _write_if_stale(source, source.with_name(source.name + '.gz'), lambda data: gzip.compress(data, 9, mtime=0))
+        if brotli is not None:
+            _write_if_stale(source, source.with_name(source.name + '.br'), brotli.compress)
+    keep = set(sources)
+    for suffix in COMPRESSED:
+        for sibling in DOCS_DIR.rglob(f'*{suffix}'):
+            if sibling.with_suffix('') not in keep:
+                sibling.unlink()
+
+
+def build_item_cache(report: Path, lang: str) -> None:
+    from item_analytics import cached_analytics
+    from item_columns import load_columns
+    load_columns(report)
+    cached_analytics(report, lang=lang)
+
+
+def build_graph(reports: List[Path], warm: bool = False) -> Dict[str, Task]:
+    run = run_warm if warm else run_script
+    shared = sorted(p for p in CONVERTERS_DIR.glob('*.py') if not p.name.startswith('json_to_html_converter'))
+    tasks: Dict[str, Task] = {}
+    pages: List[str] = []
+    issue_pages: List[Path] = []
+    for report in reports:
+        newsletter = report.parent.name
+        converter = converter_for(newsletter, report)
+        if converter is None:
+            print(f"⚠️  No converter for {report}; skipped")
+            continue
+        issue = f'{newsletter}/{report.stem}'
+        issues_dir = DOCS_DIR / newsletter / 'issues'
+        outputs = [issues_dir / f'{report.stem}.html']
+        if converter.name not in SINGLE_PAGE_CONVERTERS:
+            outputs.append(issues_dir / f'{report.stem}_meta.html')
+        tasks[f'items:{issue}'] = Task(
+            f'items:{issue}', [report, CONVERTERS_DIR / 'item_columns.py', CONVERTERS_DIR / 'item_analytics.py'],
+            [], [], lambda report=report, newsletter=newsletter: build_item_cache(report, ANALYTICS_LANG[newsletter]))
+        tasks[f'pages:{issue}'] = Task(
+            f'pages:{issue}', [report, converter, *shared], outputs, [f'items:{issue}'],
+            lambda report=report, converter=converter, issues_dir=issues_dir:
+            run_converter(converter, report, issues_dir, warm=warm))
+        pages.append(f'pages:{issue}')
+        issue_pages.extend(outputs)
+
+    # Trends cover every report of a newsletter, so they rerun whenever one of its issues does
+    trends: List[str] = []
+    trend_analytics = CONVERTERS_DIR / 'trend_analytics.py'
+    for newsletter in LANDING_PAGES:
+        sources = sorted(p for p in (DATA_DIR / newsletter).glob('*.json') if not p.stem.endswith('_all_merged'))
+        if not sources:
+            continue
+        output = DOCS_DIR / newsletter / 'issues' / TRENDS_PAGE
+        tasks[f'trends:{newsletter}'] = Task(
+            f'trends:{newsletter}', [*sources, trend_analytics, *shared], [output],
+            [name for name in tasks if name.startswith(f'items:{newsletter}/')],
+            lambda newsletter=newsletter: run(trend_analytics, newsletter))
+        trends.append(f'trends:{newsletter}')
+        issue_pages.append(output)
+
+    # The landing pages and the sitemap list every published page, not only the ones built here
+    for newsletter in NEWSLETTERS:
+        issue_pages.extend((DOCS_DIR / newsletter / 'issues').glob('*.html'))
+    build_index = SCRIPTS_DIR / 'build_index.py'
+    tasks['landing'] = Task(
+        'landing',
+        sorted(set(issue_pages)) + reports
+        + [build_index, SCRIPTS_DIR / 'build_search_index.py', SCRIPTS_DIR / 'build_feeds.py',
+           CONVERTERS_DIR / 'issue_metadata.py'],
+        [DOCS_DIR / newsletter / 'index.html' for newsletter in LANDING_PAGES] + [DOCS_DIR / 'sitemap.xml']
+        + [DOCS_DIR / newsletter / name for newsletter in NEWSLETTERS
+           if (DATA_DIR / newsletter).is_dir() and (DOCS_DIR / newsletter).is_dir()
+           for name in ('search/manifest.json', 'feed.xml', 'atom.xml', 'feed.json')],
+        pages + trends, lambda: run(build_index))
+
+    # Only the assets a newsletter already publishes are kept in sync
+    for newsletter in NEWSLETTERS:
+        pairs = [(source_dir / target.name, target)
+                 for kind, source_dir in ASSET_SOURCES.items()
+                 for target in sorted((DOCS_DIR / newsletter / 'assets' / kind).glob('*'))
+                 if (source_dir / target.name).is_file()]
+        if pairs:
+            tasks[f'assets:{newsletter}'] = Task(
+                f'assets:{newsletter}', [source for source, _ in pairs], [target for _, target in pairs],
+                [], lambda pairs=pairs: copy_assets(pairs))
+
+    # Files the other tasks write are compressed even before they first exist; files they
+    # write without declaring them (search shards) are picked up when compress is reached
+    declared = [path for task in tasks.values() for path in task.outputs if path.suffix in COMPRESSIBLE]
+
+    def compress_files() -> Tuple[List[Path], List[Path]]:
+        sources = sorted(set(compressible_files()).union(declared))
+        suffixes = COMPRESSED if brotli is not None else ('.gz',)
+        return sources, [source.with_name(source.name + suffix) for source in sources for suffix in suffixes
+                         if not source.exists() or source.stat().st_size >= MIN_COMPRESS_SIZE]
+
+    tasks['compress'] = Task('compress', *compress_files(), sorted(tasks), precompress, compress_files)
+    return tasks
+
+
+# -- scheduler ----------------------------------------------------------------
+
+class InlineExecutor:
+    """Runs each task in the calling thread as it is submitted (--jobs 1 and watch mode)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn: Callable[[], None]) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def run_graph(tasks: Dict[str, Task], state: dict, jobs: int, force: bool = False, dry_run: bool = False,
+              changed: Optional[List[Path]] = None) -> int:
+    """Run out-of-date tasks in dependency order, independent ones in parallel.
+
+    Outputs whose content the run changed are appended to ``changed``.
+    """
+    hashes = FileHashes(state['files'])
+    records = state['tasks']
+    pending = dict(tasks)
+    done, failed, stale = set(), set(), set()
+    ran = 0
+    running = {}
+    with (InlineExecutor() if jobs == 1 else ThreadPoolExecutor(max_workers=jobs)) as pool:
+        while pending or running:
+            progress = len(pending)
+            for name, task in list(pending.items()):
+                if any(dep in failed for dep in task.deps):
+                    del pending[name]
+                    failed.add(name)
+                    print(f"⏭️  {name}: skipped, a dependency failed")
+                elif all(dep in done for dep in task.deps):
+                    del pending[name]
+                    if task.refresh is not None:
+                        task_inputs, task_outputs = task.refresh()
+                        task = task._replace(inputs=task_inputs, outputs=task_outputs)
+                    inputs = hashes.snapshot(task.inputs)
+                    record = records.get(name)
+                    if (not force and record and record['inputs'] == inputs
+                            and record['outputs'] == hashes.snapshot(task.outputs)
+                            and not any(dep in stale for dep in task.deps)):
+                        done.add(name)
+                    elif dry_run:
+                        # Without running it, assume the task changes what depends on it
+                        print(f"🔧 {name}: would run")
+                        done.add(name)
+                        stale.add(name)
+                        ran += 1
+                    else:
+                        started = time.perf_counter()
+                        running[pool.submit(task.run)] = (task, inputs, started)
+            if not running:
+                if len(pending) == progress:
+                    raise ValueError(f"Unresolvable dependencies: {', '.join(sorted(pending))}")
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task, inputs, started = running.pop(future)
+                ran += 1
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.add(task.name)
+                    records.pop(task.name, None)
+                    print(f"❌ {task.name}: {e}")
+                    continue
+                outputs = hashes.snapshot(task.outputs)
+                if changed is not None:
+                    before = records.get(task.name, {}).get('outputs', {})
+                    changed.extend(Path(path) for path, digest in outputs.items() if before.get(path) != digest)
+                records[task.name] = {'inputs': inputs, 'outputs': outputs}
+                done.add(task.name)
+                print(f"✅ {task.name} ({time.perf_counter() - started:.2f} s)")
+    for name in [n for n in records if n not in tasks]:
+        del records[name]
+    return ran if not failed else -len(failed)
+
+
+def build(extra: List[Path], state: dict, jobs: int, force: bool = False, dry_run: bool = False,
+          warm: bool = False, changed: Optional[List[Path]] = None) -> bool:
+    t0 = time.perf_counter()
+    tasks = build_graph(published_reports(extra), warm)
+    result = run_graph(tasks, state, jobs, force, dry_run, changed)
+    if not dry_run:
+        manifest = write_deploy_manifest(FileHashes(state['files']))
+        save_state(state)
+
+    elapsed = time.perf_counter() - t0
+    if result < 0:
+        print(f"❌ Build failed: {-result} task(s) failed or skipped ({elapsed:.2f} s)")
+        return False
+    verb = 'would run' if dry_run else 'run'
+    print(f"🎉 {len(tasks)} tasks, {result} {verb}, {len(tasks) - result} up to date ({elapsed:.2f} s)")
+    if not dry_run and (manifest['added'] or manifest['changed'] or manifest['deleted']):
+        print(f"📦 Deploy manifest: {len(manifest['added'])} added, {len(manifest['changed'])} changed, "
+              f"{len(manifest['deleted'])} deleted")
+    return True
+
+
+def watch(extra: List[Path], state: dict, poll: bool = False, serve: Optional[int] = None) -> None:
+    """Rebuild whatever a burst of saves made out of date, until interrupted."""
+    from file_watch import make_watcher
+
+    watcher = make_watcher(WATCH_DIRS, poll)
+    print(f"👀 Watching {', '.join(d.as_posix() for d in WATCH_DIRS)} ({watcher.kind}); Ctrl+C to stop")
+    server = hub = None
+    if serve is not None:
+        from preview_server import ReloadHub, make_preview_server, url_paths
+        hub = ReloadHub()
+        server = make_preview_server(DOCS_DIR, port=serve, hub=hub, quiet=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"🌐 Previewing at http://127.0.0.1:{server.server_address[1]}/")
+    from converter_daemon import SOCKET_PATH, start_background, stop_background
+    if start_background() is not None:
+        print(f"⚡ Converter daemon listening at {SOCKET_PATH.relative_to(ROOT)}")
+
+    def rebuild() -> None:
+        written: List[Path] = []
+        build(extra, state, 1, warm=True, changed=written)
+        if hub is None:
+            return
+        pages = [path for path in url_paths(DOCS_DIR, written) if not path.endswith(COMPRESSED)]
+        if pages:
+            hub.broadcast(pages)
+
+    try:
+        rebuild()
+        while True:
+            changed = watcher.wait()
+            # Let a burst of saves settle before rebuilding
+            while True:
+                more = watcher.wait(DEBOUNCE)
+                if not more:
+                    break
+                changed |= more
+            if any(path.suffix == '.py' for path in changed):
+                # Warm modules would be stale: start over with fresh imports
+                print("🔄 Build scripts changed; restarting")
+                return
+            print(f"📝 {len(changed)} file(s) changed")
+            rebuild()
+    finally:
+        watcher.close()
+        stop_background()
+        if server is not None:
+            server.server_close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Build the newsletter site')
+    parser.add_argument('reports', nargs='*', help='JSON reports to publish besides the published ones')
+    parser.add_argument('--force', action='store_true', help='run every task')
+    parser.add_argument('--dry-run', action='store_true', help='list the tasks that would run')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 4, help='parallel tasks')
+    parser.add_argument('--watch', action='store_true', help='keep rebuilding as sources change')
+    parser.add_argument('--poll', action='store_true', help='watch by polling file stats instead of inotify')
+    parser.add_argument('--serve', type=int, metavar='PORT', help='with --watch, preview docs/ with live reload')
+    parser.add_argument('--reproducible', action='store_true', help='stamp outputs with the last commit time')
+    args = parser.parse_args()
+    launch_dir = os.getcwd()
+
+    extra = []
+    for report in args.reports:
+        path = Path(report).resolve()
+        if not path.is_file() or path.parent.parent != (ROOT / DATA_DIR):
+            print(f"❌ Not a report under data/<newsletter>/: {report}")
+            return 2
+        extra.append(path.relative_to(ROOT))
+
+    os.chdir(ROOT)
+    if args.reproducible:
+        # Inherited by the converter subprocesses
+        os.environ.setdefault('SOURCE_DATE_EPOCH', source_date_epoch())
+    sys.path.insert(0, str(ROOT / CONVERTERS_DIR))
+    sys.path.insert(0, str(ROOT / SCRIPTS_DIR))
+    state = load_state()
+    if not args.watch:
+        return 0 if build(extra, state, max(1, args.jobs), args.force, args.dry_run) else 1
+
+    try:
+        watch(extra, state, args.poll, args.serve)
+    except KeyboardInterrupt:
+        print("\n✅ Watch stopped")
+        return 0
+    os.chdir(launch_dir)
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
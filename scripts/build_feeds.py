@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+RSS 2.0, Atom and JSON Feed documents for every newsletter.
+
+Every published issue (a JSON report with a page under docs/<newsletter>/issues/,
+the same issues the search index lists) becomes a feed entry: title, date,
+a summary taken from its executive_summary, and links to the issue page and
+its analytics page. The newest FEED_ENTRIES entries are written to
+docs/<newsletter>/:
+
+  feed.xml     RSS 2.0
+  atom.xml     Atom 1.0
+  feed.json    JSON Feed 1.1
+
+Entries are cached in .cache/feed_state.json with the hash of their JSON, so
+only new or edited reports are parsed again. The documents carry no build
+time (a feed is as recent as its newest entry) and are only rewritten when
+their content changes, so aggregators polling with If-Modified-Since or
+If-None-Match get 304s between issues.
+
+Links are absolute: set SITE_URL to the address the site is published at.
+
+Usage:
+  python scripts/build_feeds.py [newsletter ...]
+"""
+
+import hashlib
+import html
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'converters'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from build_search_index import clean_text, issue_page  # noqa: E402
+from issue_metadata import issue_date  # noqa: E402
+from item_archive import read_report  # noqa: E402
+from output_files import canonical_json, write_if_changed, write_outputs  # noqa: E402
+
+FORMAT_VERSION = 3
+DATA_DIR = Path('data')
+DOCS_DIR = Path('docs')
+STATE_FILE = Path('.cache') / 'feed_state.json'
+DEFAULT_SITE_URL = 'https://juansegiraldo.github.io/KeplerNewsletter/'
+FEED_ENTRIES = 20
+SUMMARY_CHARS = 600
+AUTHOR = 'Kepler Karst'
+
+# newsletter -> (title, description, language)
+FEEDS = {
+    'sovereign-debt': ('Sovereign Debt Weekly Digests | Kepler Karst',
+                       'Weekly sovereign debt analysis and insights', 'en'),
+    'art-law': ('Arte y Derecho | Kepler Karst', 'Boletín semanal de Arte y Derecho', 'es'),
+    'data-governance': ('Gobernanza de Datos Empresarial | Kepler Karst',
+                        'Boletines semanales de Gobernanza de Datos Empresarial', 'es'),
+}
+ANALYTICS_LABEL = {'en': 'Analytics dashboard', 'es': 'Dashboard de analytics'}
+
+# executive_summary fields, in order of preference: prose first, then bullet lists
+SUMMARY_TEXT = ('weekly_overview', 'overview', 'annual_overview', 'key_developments')
+SUMMARY_LISTS = ('key_findings', 'weekly_bullets', 'annual_bullets', 'bullets')
+
+
+def escape(text):
+    """XML character data (xml.sax.saxutils.escape, whose import pulls in urllib.request)."""
+    return html.escape(text, quote=False)
+
+
+def quoteattr(value):
+    """A quoted XML attribute value, as xml.sax.saxutils.quoteattr writes it."""
+    value = escape(value).replace('\n', '&#10;').replace('\r', '&#13;').replace('\t', '&#9;')
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return '"' + value.replace('"', '&quot;') + '"'
+
+
+def site_url():
+    url = os.environ.get('SITE_URL', DEFAULT_SITE_URL)
+    return url if url.endswith('/') else url + '/'
+
+
+def issue_summary(executive_summary):
+    if not isinstance(executive_summary, dict):
+        return ''
+    text = next((executive_summary[key] for key in SUMMARY_TEXT
+                 if isinstance(executive_summary.get(key), str) and executive_summary[key].strip()), None)
+    if text is None:
+        bullets = next((executive_summary[key] for key in SUMMARY_LISTS
+                        if isinstance(executive_summary.get(key), list) and executive_summary[key]), [])
+        # Bullets rarely end in a full stop; join them as sentences
+        text = ' '.join(clean_text(str(b)).rstrip('.') + '.' for b in bullets[:3])
+    # Citation markers are dropped before truncating, as on the pages
+    text = clean_text(text.replace('**', ''))
+    if len(text) > SUMMARY_CHARS:
+        text = text[:SUMMARY_CHARS].rsplit(' ', 1)[0] + '…'
+    return text
+
+
+def issue_entry(path, page):
+    """Feed entry of one issue, or None when the report carries no date."""
+    data = read_report(path)
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    # The same date the page's issue-metadata block and the landing pages carry
+    published = issue_date(data, path.stem)
+    if published is None:
+        return None
+    meta_page = page.with_name(f'{page.stem}_meta.html')
+    return {
+        'title': metadata.get('title') or metadata.get('report_title') or metadata.get('digest_title') or path.stem,
+        'date': published.isoformat(),
+        'summary': issue_summary(data.get('executive_summary')),
+        'page': f'issues/{page.name}',
+        'meta': f'issues/{meta_page.name}' if meta_page.exists() else None,
+    }
+
+
+def _timestamp(day):
+    return datetime.fromisoformat(day).replace(tzinfo=timezone.utc)
+
+
+def render_rss(newsletter, entries, base):
+    # Deferred: email.utils pulls in socket and random, ~20 ms build_index only pays for RSS
+    import email.utils
+
+    title, description, lang = FEEDS[newsletter]
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">',
+        '<channel>',
+        f'  <title>{escape(title)}</title>',
+        f'  <link>{escape(base)}</link>',
+        f'  <description>{escape(description)}</description>',
+        f'  <language>{lang}</language>',
+        f'  <atom:link href={quoteattr(base + "feed.xml")} rel="self" type="application/rss+xml"/>',
+    ]
+    if entries:
+        lines.append(f'  <lastBuildDate>{email.utils.format_datetime(_timestamp(entries[0]["date"]))}</lastBuildDate>')
+    for entry in entries:
+        url = base + entry['page']
+        body = f'<p>{escape(entry["summary"])}</p>'
+        if entry['meta']:
+            body += f'<p><a href="{escape(base + entry["meta"])}">{ANALYTICS_LABEL[lang]}</a></p>'
+        lines += [
+            '  <item>',
+            f'    <title>{escape(entry["title"])}</title>',
+            f'    <link>{escape(url)}</link>',
+            f'    <guid isPermaLink="true">{escape(url)}</guid>',
+            f'    <pubDate>{email.utils.format_datetime(_timestamp(entry["date"]))}</pubDate>',
+            f'    <description>{escape(body)}</description>',
+            '  </item>',
+        ]
+    lines += ['</channel>', '</rss>', '']
+    return '\n'.join(lines)
+
+
+def render_atom(newsletter, entries, base):
+    title, description, lang = FEEDS[newsletter]
+    updated = f'{entries[0]["date"]}T00:00:00Z' if entries else '1970-01-01T00:00:00Z'
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="{lang}">',
+        f'  <title>{escape(title)}</title>',
+        f'  <subtitle>{escape(description)}</subtitle>',
+        f'  <id>{escape(base)}</id>',
+        f'  <link href={quoteattr(base)}/>',
+        f'  <link rel="self" type="application/atom+xml" href={quoteattr(base + "atom.xml")}/>',
+        f'  <updated>{updated}</updated>',
+        f'  <author><name>{AUTHOR}</name></author>',
+    ]
+    for entry in entries:
+        url = base + entry['page']
+        stamp = f'{entry["date"]}T00:00:00Z'
+        lines += [
+            '  <entry>',
+            f'    <title>{escape(entry["title"])}</title>',
+            f'    <id>{escape(url)}</id>',
+            f'    <link href={quoteattr(url)}/>',
+        ]
+        if entry['meta']:
+            lines.append(f'    <link rel="related" type="text/html" href={quoteattr(base + entry["meta"])} '
+                         f'title={quoteattr(ANALYTICS_LABEL[lang])}/>')
+        lines += [
+            f'    <published>{stamp}</published>',
+            f'    <updated>{stamp}</updated>',
+            f'    <summary>{escape(entry["summary"])}</summary>',
+            '  </entry>',
+        ]
+    lines += ['</feed>', '']
+    return '\n'.join(lines)
+
+
+def render_json_feed(newsletter, entries, base):
+    title, description, lang = FEEDS[newsletter]
+    items = []
+    for entry in entries:
+        item = {
+            'id': base + entry['page'],
+            'url': base + entry['page'],
+            'title': entry['title'],
+            'summary': entry['summary'],
+            'content_text': entry['summary'],
+            'date_published': f'{entry["date"]}T00:00:00Z',
+        }
+        if entry['meta']:
+            # JSON Feed has no related-link field; underscore keys are its extension mechanism
+            item['_kepler'] = {'analytics_url': base + entry['meta']}
+        items.append(item)
+    return canonical_json({
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': title,
+        'description': description,
+        'home_page_url': base,
+        'feed_url': base + 'feed.json',
+        'language': lang,
+        'authors': [{'name': AUTHOR}],
+        'items': items,
+    }, indent=1) + '\n'
+
+
+def feed_links_html(newsletter):
+    """<link rel="alternate"> tags announcing a landing page's feeds."""
+    title = escape(FEEDS[newsletter][0])
+    return (f'    <link rel="alternate" type="application/rss+xml" title="{title} (RSS)" href="feed.xml">\n'
+            f'    <link rel="alternate" type="application/atom+xml" title="{title} (Atom)" href="atom.xml">\n'
+            f'    <link rel="alternate" type="application/feed+json" title="{title} (JSON Feed)" href="feed.json">\n')
+
+
+def load_state():
+    try:
+        with STATE_FILE.open('r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == FORMAT_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': FORMAT_VERSION, 'issues': {}}
+
+
+def save_state(state):
+    write_if_changed(STATE_FILE, canonical_json(state))
+
+
+def build_newsletter_feeds(newsletter, state):
+    issues = state['issues']
+    entries, parsed, present = {}, 0, set()
+    for path in sorted((DATA_DIR / newsletter).glob('*.json')):
+        page = issue_page(newsletter, path.stem)
+        if page is None:
+            continue
+        key = f'{newsletter}/{path.stem}'
+        present.add(key)
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        cached = issues.get(key)
+        if not cached or cached['hash'] != digest or (cached['entry'] or {}).get('page') != f'issues/{page.name}':
+            cached = issues[key] = {'hash': digest, 'entry': issue_entry(path, page)}
+            parsed += 1
+        entry = cached['entry']
+        # Several reports can publish to one page: the first (by file name) wins
+        if entry is not None and entry['page'] not in entries:
+            entries[entry['page']] = entry
+    for key in [k for k in issues if k.startswith(f'{newsletter}/') and k not in present]:
+        del issues[key]
+
+    # Newest first; the page breaks ties so equal dates keep one order
+    latest = sorted(entries.values(), key=lambda e: (e['date'], e['page']), reverse=True)[:FEED_ENTRIES]
+    base = f'{site_url()}{newsletter}/'
+    out_dir = DOCS_DIR / newsletter
+    written = write_outputs({
+        out_dir / 'feed.xml': render_rss(newsletter, latest, base),
+        out_dir / 'atom.xml': render_atom(newsletter, latest, base),
+        out_dir / 'feed.json': render_json_feed(newsletter, latest, base),
+    })
+    print(f"✅ Feeds for {newsletter}: {len(latest)} entries ({parsed} parsed, {len(written)} files written)")
+    return written
+
+
+def build_feeds(newsletters=tuple(FEEDS)):
+    state = load_state()
+    written = []
+    for newsletter in newsletters:
+        if (DATA_DIR / newsletter).is_dir() and (DOCS_DIR / newsletter).is_dir():
+            written += build_newsletter_feeds(newsletter, state)
+    save_state(state)
+    return written
+
+
+def main(argv):
+    newsletters = argv[1:] or list(FEEDS)
+    unknown = [n for n in newsletters if n not in FEEDS]
+    if unknown:
+        print(f"❌ Unknown newsletter: {unknown[0]} (expected one of {', '.join(FEEDS)})")
+        return 2
+    build_feeds(newsletters)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -5,14 +5,51 @@ Scans issues folders and generates/updates index.html files automatically
 """
 
 import os
+import sys
 import json
 import re
+from html import escape
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
-def extract_metadata_from_html(html_file):
-    """Extract basic metadata from HTML file"""
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'converters'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from issue_metadata import read_issue_metadata
+from item_archive import archived_issues
+from output_files import write_if_changed
+from build_feeds import build_feeds, feed_links_html, site_url
+from build_search_index import build_search_indexes, search_section_html
+
+DOCS_DIR = Path("docs")
+SITEMAP_FILE = DOCS_DIR / "sitemap.xml"
+SITEMAP_NEWSLETTERS = ('sovereign-debt', 'art-law', 'data-governance')
+# Cross-issue dashboard written by converters/trend_analytics.py; not an issue
+TRENDS_PAGE = "trends_meta.html"
+TRENDS_LABELS = {'en': 'View Trends Across Issues', 'es': 'Ver Tendencias entre Boletines'}
+
+def extract_metadata_from_html(html_file, archived=None):
+    """Extract basic metadata from HTML file
+
+    Pages carry an issue-metadata JSON-LD block (see issue_metadata.py) with
+    their title and publication date; only that block is read. Pages generated
+    before the block existed fall back to the <title> and the filename date,
+    and ``archived`` (report stems to item-archive rows) supplies the date of
+    issues whose filename carries none.
+    """
+    block = read_issue_metadata(html_file)
+    if block is not None:
+        published = block.get('datePublished')
+        sort_date = datetime.fromisoformat(published) if published else datetime.min
+        return {
+            'title': escape(block.get('name') or html_file.stem, quote=False),
+            'date': sort_date.strftime('%d-%m-%Y') if published else "Unknown",
+            'sort_date': sort_date,
+            'published': published,
+            'filename': html_file.name,
+            'path': str(html_file.relative_to(html_file.parent.parent))
+        }
     try:
         with open(html_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -28,6 +65,9 @@ def extract_metadata_from_html(html_file):
             date_str = f"{day}-{month}-{year}"
             # Create a sortable date object for proper chronological sorting
             sort_date = datetime(int(year), int(month), int(day))
+        elif archived and (archived.get(html_file.stem) or {}).get('published'):
+            sort_date = datetime.fromordinal(archived[html_file.stem]['published'])
+            date_str = sort_date.strftime('%d-%m-%Y')
         else:
             date_str = "Unknown"
             sort_date = datetime.min  # Put unknown dates at the end
@@ -36,6 +76,7 @@ def extract_metadata_from_html(html_file):
             'title': title,
             'date': date_str,
             'sort_date': sort_date,  # For proper sorting
+            'published': sort_date.date().isoformat() if sort_date != datetime.min else None,
             'filename': html_file.name,
             'path': str(html_file.relative_to(html_file.parent.parent))
         }
@@ -45,10 +86,20 @@ def extract_metadata_from_html(html_file):
             'title': html_file.stem,
             'date': 'Unknown',
             'sort_date': datetime.min,  # Put unknown dates at the end
+            'published': None,
             'filename': html_file.name,
             'path': str(html_file.relative_to(html_file.parent.parent))
         }
 
+def trends_section_html(newsletter, lang='en'):
+    """Link to the newsletter's trends dashboard; empty until the dashboard is built."""
+    if not (DOCS_DIR / newsletter / "issues" / TRENDS_PAGE).exists():
+        return ""
+    return f"""
+        <section class="trends-link" style="margin-bottom: 3rem;">
+            <a href="issues/{TRENDS_PAGE}" class="link-btn secondary-link">{TRENDS_LABELS.get(lang, TRENDS_LABELS['en'])}</a>
+        </section>"""
+
 def generate_sovereign_debt_index():
     """Generate index.html for sovereign debt newsletter"""
     issues_dir = Path("docs/sovereign-debt/issues")
@@ -59,7 +110,8 @@ def generate_sovereign_debt_index():
         return
     
     # Find all HTML files
-    html_files = list(issues_dir.glob("*.html"))
+    # Sorted, so issues with the same date keep one order on every machine
+    html_files = sorted(issues_dir.glob("*.html"))
     html_files = [f for f in html_files if not f.name.endswith('_meta.html')]  # Exclude meta files
     
     if not html_files:
@@ -68,8 +120,9 @@ def generate_sovereign_debt_index():
     
     # Extract metadata
     issues = []
+    archived = archived_issues('sovereign-debt')
     for html_file in html_files:
-        metadata = extract_metadata_from_html(html_file)
+        metadata = extract_metadata_from_html(html_file, archived)
         issues.append(metadata)
     
     # Sort by date (newest first)
@@ -317,6 +370,8 @@ def generate_sovereign_debt_index():
     </section>
 
     <main class="container">
+        {SEARCH_SECTION}
+        {TRENDS_SECTION}
         <section class="digests">
             <h2>Available Digests</h2>
             {ISSUES_CONTENT}
@@ -333,12 +388,15 @@ def generate_sovereign_debt_index():
     
     # Replace placeholder with actual content
     final_html = template.replace("{ISSUES_CONTENT}", issues_html)
+    final_html = final_html.replace("{SEARCH_SECTION}", search_section_html('en'))
+    final_html = final_html.replace("{TRENDS_SECTION}", trends_section_html('sovereign-debt', 'en'))
+    final_html = final_html.replace("</head>", feed_links_html('sovereign-debt') + "</head>", 1)
     
-    # Write the file
-    with open(index_file, 'w', encoding='utf-8') as f:
-        f.write(final_html)
-    
-    print(f"✅ Generated sovereign debt index with {len(issues)} issues")
+    # Write the file (left untouched when its content is unchanged)
+    if write_if_changed(index_file, final_html):
+        print(f"✅ Generated sovereign debt index with {len(issues)} issues")
+    else:
+        print(f"♻️  Sovereign debt index unchanged ({len(issues)} issues)")
 
 def generate_art_law_index():
     """Generate index.html for art law newsletter"""
@@ -350,7 +408,8 @@ def generate_art_law_index():
         return
     
     # Find all HTML files
-    html_files = list(issues_dir.glob("*.html"))
+    # Sorted, so issues with the same date keep one order on every machine
+    html_files = sorted(issues_dir.glob("*.html"))
     html_files = [f for f in html_files if not f.name.endswith('_meta.html')]  # Exclude meta files
     
     if not html_files:
@@ -359,8 +418,9 @@ def generate_art_law_index():
     
     # Extract metadata
     issues = []
+    archived = archived_issues('art-law')
     for html_file in html_files:
-        metadata = extract_metadata_from_html(html_file)
+        metadata = extract_metadata_from_html(html_file, archived)
         issues.append(metadata)
     
     # Sort by date (newest first)
@@ -611,6 +671,8 @@ def generate_art_law_index():
     </section>
 
     <main class="container">
+        {SEARCH_SECTION}
+        {TRENDS_SECTION}
         <section class="issues">
             <h2>Boletines Disponibles</h2>
             {ISSUES_CONTENT}
@@ -626,20 +688,64 @@ def generate_art_law_index():
     
     # Replace placeholder with actual content
     final_html = template.replace("{ISSUES_CONTENT}", issues_html)
+    final_html = final_html.replace("{SEARCH_SECTION}", search_section_html('es'))
+    final_html = final_html.replace("{TRENDS_SECTION}", trends_section_html('art-law', 'es'))
+    final_html = final_html.replace("</head>", feed_links_html('art-law') + "</head>", 1)
     
-    # Write the file
-    with open(index_file, 'w', encoding='utf-8') as f:
-        f.write(final_html)
-    
-    print(f"✅ Generated art law index with {len(issues)} issues")
+    # Write the file (left untouched when its content is unchanged)
+    if write_if_changed(index_file, final_html):
+        print(f"✅ Generated art law index with {len(issues)} issues")
+    else:
+        print(f"♻️  Art law index unchanged ({len(issues)} issues)")
+
+def build_sitemap():
+    """Write docs/sitemap.xml: the landing pages, the trends dashboards and every
+    issue and meta page.
+
+    Each page's lastmod is its publication date from the issue-metadata block;
+    a landing page and a trends dashboard take the date of the newest issue.
+    """
+    base = site_url()
+    newsletters = []
+    for newsletter in SITEMAP_NEWSLETTERS:
+        if not (DOCS_DIR / newsletter / "index.html").exists():
+            continue
+        pages = []
+        for page in sorted((DOCS_DIR / newsletter / "issues").glob("*.html")):
+            if page.name == TRENDS_PAGE:
+                continue
+            block = read_issue_metadata(page) or {}
+            pages.append((f"{newsletter}/issues/{page.name}", block.get('datePublished')))
+        newest = max((published for _, published in pages if published), default=None)
+        if (DOCS_DIR / newsletter / "issues" / TRENDS_PAGE).exists():
+            pages.insert(0, (f"{newsletter}/issues/{TRENDS_PAGE}", newest))
+        newsletters.append([(f"{newsletter}/", newest)] + pages)
+    newest = max((entries[0][1] for entries in newsletters if entries[0][1]), default=None)
+    urls = [("", newest)] + [url for entries in newsletters for url in entries]
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for path, lastmod in urls:
+        lines.append(f"  <url><loc>{escape(base + path)}</loc>"
+                     + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</url>")
+    lines += ['</urlset>', '']
+    if write_if_changed(SITEMAP_FILE, "\n".join(lines)):
+        print(f"✅ Generated sitemap with {len(urls)} URLs")
+    else:
+        print(f"♻️  Sitemap unchanged ({len(urls)} URLs)")
 
 def main():
     """Main function"""
     print("🔧 Building dynamic indexes...")
     
+    # Search shards and feeds first, so the landing pages never point at a missing file
+    build_search_indexes()
+    build_feeds()
+    
     # Generate both indexes
     generate_sovereign_debt_index()
     generate_art_law_index()
+    build_sitemap()
     
     print("✅ All indexes generated successfully!")
     print("\n📝 To automatically rebuild indexes after adding new issues:")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Static full-text search index for the newsletter landing pages.
+
+For every newsletter, the items of each published issue (headline, summary and
+tags, accent-folded so "restitucion" finds "restitución") are tokenised into an
+inverted index written under docs/<newsletter>/search/:
+
+  manifest.json      issues (title, page, item count) and version hashes of all files
+  t-<c>.json         postings of all tokens starting with character <c>:
+                     {token: [issue, item, weight, issue, item, weight, ...]}
+  d-<issue>.json     display rows of one issue's items: [headline, date, snippet]
+
+The landing pages load the manifest on first use, then only the shards of the
+typed terms and the display rows of the matching issues.
+
+Indexing is incremental per issue: each issue's segment is cached in
+.cache/search_index_state.json with the hash of its JSON, and only shards whose
+content changed are rewritten.
+
+Usage:
+  python scripts/build_search_index.py [--force] [newsletter ...]
+"""
+
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'converters'))
+
+from item_archive import read_report
+from output_files import canonical_json, write_if_changed
+
+FORMAT_VERSION = 2
+DATA_DIR = Path('data')
+DOCS_DIR = Path('docs')
+STATE_FILE = Path('.cache') / 'search_index_state.json'
+NEWSLETTERS = ('sovereign-debt', 'art-law', 'data-governance')
+
+# Field weights: a headline match outranks a tag match, which outranks the summary
+HEADLINE_WEIGHT = 3
+TAG_WEIGHT = 2
+SUMMARY_WEIGHT = 1
+SNIPPET_CHARS = 160
+
+STOPWORDS = frozenset("""
+a al and are as at be by de del el en es for from has in is it la las los of on or para
+por que se the to un una was were with y con su sus lo le les to this that its an o no
+""".split())
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+# Citation markers the converters' clean_text drops: 【39840918940346†screenshot】, †L74-L99
+_CITATION_RE = re.compile(r'【[^】]*】|†[A-Z]\d+-\d+')
+
+
+def clean_text(text):
+    """Text as the pages show it: no citation markers, whitespace collapsed."""
+    return ' '.join(_CITATION_RE.sub('', text or '').split())
+
+
+def fold(text):
+    """Lowercase and strip accents."""
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+
+
+def tokenize(text):
+    return [t for t in _TOKEN_RE.findall(fold(text or '')) if len(t) > 1 and t not in STOPWORDS]
+
+
+def shard_key(token):
+    return token[0] if token[0].isalnum() else '_'
+
+
+def item_fields(item):
+    """(headline, summary, tags) of an item in any of the newsletter schemas."""
+    headline = item.get('headline') or item.get('title') or ''
+    content = item.get('content')
+    summary = content.get('summary', '') if isinstance(content, dict) else (content or '')
+    classification = item.get('classification') if isinstance(item.get('classification'), dict) else {}
+    tags = []
+    for key in ('primary_category', 'secondary_tags', 'secondary_categories', 'instruments', 'institutions'):
+        value = classification.get(key)
+        tags.extend(value if isinstance(value, list) else [value] if value else [])
+    for key in ('categories', 'jurisdiction', 'countries'):
+        value = item.get(key)
+        tags.extend(value if isinstance(value, list) else [value] if value else [])
+    return clean_text(str(headline)), clean_text(str(summary)), [str(t) for t in tags if t]
+
+
+def issue_page(newsletter, stem):
+    """Published HTML page of a JSON report, or None if it has not been converted."""
+    issues_dir = DOCS_DIR / newsletter / 'issues'
+    page = issues_dir / f'{stem}.html'
+    if page.exists():
+        return page
+    candidates = sorted(p for p in issues_dir.glob(f'{stem}_*.html') if not p.name.endswith('_meta.html'))
+    return candidates[0] if candidates else None
+
+
+def index_issue(path, page):
+    """Segment of one issue: display rows and {token: [item, weight, ...]} postings."""
+    data = read_report(path)
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    rows, postings = [], {}
+    for pos, item in enumerate(data.get('items') or []):
+        if not isinstance(item, dict):
+            continue
+        headline, summary, tags = item_fields(item)
+        weights = {}
+        for tokens, weight in ((tokenize(headline), HEADLINE_WEIGHT),
+                               (tokenize(' '.join(tags)), TAG_WEIGHT),
+                               (tokenize(summary), SUMMARY_WEIGHT)):
+            for token in tokens:
+                weights[token] = weights.get(token, 0) + weight
+        for token, weight in weights.items():
+            postings.setdefault(token, []).extend((pos, weight))
+        snippet = summary
+        if len(snippet) > SNIPPET_CHARS:
+            snippet = snippet[:SNIPPET_CHARS].rsplit(' ', 1)[0] + '…'
+        rows.append([headline, item.get('publication_date') or item.get('date') or '', snippet])
+    return {
+        'title': metadata.get('title') or metadata.get('report_title') or metadata.get('digest_title') or path.stem,
+        'page': f'issues/{page.name}',
+        'rows': rows,
+        'postings': postings,
+    }
+
+
+def _file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _write_if_changed(path, payload):
+    return write_if_changed(path, canonical_json(payload))
+
+
+def load_state():
+    try:
+        with STATE_FILE.open('r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == FORMAT_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': FORMAT_VERSION, 'newsletters': {}}
+
+
+def save_state(state):
+    write_if_changed(STATE_FILE, canonical_json(state))
+
+
+def build_newsletter(newsletter, state, force=False):
+    """Refresh the segments of changed issues and rewrite the affected shards."""
+    out_dir = DOCS_DIR / newsletter / 'search'
+    nl_state = state['newsletters'].setdefault(newsletter, {'next_id': 1, 'issues': {}})
+    issues = nl_state['issues']
+    reindexed = 0
+    present = set()
+
+    for path in sorted((DATA_DIR / newsletter).glob('*.json')):
+        page = issue_page(newsletter, path.stem)
+        if page is None:
+            continue
+        present.add(path.stem)
+        digest = _file_hash(path)
+        cached = issues.get(path.stem)
+        if not force and cached and cached['hash'] == digest and cached['segment']['page'] == f'issues/{page.name}':
+            continue
+        # Issue ids are stable across builds, so unchanged issues keep their postings
+        issue_id = cached['id'] if cached else nl_state['next_id']
+        if not cached:
+            nl_state['next_id'] += 1
+        issues[path.stem] = {'id': issue_id, 'hash': digest, 'segment': index_issue(path, page)}
+        reindexed += 1
+
+    for stem in [s for s in issues if s not in present]:
+        del issues[stem]
+
+    shards = {}
+    for stem in sorted(issues, key=lambda s: issues[s]['id']):
+        issue_id = issues[stem]['id']
+        for token, entries in issues[stem]['segment']['postings'].items():
+            flat = shards.setdefault(shard_key(token), {}).setdefault(token, [])
+            for i in range(0, len(entries), 2):
+                flat.extend((issue_id, entries[i], entries[i + 1]))
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    shard_versions = {}
+    for key in sorted(shards):
+        payload = dict(sorted(shards[key].items()))
+        shard_versions[key] = hashlib.sha1(json.dumps(payload, separators=(',', ':')).encode('utf-8')).hexdigest()[:10]
+        written += _write_if_changed(out_dir / f't-{key}.json', payload)
+    manifest_issues = {}
+    for stem, entry in issues.items():
+        segment = entry['segment']
+        written += _write_if_changed(out_dir / f"d-{entry['id']}.json", segment['rows'])
+        manifest_issues[str(entry['id'])] = {
+            'title': segment['title'], 'page': segment['page'], 'items': len(segment['rows']), 'v': entry['hash'][:10],
+        }
+    written += _write_if_changed(out_dir / 'manifest.json', {
+        'version': FORMAT_VERSION,
+        'issues': dict(sorted(manifest_issues.items(), key=lambda kv: int(kv[0]))),
+        'shards': shard_versions,
+    })
+
+    # Drop shard and display files that no longer belong to the index
+    keep = {f't-{k}.json' for k in shards} | {f"d-{e['id']}.json" for e in issues.values()} | {'manifest.json'}
+    for stale in out_dir.glob('*.json'):
+        if stale.name not in keep:
+            stale.unlink()
+
+    items = sum(len(e['segment']['rows']) for e in issues.values())
+    print(f"✅ Search index for {newsletter}: {len(issues)} issues, {items} items "
+          f"({reindexed} reindexed, {written} files written)")
+
+
+def build_search_indexes(newsletters=NEWSLETTERS, force=False):
+    state = load_state()
+    for newsletter in newsletters:
+        if (DATA_DIR / newsletter).is_dir() and (DOCS_DIR / newsletter).is_dir():
+            build_newsletter(newsletter, state, force)
+    save_state(state)
+
+
+SEARCH_LABELS = {
+    'en': {'heading': 'Search the archive', 'placeholder': 'Search past issues…',
+           'none': 'No matching items.', 'error': 'Search is not available.', 'results': 'results'},
+    'es': {'heading': 'Buscar en el archivo', 'placeholder': 'Buscar en boletines anteriores…',
+           'none': 'No se encontraron noticias.', 'error': 'La búsqueda no está disponible.', 'results': 'resultados'},
+}
+
+
+def search_section_html(lang='en'):
+    """Search box and lazy-loading client for a landing page (search/ relative to it)."""
+    labels = SEARCH_LABELS.get(lang, SEARCH_LABELS['en'])
+    return """
+        <section class="archive-search">
+            <h2>""" + labels['heading'] + """</h2>
+            <input type="search" id="archive-search-input" placeholder=\"""" + labels['placeholder'] + """\" autocomplete="off">
+            <div id="archive-search-status" class="archive-search-status"></div>
+            <ol id="archive-search-results" class="archive-search-results"></ol>
+        </section>
+        <style>
+            .archive-search { margin-bottom: 3rem; }
+            .archive-search input { width: 100%; padding: 0.8rem 1rem; font-size: 1rem; border: 2px solid var(--e-global-color-primary); border-radius: 25px; font-family: inherit; }
+            .archive-search-status { margin: 0.75rem 0; font-size: 0.85rem; color: #666; }
+            .archive-search-results { list-style: none; }
+            .archive-search-results li { padding: 0.75rem 0; border-bottom: 1px solid #eee; }
+            .archive-search-results a { color: var(--e-global-color-primary); font-weight: 600; text-decoration: none; }
+            .archive-search-results a:hover { text-decoration: underline; }
+            .archive-search-results .hit-meta { font-size: 0.8rem; color: #666; }
+            .archive-search-results .hit-snippet { font-size: 0.9rem; margin-top: 0.25rem; }
+        </style>
+        <script>
+        (function () {
+            var LABELS = """ + json.dumps(labels, ensure_ascii=False) + """;
+            var STOP = new Set(""" + json.dumps(sorted(STOPWORDS)) + """);
+            var input = document.getElementById('archive-search-input');
+            var status = document.getElementById('archive-search-status');
+            var list = document.getElementById('archive-search-results');
+            var manifest = null, shards = {}, rows = {}, timer = null, seq = 0;
+
+            function load(name) {
+                return fetch('search/' + name).then(function (r) {
+                    if (!r.ok) throw new Error(r.status);
+                    return r.json();
+                });
+            }
+            function fold(s) {
+                return s.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+            }
+            function terms(q) {
+                return (fold(q).match(/[a-z0-9]+/g) || []).filter(function (t) { return t.length > 1 && !STOP.has(t); });
+            }
+            // A failed fetch is forgotten, so the next search retries it
+            function getManifest() {
+                return manifest || (manifest = load('manifest.json').catch(function (e) { manifest = null; throw e; }));
+            }
+            function getShard(m, key) {
+                if (!(key in m.shards)) return Promise.resolve({});
+                return shards[key] || (shards[key] = load('t-' + key + '.json?v=' + m.shards[key])
+                    .catch(function (e) { delete shards[key]; throw e; }));
+            }
+            function getRows(m, issue) {
+                return rows[issue] || (rows[issue] = load('d-' + issue + '.json?v=' + m.issues[issue].v)
+                    .catch(function (e) { delete rows[issue]; throw e; }));
+            }
+            function textFragment(headline) {
+                var words = headline.split(/\\s+/).slice(0, 8).join(' ');
+                return '#:~:text=' + encodeURIComponent(words).replace(/-/g, '%2D');
+            }
+            function escapeHtml(s) {
+                return String(s).replace(/[&<>"]/g, function (c) { return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]; });
+            }
+
+            function search(q) {
+                var words = terms(q), mine = ++seq;
+                if (!words.length) { list.innerHTML = ''; status.textContent = ''; return; }
+                getManifest().then(function (m) {
+                    return Promise.all(words.map(function (w) {
+                        var key = /[a-z0-9]/.test(w[0]) ? w[0] : '_';
+                        return getShard(m, key).then(function (shard) {
+                            // Prefix match: "restitu" finds "restitucion" and "restituye"
+                            var hits = new Map();
+                            for (var token in shard) {
+                                if (token.lastIndexOf(w, 0) !== 0) continue;
+                                var p = shard[token];
+                                for (var i = 0; i < p.length; i += 3) {
+                                    var id = p[i] + ':' + p[i + 1];
+                                    hits.set(id, (hits.get(id) || 0) + p[i + 2] * (token === w ? 2 : 1));
+                                }
+                            }
+                            return hits;
+                        });
+                    })).then(function (perTerm) {
+                        var scores = perTerm[0];
+                        perTerm.slice(1).forEach(function (hits) {
+                            scores.forEach(function (score, id) {
+                                if (hits.has(id)) scores.set(id, score + hits.get(id)); else scores.delete(id);
+                            });
+                        });
+                        var ranked = Array.from(scores.entries()).sort(function (a, b) { return b[1] - a[1]; });
+                        var top = ranked.slice(0, 25).map(function (e) { return e[0].split(':').map(Number); });
+                        var issues = Array.from(new Set(top.map(function (t) { return t[0]; })));
+                        return Promise.all(issues.map(function (i) { return getRows(m, i); })).then(function () {
+                            return Promise.all(top.map(function (t) {
+                                return getRows(m, t[0]).then(function (r) { return {issue: m.issues[t[0]], row: r[t[1]]}; });
+                            }));
+                        }).then(function (hits) { return {total: ranked.length, hits: hits}; });
+                    });
+                }).then(function (result) {
+                    if (mine !== seq) return;
+                    status.textContent = result.total ? result.total + ' ' + LABELS.results : LABELS.none;
+                    list.innerHTML = result.hits.map(function (h) {
+                        return '<li><a href="' + escapeHtml(h.issue.page) + textFragment(h.row[0]) + '">' + escapeHtml(h.row[0]) + '</a>' +
+                            '<div class="hit-meta">' + escapeHtml(h.row[1]) + ' · ' + escapeHtml(h.issue.title) + '</div>' +
+                            (h.row[2] ? '<div class="hit-snippet">' + escapeHtml(h.row[2]) + '</div>' : '') + '</li>';
+                    }).join('');
+                }).catch(function () {
+                    status.textContent = LABELS.error;
+                });
+            }
+
+            input.addEventListener('focus', function () { getManifest().catch(function () {}); }, {once: true});
+            input.addEventListener('input', function () {
+                clearTimeout(timer);
+                timer = setTimeout(function () { search(input.value); }, 120);
+            });
+        })();
+        </script>
+"""
+
+
+def main(argv):
+    force = '--force' in argv
+    newsletters = [a for a in argv[1:] if not a.startswith('--')] or NEWSLETTERS
+    unknown = [n for n in newsletters if n not in NEWSLETTERS]
+    if unknown:
+        print(f"❌ Unknown newsletter: {unknown[0]} (expected one of {', '.join(NEWSLETTERS)})")
+        return 2
+    build_search_indexes(newsletters, force)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Check that reports read through the item archive match the JSON files.
+
+Copies the sources into a temporary tree and ingests data/ into an archive
+there, then:
+
+- reads every report from several threads at once through ``read_report``
+  (each thread opens its own connection) and compares it with ``json.load``;
+- merges the Art-Law reports with ``--workers 4``, once from the JSON files
+  and once with NEWSLETTER_ARCHIVE set, and compares the two merged reports.
+
+Usage:
+  python scripts/check_archive.py
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ('scripts', 'data')
+ARCHIVE = Path('.cache') / 'newsletter_archive.sqlite'
+MERGED = Path('data') / 'art-law' / 'arte_derecho_report_2025_08_20_all_merged.json'
+THREADS = 4
+
+
+def run(tree: Path, env, *args: str) -> None:
+    result = subprocess.run([sys.executable, *args], cwd=tree, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(f"{' '.join(args)} failed: {output[-1] if output else result.returncode}")
+
+
+def threaded_reads(tree: Path) -> list:
+    """Reports whose archived copy, read from a pool thread, differs from the file."""
+    sys.path.insert(0, str(tree / 'scripts' / 'converters'))
+    from item_archive import ENV_VAR, read_report
+
+    os.environ[ENV_VAR] = str(tree / ARCHIVE)
+    paths = sorted((tree / 'data').rglob('*.json'))
+    # Every worker waits for the others, so the reads really run on different threads
+    barrier = threading.Barrier(THREADS)
+
+    def differs(path: Path) -> bool:
+        try:
+            barrier.wait(timeout=10)
+        except threading.BrokenBarrierError:
+            pass
+        with path.open('r', encoding='utf-8') as f:
+            return read_report(path) != json.load(f)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return [path.relative_to(tree) for path, bad in zip(paths, pool.map(differs, paths)) if bad]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+
+    tree = Path(tempfile.mkdtemp(prefix='kepler-archive-'))
+    try:
+        for name in SOURCES:
+            shutil.copytree(ROOT / name, tree / name, ignore=shutil.ignore_patterns('__pycache__'))
+        env = {**os.environ, 'SOURCE_DATE_EPOCH': '0'}
+        env.pop('NEWSLETTER_ARCHIVE', None)
+        run(tree, env, 'scripts/converters/item_archive.py', '--db', str(ARCHIVE), 'ingest')
+
+        mismatched = threaded_reads(tree)
+        run(tree, env, 'scripts/converters/merge_artlaw_reports.py', '--workers', str(THREADS))
+        from_files = (tree / MERGED).read_bytes()
+        run(tree, {**env, 'NEWSLETTER_ARCHIVE': str(ARCHIVE)},
+            'scripts/converters/merge_artlaw_reports.py', '--workers', str(THREADS))
+        from_archive = (tree / MERGED).read_bytes()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+    finally:
+        shutil.rmtree(tree, ignore_errors=True)
+
+    if mismatched:
+        print(f"❌ {len(mismatched)} reports differ when read from the archive:")
+        for path in mismatched:
+            print(f"   {path}")
+        return 1
+    if from_files != from_archive:
+        print("❌ The merged report differs when its sources are read from the archive")
+        return 1
+    print("✅ Archive reads match the JSON files, across threads and in the merger")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
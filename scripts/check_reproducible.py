@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Check that the site build is reproducible.
+
+Copies the sources into two temporary trees, then in each merges the Art-Law
+reports and runs a clean ``build.py --force --reproducible``: one tree with
+parallel tasks, hash seed 1 and a UTC clock, the other one task at a time,
+hash seed 2 and a UTC-5 clock. Every generated file (docs/ and the merged
+report) must hash the same in both trees.
+
+Usage:
+  python scripts/check_reproducible.py
+  python scripts/check_reproducible.py --keep
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ('scripts', 'data', 'docs', 'Headers', 'Fonts')
+OUTPUTS = ('docs', 'data/art-law')
+# (label, environment, build arguments)
+VARIANTS = (
+    ('a', {'PYTHONHASHSEED': '1', 'TZ': 'UTC'}, []),
+    ('b', {'PYTHONHASHSEED': '2', 'TZ': 'America/Bogota'}, ['--jobs', '1']),
+)
+
+
+def copy_sources(tree: Path) -> None:
+    for name in SOURCES:
+        if (ROOT / name).is_dir():
+            shutil.copytree(ROOT / name, tree / name, ignore=shutil.ignore_patterns('__pycache__', '*.gz', '*.br'))
+
+
+def run(tree: Path, env: Dict[str, str], *args: str) -> None:
+    result = subprocess.run([sys.executable, *args], cwd=tree, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(f"{' '.join(args)} failed in {tree}: {output[-1] if output else result.returncode}")
+
+
+def output_hashes(tree: Path) -> Dict[str, str]:
+    return {path.relative_to(tree).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+            for name in OUTPUTS for path in sorted((tree / name).rglob('*')) if path.is_file()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keep', action='store_true', help='keep the two build trees for inspection')
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='kepler-repro-'))
+    epoch = subprocess.run(['git', 'log', '-1', '--format=%ct'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    hashes = []
+    try:
+        for label, overrides, build_args in VARIANTS:
+            tree = workdir / label
+            copy_sources(tree)
+            env = {**os.environ, **overrides, 'SOURCE_DATE_EPOCH': epoch or '0'}
+            run(tree, env, 'scripts/converters/merge_artlaw_reports.py')
+            run(tree, env, 'scripts/build.py', '--force', '--reproducible', *build_args)
+            hashes.append(output_hashes(tree))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+    finally:
+        if args.keep:
+            print(f"📁 Build trees kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    first, second = hashes
+    differing = sorted(path for path in first.keys() | second.keys() if first.get(path) != second.get(path))
+    for path in differing:
+        print(f"❌ differs: {path}")
+    if differing:
+        print(f"❌ Build is not reproducible: {len(differing)} of {len(first)} files differ")
+        return 1
+    print(f"✅ Reproducible: {len(first)} generated files identical across both builds")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
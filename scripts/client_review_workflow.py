@@ -18,20 +18,278 @@ import sys
 import argparse
 import os
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import html
 import re
-import webbrowser
-import http.server
-import socketserver
+from urllib.parse import unquote
 import threading
 import time
+import queue
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "converters"))
+
+from review_preview import CONTENT_LISTS, PreviewHub, render_block  # noqa: E402
+from json_to_html_converter_merged import convert_json_to_html, load_json_data  # noqa: E402
+from output_files import build_time  # noqa: E402
+from converter_daemon import start_background, stop_background  # noqa: E402
+
+DEFAULT_PORT = 8080
+EDITABLE_START = "<!-- EDITABLE START -->"
+EDITABLE_END = "<!-- EDITABLE END -->"
+HEADING_RE = re.compile(r'^#.*$', re.MULTILINE)
+ANCHOR_RE = re.compile(r'^<!-- JSON: (/\S*) -->$', re.MULTILINE)
+SOURCE_RE = re.compile(r'^<!-- SOURCE: (.+) -->$', re.MULTILINE)
+SUMMARY_LISTS = ('Key Findings', 'Key Themes', 'Geographical Focus')
+FIELD_RE = re.compile(r'^(?:\*\*([A-Za-z ]+):\*\*\s?(.*)|### ([A-Za-z ]+?)\s*)$')
+PING_INTERVAL = 15.0
+
+
+def editable_spans(text: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of the body of every EDITABLE block, found in one scan"""
+    spans = []
+    pos = 0
+    while True:
+        start = text.find(EDITABLE_START, pos)
+        if start < 0:
+            break
+        body = start + len(EDITABLE_START)
+        end = text.find(EDITABLE_END, body)
+        if end < 0:
+            break
+        spans.append((body, end))
+        pos = end
+    return spans
+
+
+def block_headings(text: str) -> List[str]:
+    """Last Markdown heading before each EDITABLE block ('' when there is none)"""
+    headings = []
+    pos = 0
+    for start, end in editable_spans(text):
+        found = HEADING_RE.findall(text, pos, start - len(EDITABLE_START))
+        headings.append(found[-1] if found else '')
+        pos = end
+    return headings
+
+
+def preview_fragments(text: str) -> Dict[int, str]:
+    """Rendered preview of every block that has one, by block index"""
+    fragments = {}
+    for index, (heading, (start, end)) in enumerate(zip(block_headings(text), editable_spans(text))):
+        fragment = render_block(heading, text[start:end])
+        if fragment is not None:
+            fragments[index] = fragment
+    return fragments
+
+
+def _bullets(values: List[Any]) -> str:
+    return "\n".join(f"- {value}" for value in values)
+
+
+def _bullet_values(text: str) -> List[str]:
+    return [line[2:].strip() for line in text.split("\n") if line.startswith("- ")]
+
+
+def metadata_fields(metadata: Dict[str, Any]) -> Dict[str, str]:
+    """Draft text of each METADATA field, as _json_to_markdown writes it"""
+    period = metadata.get('period', {})
+    return {
+        'Title': str(metadata.get('title', '')),
+        'Subtitle': str(metadata.get('subtitle', '')),
+        'Period': f"{period.get('start_date', '')} to {period.get('end_date', '')}",
+    }
+
+
+def summary_fields(exec_summary: Dict[str, Any]) -> Dict[str, str]:
+    """Draft text of each EXECUTIVE SUMMARY field"""
+    return {
+        'Overview': str(exec_summary.get('overview', '')),
+        'Key Findings': _bullets(exec_summary.get('key_findings', [])),
+        'Key Themes': _bullets(exec_summary.get('key_themes', [])),
+        'Geographical Focus': _bullets(exec_summary.get('geographical_focus', [])),
+        'Trend Analysis': str(exec_summary.get('trend_analysis', '')),
+    }
+
+
+def item_fields(item: Dict[str, Any]) -> Dict[str, str]:
+    """Draft text of each field of an article block that the merged converter renders"""
+    content = item.get('content')
+    fields = {
+        'Title': str(item.get('headline') or item.get('title') or ''),
+        'Summary': str(content.get('summary', '') if isinstance(content, dict) else content or ''),
+    }
+    if isinstance(content, dict):
+        for label, key in CONTENT_LISTS.items():
+            value = content.get(key) or []
+            fields[label] = _bullets(value) if isinstance(value, list) else str(value)
+    classification = item.get('classification')
+    fields['Category'] = str(classification.get('primary_category') or '') if isinstance(classification, dict) else ''
+    fields['Jurisdiction'] = str(item.get('jurisdiction') or '')
+    return fields
+
+
+BLOCK_FIELDS = {'metadata': metadata_fields, 'executive_summary': summary_fields, 'items': item_fields}
+BLOCK_LABELS = {
+    'metadata': ('Title', 'Subtitle', 'Period'),
+    'executive_summary': ('Overview', 'Key Findings', 'Key Themes', 'Geographical Focus', 'Trend Analysis'),
+    'items': ('Title', 'Summary', *CONTENT_LISTS, 'Category', 'Jurisdiction'),
+}
+
+
+def split_fields(block: str, labels: Any) -> Dict[str, str]:
+    """Text of each ``**Label:**`` or ``### Label`` field of a block, in one pass over its lines"""
+    fields: Dict[str, List[str]] = {}
+    current = None
+    for line in block.split("\n"):
+        match = FIELD_RE.match(line)
+        label = match and (match.group(1) or match.group(3))
+        if label in labels:
+            current = fields.setdefault(label, [])
+            if match.group(2):
+                current.append(match.group(2))
+        elif current is not None:
+            current.append(line)
+    return {label: "\n".join(lines).strip() for label, lines in fields.items()}
+
+
+def resolve_anchor(data: Any, anchor: str) -> Tuple[str, Dict[str, Any]]:
+    """Section name and JSON object an anchor such as ``/items/3`` points at"""
+    node = data
+    parts = anchor.strip('/').split('/')
+    for part in parts:
+        node = node[int(part)] if isinstance(node, list) else node[part]
+    if parts[0] not in BLOCK_FIELDS or not isinstance(node, dict):
+        raise ValueError(f"Unsupported anchor: {anchor}")
+    return parts[0], node
+
+
+def _set_field(section: str, node: Dict[str, Any], label: str, text: str) -> None:
+    """Write one edited draft field back into its JSON object"""
+    if section == 'metadata':
+        if label == 'Period':
+            start, _, end = text.partition(' to ')
+            period = node.setdefault('period', {})
+            period['start_date'], period['end_date'] = start.strip(), end.strip()
+        else:
+            node[label.lower()] = text
+    elif section == 'executive_summary':
+        key = label.lower().replace(' ', '_')
+        node[key] = _bullet_values(text) if label in SUMMARY_LISTS else text
+    elif label == 'Title':
+        node['headline'] = text
+    elif label == 'Summary':
+        if isinstance(node.get('content'), dict):
+            node['content']['summary'] = text
+        else:
+            node['content'] = text
+    elif label in CONTENT_LISTS:
+        content, key = node['content'], CONTENT_LISTS[label]
+        content[key] = text if isinstance(content.get(key), str) else _bullet_values(text)
+    elif label == 'Category':
+        classification = node.setdefault('classification', {})
+        classification['primary_category'] = text
+        if 'normalized_category' in node:
+            # The converter clusters by the merger's normalised category
+            from merge_artlaw_reports import normalize_category
+            node['normalized_category'] = normalize_category(node)
+    elif label == 'Jurisdiction':
+        node['jurisdiction'] = text
+    else:
+        raise ValueError(f"Unsupported article field: {label}")
+
+
+def apply_draft(draft_content: str, data: Dict[str, Any]) -> List[str]:
+    """Apply the edited fields of an anchored draft to its original payload, in place.
+    
+    Each EDITABLE block is preceded by the JSON path it was written from
+    (``<!-- JSON: /items/3 -->``). Fields whose draft text still matches what
+    the original would produce are left untouched, so unedited values keep
+    their exact types. Returns the JSON paths of the fields that changed;
+    raises ValueError for an edit to a field the item does not carry (e.g.
+    Laws Invoked on an item whose content is plain text).
+    """
+    changed = []
+    pos = 0
+    for start, end in editable_spans(draft_content):
+        anchors = ANCHOR_RE.findall(draft_content, pos, start - len(EDITABLE_START))
+        pos = end
+        if not anchors:
+            continue
+        section, node = resolve_anchor(data, anchors[-1])
+        original = BLOCK_FIELDS[section](node)
+        for label, text in split_fields(draft_content[start:end], BLOCK_LABELS[section]).items():
+            if text != original.get(label, '').strip():
+                if label not in original:
+                    raise ValueError(f"{anchors[-1]}/{label}: the merged converter does not render this field")
+                _set_field(section, node, label, text)
+                changed.append(f"{anchors[-1]}/{label}")
+    return changed
+
+
+def text_version(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def section_versions(text: str) -> List[str]:
+    """Version of each EDITABLE block, by block index"""
+    return [text_version(text[start:end]) for start, end in editable_spans(text)]
+
+
+class SectionConflict(Exception):
+    """Sections edited by someone else since the client loaded them"""
+    def __init__(self, conflicts: List[int]):
+        super().__init__(f"Sections changed by another reviewer: {conflicts}")
+        self.conflicts = conflicts
+
+
+def apply_section_patches(text: str, patches: Dict[str, Any], version: Optional[str] = None) -> str:
+    """Replace EDITABLE blocks by index: {"3": {"base": "<version>", "text": "..."}}.
+    
+    Every patched block must still be at its ``base`` version (unless the whole
+    draft is still at ``version``), otherwise nothing is applied and
+    SectionConflict lists the stale blocks.
+    """
+    spans = editable_spans(text)
+    replacements = {}
+    for key, patch in patches.items():
+        index = int(key)
+        if not 0 <= index < len(spans) or not isinstance(patch.get('text'), str):
+            raise ValueError(f"Invalid section patch: {key}")
+        replacements[index] = patch
+    
+    if version is None or version != text_version(text):
+        conflicts = sorted(
+            index for index, patch in replacements.items()
+            if patch.get('base') != text_version(text[spans[index][0]:spans[index][1]])
+        )
+        if conflicts:
+            raise SectionConflict(conflicts)
+    
+    parts = []
+    pos = 0
+    for index in sorted(replacements):
+        start, end = spans[index]
+        parts.append(text[pos:start])
+        parts.append(replacements[index]['text'])
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
 
 
 class ClientReviewWorkflow:
-    def __init__(self):
-        self.drafts_dir = Path("drafts")
+    def __init__(self, drafts_dir: Path = Path("drafts"), quiet: bool = False):
+        self.drafts_dir = Path(drafts_dir)
         self.drafts_dir.mkdir(exist_ok=True)
+        self.review_draft: Optional[Path] = None
+        self.quiet = quiet
         
     def stage1_generate_draft(self, json_file: str) -> str:
         """Stage 1: Generate editable draft from JSON data"""
@@ -47,7 +305,7 @@ class ClientReviewWorkflow:
         draft_path = self.drafts_dir / draft_filename
         
         # Convert JSON to editable Markdown
-        markdown_content = self._json_to_markdown(data)
+        markdown_content = self._json_to_markdown(data, json_file)
         
         # Write draft file
         with open(draft_path, 'w', encoding='utf-8') as f:
@@ -58,14 +316,20 @@ class ClientReviewWorkflow:
         
         return str(draft_path)
     
-    def _json_to_markdown(self, data: Dict[str, Any]) -> str:
-        """Convert JSON data to editable Markdown format"""
+    def _json_to_markdown(self, data: Dict[str, Any], source: Optional[str] = None) -> str:
+        """Convert JSON data to editable Markdown format.
+        
+        Each EDITABLE block is preceded by an anchor with the JSON path it was
+        written from, which stage 3 uses to map edits back onto the payload.
+        """
         markdown = []
         
         # Header
         markdown.append("# CLIENT REVIEW DRAFT")
-        markdown.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        markdown.append(f"**Generated:** {build_time().strftime('%Y-%m-%d %H:%M:%S UTC')}")
         markdown.append(f"**Original Title:** {data.get('metadata', {}).get('title', 'Unknown')}")
+        if source:
+            markdown.append(f"<!-- SOURCE: {Path(source).as_posix()} -->")
         markdown.append("")
         markdown.append("---")
         markdown.append("")
@@ -82,41 +346,24 @@ class ClientReviewWorkflow:
         
         # Metadata section
         markdown.append("## METADATA")
-        markdown.append("<!-- EDITABLE START -->")
-        metadata = data.get('metadata', {})
-        markdown.append(f"**Title:** {metadata.get('title', '')}")
-        markdown.append(f"**Subtitle:** {metadata.get('subtitle', '')}")
-        markdown.append(f"**Period:** {metadata.get('period', {}).get('start_date', '')} to {metadata.get('period', {}).get('end_date', '')}")
-        markdown.append("<!-- EDITABLE END -->")
+        markdown.append("<!-- JSON: /metadata -->")
+        markdown.append(EDITABLE_START)
+        for label, text in metadata_fields(data.get('metadata', {})).items():
+            markdown.append(f"**{label}:** {text}")
+        markdown.append(EDITABLE_END)
         markdown.append("")
         
         # Executive Summary
         markdown.append("## EXECUTIVE SUMMARY")
-        markdown.append("<!-- EDITABLE START -->")
-        exec_summary = data.get('executive_summary', {})
-        
-        markdown.append("### Overview")
-        markdown.append(exec_summary.get('overview', ''))
-        markdown.append("")
-        
-        markdown.append("### Key Findings")
-        for finding in exec_summary.get('key_findings', []):
-            markdown.append(f"- {finding}")
-        markdown.append("")
-        
-        markdown.append("### Key Themes")
-        for theme in exec_summary.get('key_themes', []):
-            markdown.append(f"- {theme}")
-        markdown.append("")
-        
-        markdown.append("### Geographical Focus")
-        for location in exec_summary.get('geographical_focus', []):
-            markdown.append(f"- {location}")
-        markdown.append("")
-        
-        markdown.append("### Trend Analysis")
-        markdown.append(exec_summary.get('trend_analysis', ''))
-        markdown.append("<!-- EDITABLE END -->")
+        markdown.append("<!-- JSON: /executive_summary -->")
+        markdown.append(EDITABLE_START)
+        fields = summary_fields(data.get('executive_summary', {}))
+        for label, text in fields.items():
+            markdown.append(f"### {label}")
+            markdown.append(text)
+            if label != 'Trend Analysis':
+                markdown.append("")
+        markdown.append(EDITABLE_END)
         markdown.append("")
         
         # Items/Articles
@@ -125,47 +372,27 @@ class ClientReviewWorkflow:
         
         for i, item in enumerate(items, 1):
             markdown.append(f"### Article {i}")
-            markdown.append("<!-- EDITABLE START -->")
+            markdown.append(f"<!-- JSON: /items/{i - 1} -->")
+            markdown.append(EDITABLE_START)
             
-            # Title
-            markdown.append(f"**Title:** {item.get('title', '')}")
+            fields = item_fields(item)
+            markdown.append(f"**Title:** {fields.pop('Title')}")
             markdown.append("")
             
-            # Summary
-            markdown.append("**Summary:**")
-            markdown.append(str(item.get('summary', '')))
-            markdown.append("")
-            
-            # Content
-            markdown.append("**Content:**")
-            markdown.append(str(item.get('content', '')))
-            markdown.append("")
-            
-            # Classification
-            classification = item.get('classification', {})
-            if classification:
-                markdown.append("**Classification:**")
-                markdown.append(f"- Category: {classification.get('category', '')}")
-                markdown.append(f"- Subcategory: {classification.get('subcategory', '')}")
-                markdown.append(f"- Jurisdiction: {classification.get('jurisdiction', '')}")
+            # Summary, structured content, category and jurisdiction
+            for label, text in fields.items():
+                markdown.append(f"**{label}:**")
+                markdown.append(text)
                 markdown.append("")
             
-            # Sources
-            sources = item.get('sources', [])
-            if sources:
-                markdown.append("**Sources:**")
-                for source in sources:
-                    markdown.append(f"- {source.get('title', '')} ({source.get('url', '')})")
-                markdown.append("")
-            
-            markdown.append("<!-- EDITABLE END -->")
+            markdown.append(EDITABLE_END)
             markdown.append("")
             markdown.append("---")
             markdown.append("")
         
         return "\n".join(markdown)
     
-    def stage2_client_review(self, draft_file: str) -> str:
+    def stage2_client_review(self, draft_file: str, port: int = DEFAULT_PORT) -> str:
         """Stage 2: Launch client review interface"""
         print(f"🔧 Stage 2: Launching client review interface for {draft_file}")
         
@@ -176,15 +403,17 @@ class ClientReviewWorkflow:
         
         # Create simple web interface for editing
         self._create_web_interface(draft_path)
+        self.review_draft = draft_path.resolve()
         
         # Launch browser
         print("🌐 Opening client review interface in browser...")
         print("📝 Client can now edit the content online")
         print("💡 Press Ctrl+C to stop the server when done")
         
+        import webbrowser  # only stage 2 opens a browser; stages 1 and 3 start without it
         try:
-            webbrowser.open('http://localhost:8080')
-            self._start_web_server()
+            webbrowser.open(f'http://localhost:{port}')
+            self._start_web_server(port=port)
         except KeyboardInterrupt:
             print("\n✅ Client review session ended")
         
@@ -192,10 +421,34 @@ class ClientReviewWorkflow:
     
     def _create_web_interface(self, draft_path: Path):
         """Create a simple web interface for client editing"""
+        html_content = self._render_interface(draft_path)
+        
+        # Save HTML interface
+        interface_path = self.drafts_dir / "client_interface.html"
+        with open(interface_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        return interface_path
+    
+    def _render_interface(self, draft_path: Path) -> str:
+        """Render the editing page for one draft"""
         # Read the draft content
         with open(draft_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
+        # Versions the editor sends back with its section saves
+        draft_state = json.dumps({
+            'draft': draft_path.name,
+            'version': text_version(content),
+            'sections': section_versions(content),
+        }).replace('</', '<\\/')
+        
+        # Live preview pane, rendered with the converter's own generators
+        preview_html = ''.join(
+            f'<div class="preview-block" data-block="{index}">{fragment}</div>'
+            for index, fragment in preview_fragments(content).items()
+        )
+        
         # Create HTML interface
         html_content = f"""
 <!DOCTYPE html>
@@ -265,13 +518,35 @@ class ClientReviewWorkflow:
             background: #f8d7da;
             color: #721c24;
         }}
+        .preview {{
+            margin-top: 20px;
+            padding: 15px;
+            border: 2px dashed #ccc;
+            border-radius: 8px;
+        }}
+        .preview .item {{
+            border-bottom: 1px solid #eee;
+            padding: 10px 0;
+        }}
+        .preview .item-number {{
+            font-weight: bold;
+            color: #999;
+        }}
+        .preview .chip {{
+            display: inline-block;
+            background: #f1eea4;
+            border-radius: 12px;
+            padding: 2px 10px;
+            margin: 2px;
+            font-size: 12px;
+        }}
     </style>
 </head>
 <body>
     <div class="header">
         <h1>📝 Client Review Interface</h1>
         <p><strong>File:</strong> {draft_path.name}</p>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p><strong>Generated:</strong> {build_time().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
     </div>
     
     <div class="instructions">
@@ -285,7 +560,7 @@ class ClientReviewWorkflow:
         <p><strong>Note:</strong> Only edit content between the <!-- EDITABLE START --> and <!-- EDITABLE END --> markers</p>
     </div>
     
-    <textarea id="content" class="content-area">{content}</textarea>
+    <textarea id="content" class="content-area">{html.escape(content)}</textarea>
     
     <div class="buttons">
         <button class="btn" onclick="saveChanges()">💾 Save Changes</button>
@@ -295,22 +570,78 @@ class ClientReviewWorkflow:
     
     <div id="status"></div>
     
+    <div id="preview" class="preview">
+        <h2>👁️ Vista previa en vivo</h2>
+        {preview_html}
+    </div>
+    
     <script>
+        // Section-level saves: only the EDITABLE blocks that changed since the
+        // last save are sent, each with the version it was edited from
+        const EDITABLE_START = '<!-- EDITABLE START -->';
+        const EDITABLE_END = '<!-- EDITABLE END -->';
+        const draftState = {draft_state};
+        
+        function editableBlocks(text) {{
+            const blocks = [];
+            const headings = [];
+            let outside = '';
+            let pos = 0;
+            while (true) {{
+                const start = text.indexOf(EDITABLE_START, pos);
+                if (start < 0) break;
+                const body = start + EDITABLE_START.length;
+                const end = text.indexOf(EDITABLE_END, body);
+                if (end < 0) break;
+                const found = text.slice(pos, start).match(/^#.*$/gm);
+                headings.push(found ? found[found.length - 1] : '');
+                outside += text.slice(pos, body);
+                blocks.push(text.slice(body, end));
+                pos = end;
+            }}
+            return {{blocks: blocks, headings: headings, outside: outside + text.slice(pos)}};
+        }}
+        
+        let saved = editableBlocks(document.getElementById('content').value);
+        
         function saveChanges() {{
             const content = document.getElementById('content').value;
             const status = document.getElementById('status');
+            const current = editableBlocks(content);
+            let payload;
+            
+            if (current.blocks.length !== saved.blocks.length || current.outside !== saved.outside) {{
+                // Markers or text outside the blocks changed: save the whole draft
+                payload = {{draft: draftState.draft, version: draftState.version, content: content}};
+            }} else {{
+                const sections = {{}};
+                current.blocks.forEach((text, i) => {{
+                    if (text !== saved.blocks[i]) sections[i] = {{base: draftState.sections[i], text: text}};
+                }});
+                if (Object.keys(sections).length === 0) {{
+                    status.innerHTML = '<div class="success">✅ No changes to save</div>';
+                    return;
+                }}
+                payload = {{draft: draftState.draft, version: draftState.version, sections: sections}};
+            }}
             
             fetch('/save', {{
                 method: 'POST',
                 headers: {{
                     'Content-Type': 'application/json',
                 }},
-                body: JSON.stringify({{content: content}})
+                body: JSON.stringify(payload)
             }})
             .then(response => response.json())
             .then(data => {{
                 if (data.success) {{
+                    saved = current;
+                    draftState.version = data.version;
+                    draftState.sections = data.sections;
                     status.innerHTML = '<div class="success">✅ Changes saved successfully!</div>';
+                }} else if (data.conflicts) {{
+                    status.innerHTML = '<div class="error">❌ Another reviewer changed section(s) '
+                        + data.conflicts.map(i => i + 1).join(', ') + ' since you loaded them. Reload to merge.</div>';
                 }} else {{
                     status.innerHTML = '<div class="error">❌ Error saving changes: ' + data.error + '</div>';
                 }}
@@ -320,6 +651,54 @@ class ClientReviewWorkflow:
             }});
         }}
         
+        // Live preview: after a pause in typing only the edited blocks are
+        // sent; the server renders them and pushes the fragments back over
+        // the event stream to every reviewer of this draft
+        let previewed = saved.blocks;
+        let previewTimer = null;
+        
+        function sendPreview() {{
+            const current = editableBlocks(document.getElementById('content').value);
+            const blocks = {{}};
+            current.blocks.forEach((text, i) => {{
+                if (text !== previewed[i]) blocks[i] = {{heading: current.headings[i], text: text}};
+            }});
+            previewed = current.blocks;
+            if (Object.keys(blocks).length === 0) return;
+            fetch('/preview', {{
+                method: 'POST',
+                headers: {{
+                    'Content-Type': 'application/json',
+                }},
+                body: JSON.stringify({{draft: draftState.draft, blocks: blocks}})
+            }});
+        }}
+        
+        function showFragment(index, fragment) {{
+            const preview = document.getElementById('preview');
+            let block = preview.querySelector('[data-block="' + index + '"]');
+            if (!block) {{
+                block = document.createElement('div');
+                block.className = 'preview-block';
+                block.dataset.block = index;
+                const next = Array.from(preview.querySelectorAll('[data-block]'))
+                    .find(el => Number(el.dataset.block) > Number(index));
+                preview.insertBefore(block, next || null);
+            }}
+            block.innerHTML = fragment;
+        }}
+        
+        document.getElementById('content').addEventListener('input', () => {{
+            clearTimeout(previewTimer);
+            previewTimer = setTimeout(sendPreview, 100);
+        }});
+        
+        const events = new EventSource('/events/' + encodeURIComponent(draftState.draft));
+        events.addEventListener('fragment', event => {{
+            const blocks = JSON.parse(event.data).blocks;
+            Object.keys(blocks).forEach(index => showFragment(index, blocks[index]));
+        }});
+        
         function downloadFile() {{
             const content = document.getElementById('content').value;
             const blob = new Blob([content], {{type: 'text/markdown'}});
@@ -342,55 +721,181 @@ class ClientReviewWorkflow:
 </body>
 </html>
 """
-        
-        # Save HTML interface
-        interface_path = self.drafts_dir / "client_interface.html"
-        with open(interface_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return interface_path
+        return html_content
     
-    def _start_web_server(self):
-        """Start a simple HTTP server for the client interface"""
+    def make_review_server(self, host: str = "", port: int = DEFAULT_PORT) -> 'http.server.ThreadingHTTPServer':
+        """Build the review server: one thread per connection, HTTP/1.1 keep-alive.
+        
+        Routes:
+          GET  /                 interface of the draft under review, rendered
+                                 from the current file so reloads show saved edits
+          GET  /review/<draft>   interface of any draft in drafts/, so several
+                                 reviewers can work on different issues at once
+          POST /save             {"draft": "<name>.md", "version": "...",
+                                  "sections": {"<block index>": {"base": "...", "text": "..."}}}
+                                 patches single EDITABLE blocks (409 on a stale base);
+                                 {"draft", "version", "content"} replaces the whole draft.
+                                 Both answer with the new version and block versions.
+          POST /preview          {"draft": "<name>.md", "blocks": {"<block index>": {"heading": "...", "text": "..."}}}
+                                 renders the edited blocks and publishes the fragments
+          GET  /events/<draft>   server-sent event stream of the rendered fragments
+          GET  anything else     static files from the project root
+        """
+        import http.server  # deferred like webbrowser: the review server is the only user
+
+        root = Path(__file__).resolve().parent.parent
+        drafts_dir = self.drafts_dir.resolve()
+        locks: Dict[str, threading.Lock] = {}
+        locks_guard = threading.Lock()
+        workflow = self
+        hub = PreviewHub()
+        
+        def draft_lock(name: str) -> threading.Lock:
+            with locks_guard:
+                return locks.setdefault(name, threading.Lock())
+        
+        def resolve_draft(name: Any) -> Optional[Path]:
+            if not isinstance(name, str) or not name.endswith('.md') or Path(name).name != name:
+                return None
+            if workflow.review_draft is not None and name == workflow.review_draft.name:
+                return workflow.review_draft
+            path = drafts_dir / name
+            return path if path.is_file() else None
+        
         class RequestHandler(http.server.SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep connections open between requests
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+            
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=str(root), **kwargs)
+            
+            def log_message(self, format, *args):
+                if not workflow.quiet:
+                    super().log_message(format, *args)
+            
+            def send_body(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def send_json(self, status: int, payload: Dict[str, Any]):
+                self.send_body(status, json.dumps(payload).encode('utf-8'), 'application/json')
+            
+            def stream_events(self, name: str):
+                # An event stream has no length: it ends when the connection does
+                self.close_connection = True
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                events = hub.subscribe(name)
+                try:
+                    self.wfile.write(b'retry: 1000\n\n')
+                    while True:
+                        try:
+                            chunk = f'event: fragment\ndata: {events.get(timeout=PING_INTERVAL)}\n\n'
+                        except queue.Empty:
+                            chunk = ': ping\n\n'
+                        self.wfile.write(chunk.encode('utf-8'))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    hub.unsubscribe(name, events)
+            
             def do_GET(self):
-                if self.path == '/':
+                if self.path == '/' and workflow.review_draft is None:
                     self.path = '/drafts/client_interface.html'
+                elif self.path == '/' or self.path.startswith('/review/'):
+                    name = unquote(self.path[len('/review/'):]) if self.path != '/' else workflow.review_draft.name
+                    draft_path = resolve_draft(name)
+                    if draft_path is None:
+                        self.send_error(404, "Draft not found")
+                        return
+                    with draft_lock(draft_path.name):
+                        page = workflow._render_interface(draft_path)
+                    self.send_body(200, page.encode('utf-8'), 'text/html; charset=utf-8')
+                    return
+                elif self.path.startswith('/events/'):
+                    draft_path = resolve_draft(unquote(self.path[len('/events/'):]))
+                    if draft_path is None:
+                        self.send_error(404, "Draft not found")
+                        return
+                    self.stream_events(draft_path.name)
+                    return
                 return http.server.SimpleHTTPRequestHandler.do_GET(self)
             
             def do_POST(self):
-                if self.path == '/save':
+                if self.path not in ('/save', '/preview'):
+                    self.send_error(404)
+                    return
+                try:
                     content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
+                except (TypeError, ValueError):
+                    self.send_error(411, "Content-Length required")
+                    return
+                post_data = self.rfile.read(content_length)
+                
+                try:
                     data = json.loads(post_data.decode('utf-8'))
-                    
-                    try:
-                        # Save the updated content
-                        draft_path = self.drafts_dir / "current_draft.md"
-                        with open(draft_path, 'w', encoding='utf-8') as f:
-                            f.write(data['content'])
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({'success': True}).encode())
-                    except Exception as e:
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-        
-        # Change to project root directory
-        os.chdir(Path(__file__).parent.parent)
-        
-        with socketserver.TCPServer(("", 8080), RequestHandler) as httpd:
-            print("🌐 Server started at http://localhost:8080")
-            httpd.serve_forever()
+                    draft_path = resolve_draft(data.get('draft', workflow.review_draft and workflow.review_draft.name))
+                    if draft_path is None:
+                        self.send_json(404, {'success': False, 'error': 'Unknown draft'})
+                        return
+                    if self.path == '/preview':
+                        # Rendering needs no lock: fragments are cached by block content
+                        fragments = {}
+                        for key, block in data['blocks'].items():
+                            fragment = render_block(block['heading'], block['text'])
+                            if fragment is not None:
+                                fragments[int(key)] = fragment
+                        if fragments:
+                            hub.publish(draft_path.name, fragments)
+                        self.send_json(200, {'success': True, 'rendered': sorted(fragments)})
+                        return
+                    # Save the updated content; writers of the same draft queue
+                    # up, writers of different drafts do not block each other
+                    with draft_lock(draft_path.name):
+                        current = draft_path.read_text(encoding='utf-8')
+                        version = data.get('version')
+                        if 'sections' in data:
+                            updated = apply_section_patches(current, data['sections'], version)
+                        elif version is not None and version != text_version(current):
+                            self.send_json(409, {'success': False, 'error': 'The draft changed since it was loaded',
+                                                 'version': text_version(current)})
+                            return
+                        else:
+                            updated = data['content']
+                        if updated != current:
+                            _write_atomic(draft_path, updated)
+                    self.send_json(200, {'success': True, 'version': text_version(updated),
+                                         'sections': section_versions(updated)})
+                except SectionConflict as e:
+                    self.send_json(409, {'success': False, 'error': str(e), 'conflicts': e.conflicts,
+                                         'version': text_version(current), 'sections': section_versions(current)})
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    self.send_json(400, {'success': False, 'error': str(e)})
+                except Exception as e:
+                    self.send_json(500, {'success': False, 'error': str(e)})
+        
+        server = http.server.ThreadingHTTPServer((host, port), RequestHandler)
+        server.daemon_threads = True
+        return server
     
-    def stage3_generate_final(self, draft_file: str, output_dir: str) -> str:
+    def _start_web_server(self, host: str = "", port: int = DEFAULT_PORT):
+        """Start the HTTP server for the client interface"""
+        # The converters are already imported for the preview: let builds render with them meanwhile
+        start_background()
+        try:
+            with self.make_review_server(host, port) as httpd:
+                print(f"🌐 Server started at http://localhost:{httpd.server_address[1]}")
+                httpd.serve_forever()
+        finally:
+            stop_background()
+    
+    def stage3_generate_final(self, draft_file: str, output_dir: str, json_file: Optional[str] = None) -> str:
         """Stage 3: Generate final HTML with client changes"""
         print(f"🔧 Stage 3: Generating final HTML from {draft_file}")
         
@@ -403,71 +908,52 @@ class ClientReviewWorkflow:
         with open(draft_path, 'r', encoding='utf-8') as f:
             draft_content = f.read()
         
-        # Parse client changes and apply to original JSON
-        updated_json = self._apply_client_changes(draft_content)
-        
-        # Generate final HTML
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        # Use existing converter to generate HTML
-        from converters.json_to_html_converter_merged import convert_json_to_html
-        
-        # Save updated JSON temporarily
-        temp_json_path = self.drafts_dir / "temp_updated.json"
-        with open(temp_json_path, 'w', encoding='utf-8') as f:
-            json.dump(updated_json, f, indent=2, ensure_ascii=False)
-        
-        # Generate HTML
-        html_filename = f"{draft_path.stem.replace('_draft', '')}.html"
-        html_path = output_path / html_filename
+        # The original payload: --input, or the source recorded by stage 1
+        source = SOURCE_RE.search(draft_content)
+        json_file = json_file or (source and source.group(1))
+        if not json_file:
+            print("❌ The draft does not record its source JSON; pass it with --input")
+            return None
+        data = load_json_data(json_file)
         
-        # Call the existing converter
-        convert_json_to_html(str(temp_json_path), str(html_path))
+        # Parse client changes and apply them to the original JSON
+        try:
+            updated_json = self._apply_client_changes(draft_content, data)
+        except (KeyError, IndexError, ValueError) as e:
+            print(f"❌ The draft does not match {json_file}: {e}")
+            return None
         
-        # Clean up temp file
-        temp_json_path.unlink()
+        # Generate final HTML in-process with the merged converter
+        output_path = Path(output_dir)
+        base_name = draft_path.stem.replace('_draft', '')
+        html_path, meta_path = convert_json_to_html(updated_json, output_path, base_name)
         
         print(f"✅ Final HTML generated: {html_path}")
+        print(f"✅ Meta page generated: {meta_path}")
         return str(html_path)
     
-    def _apply_client_changes(self, draft_content: str) -> Dict[str, Any]:
-        """Parse client changes from draft and apply to original JSON structure"""
-        # This is a simplified version - in practice, you'd want more robust parsing
-        # For now, we'll extract the editable sections and reconstruct the JSON
-        
-        # Extract metadata changes
-        metadata_match = re.search(r'<!-- EDITABLE START -->(.*?)<!-- EDITABLE END -->', 
-                                 draft_content, re.DOTALL)
-        
-        # Extract executive summary changes
-        exec_summary_match = re.search(r'## EXECUTIVE SUMMARY\s*<!-- EDITABLE START -->(.*?)<!-- EDITABLE END -->', 
-                                     draft_content, re.DOTALL)
-        
-        # For now, return a basic structure - you'd implement full parsing here
-        return {
-            "metadata": {
-                "title": "Updated Title from Client",
-                "subtitle": "Updated Subtitle from Client"
-            },
-            "executive_summary": {
-                "overview": "Updated overview from client",
-                "key_findings": ["Updated finding 1", "Updated finding 2"],
-                "key_themes": ["Updated theme 1", "Updated theme 2"],
-                "geographical_focus": ["Updated location 1", "Updated location 2"],
-                "trend_analysis": "Updated trend analysis from client"
-            },
-            "items": []
-        }
+    def _apply_client_changes(self, draft_content: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse client changes from draft and apply them to the original JSON structure"""
+        if not ANCHOR_RE.search(draft_content):
+            raise ValueError("the draft has no JSON anchors; regenerate it with stage 1")
+        
+        changed = apply_draft(draft_content, data)
+        print(f"📝 {len(changed)} field(s) changed by the client")
+        for path in changed:
+            print(f"   • {path}")
+        return data
 
 
 def main():
     parser = argparse.ArgumentParser(description='Client Review Workflow for Newsletter Content')
     parser.add_argument('--stage', type=int, required=True, choices=[1, 2, 3],
                        help='Workflow stage: 1=generate draft, 2=client review, 3=generate final')
-    parser.add_argument('--input', type=str, help='Input JSON file (for stage 1)')
+    parser.add_argument('--input', type=str,
+                       help='Input JSON file (for stage 1; stage 3 defaults to the source recorded in the draft)')
     parser.add_argument('--draft', type=str, help='Draft file path (for stages 2 and 3)')
     parser.add_argument('--output', type=str, help='Output directory (for stage 3)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                       help=f'Review server port (for stage 2, default {DEFAULT_PORT})')
     
     args = parser.parse_args()
     
@@ -483,13 +969,13 @@ def main():
         if not args.draft:
             print("❌ --draft required for stage 2")
             sys.exit(1)
-        workflow.stage2_client_review(args.draft)
+        workflow.stage2_client_review(args.draft, args.port)
     
     elif args.stage == 3:
         if not args.draft or not args.output:
             print("❌ --draft and --output required for stage 3")
             sys.exit(1)
-        workflow.stage3_generate_final(args.draft, args.output)
+        workflow.stage3_generate_final(args.draft, args.output, args.input)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Warm converter daemon.
+
+Converting one report takes about 10 ms once the converter is imported, but
+a fresh interpreter spends ~20x that on start-up, imports, compiled regexes,
+HTML templates and the entity tables. The daemon imports the converters once
+and renders requests on demand, one at a time:
+
+  python scripts/converter_daemon.py serve           # Unix socket .cache/converter.sock
+  python scripts/converter_daemon.py serve --stdio   # requests on stdin, replies on stdout
+
+The protocol is JSON lines; a connection may send any number of requests:
+
+  -> {"converter": "json_to_html_converter_v2.py", "args": ["data/...json", "docs/.../issues"],
+      "cwd": "/path/to/repo", "env": {"SOURCE_DATE_EPOCH": "1755600000"}}
+  <- {"status": 0, "output": "✅ ...", "seconds": 0.011}
+  -> {"op": "status"}      <- {"status": 0, "pid": ..., "rendered": ..., "uptime": ...}
+  -> {"op": "stop"}
+
+Each request runs the converter's main() with its argv, working directory
+and forwarded environment, exactly as the command line would. Converter
+sources edited while the daemon runs are re-imported before the next request.
+
+``convert`` is the client: it renders through the daemon when one is
+listening and otherwise in-process (or returns None, for callers that prefer
+a fresh interpreter). scripts/build.py renders its pages through it, and
+``build.py --watch`` and the review server (client_review_workflow.py stage 2)
+host the daemon while they run, so command-line conversions reuse their warm
+modules:
+
+  python scripts/converter_daemon.py convert json_to_html_converter_v2.py data/sovereign-debt/05082025.json out/
+  python scripts/converter_daemon.py status
+  python scripts/converter_daemon.py stop
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+CONVERTERS_DIR = Path(__file__).resolve().parent / 'converters'
+SOCKET_PATH = ROOT / '.cache' / 'converter.sock'
+# Environment a render sees from its client; everything else is the daemon's
+FORWARDED_ENV = ('SOURCE_DATE_EPOCH', 'SITE_URL')
+CONNECT_TIMEOUT = 1.0
+
+# argv, stdout, the working directory and the environment are process-wide:
+# anything in this process that swaps them holds this lock
+PROCESS_LOCK = threading.RLock()
+
+
+def _converter_name(script: Any) -> str:
+    name = Path(str(script)).stem
+    if not (CONVERTERS_DIR / f'{name}.py').is_file():
+        raise ValueError(f'unknown converter: {script}')
+    return name
+
+
+def _source_mtimes() -> Dict[str, int]:
+    return {path.name: path.stat().st_mtime_ns for path in CONVERTERS_DIR.glob('*.py')}
+
+
+@contextlib.contextmanager
+def _environment(overrides: Dict[str, str]):
+    saved = {key: os.environ.get(key) for key in FORWARDED_ENV}
+    for key in FORWARDED_ENV:
+        if overrides.get(key) is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = overrides[key]
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class ConverterService:
+    """Converter modules kept imported, and the renders run with them."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.rendered = 0
+        self._mtimes = _source_mtimes()
+        if str(CONVERTERS_DIR) not in sys.path:
+            sys.path.insert(0, str(CONVERTERS_DIR))
+
+    def preload(self) -> List[str]:
+        """Import every converter now rather than on its first request; the ones that failed."""
+        failed = []
+        for path in sorted(CONVERTERS_DIR.glob('json_to_html_converter*.py')):
+            try:
+                importlib.import_module(path.stem)
+            except Exception:
+                failed.append(path.stem)
+        return failed
+
+    def _refresh(self) -> None:
+        """Forget the converter modules when a source changed, so the next import is fresh."""
+        mtimes = _source_mtimes()
+        if mtimes == self._mtimes:
+            return
+        self._mtimes = mtimes
+        for name, module in list(sys.modules.items()):
+            origin = getattr(module, '__file__', None)
+            if origin and Path(origin).resolve().parent == CONVERTERS_DIR:
+                del sys.modules[name]
+        importlib.invalidate_caches()
+
+    def render(self, converter: Any, args: List[str], cwd: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
+        """Run a converter's main() with ``args``; (exit status, its output)."""
+        output = io.StringIO()
+        with PROCESS_LOCK:
+            self._refresh()
+            argv, launch_dir = sys.argv, os.getcwd()
+            status = 0
+            try:
+                module = importlib.import_module(_converter_name(converter))
+                sys.argv = [f'{module.__name__}.py', *map(str, args)]
+                if cwd and cwd != launch_dir:
+                    os.chdir(cwd)
+                with _environment(env or {}), contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    module.main()
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    output.write(e.code + '\n')
+                status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                output.write(f'{type(e).__name__}: {e}\n')
+                status = 1
+            finally:
+                sys.argv = argv
+                if os.getcwd() != launch_dir:
+                    os.chdir(launch_dir)
+            self.rendered += 1
+        return status, output.getvalue()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get('op', 'convert')
+        if op == 'status':
+            return {'status': 0, 'pid': os.getpid(), 'rendered': self.rendered,
+                    'uptime': round(time.time() - self.started, 1)}
+        if op == 'stop':
+            return {'status': 0}
+        if op != 'convert':
+            return {'status': 2, 'output': f'unknown op: {op}\n'}
+        t0 = time.perf_counter()
+        status, output = self.render(request.get('converter'), request.get('args') or [],
+                                     request.get('cwd'), request.get('env'))
+        return {'status': status, 'output': output, 'seconds': round(time.perf_counter() - t0, 4)}
+
+
+class ConverterServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, service: ConverterService, socket_path: Path):
+        self.service = service
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # A socket file nobody answers on is left over from a daemon that died
+        self.socket_path.unlink(missing_ok=True)
+        super().__init__(str(self.socket_path), _RequestHandler)
+        # The daemon writes wherever a request asks: only this user may connect
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = {'op': 'invalid'}
+            self.wfile.write(json.dumps(self.server.service.handle(request), ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if request.get('op') == 'stop':
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+_local: Optional[ConverterService] = None
+_hosted: Optional[ConverterServer] = None
+
+
+def local_service() -> ConverterService:
+    """This process's converter service, shared by in-process renders and a hosted daemon."""
+    global _local
+    if _local is None:
+        _local = ConverterService()
+    return _local
+
+
+def request(payload: Dict[str, Any], socket_path: Path = SOCKET_PATH) -> Optional[Dict[str, Any]]:
+    """One request to the daemon; None when no daemon answers."""
+    if not hasattr(socket, 'AF_UNIX') or not Path(socket_path).exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(socket_path))
+            sock.settimeout(None)
+            sock.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as replies:
+                line = replies.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def convert(script: Any, *args: object, local: bool = True,
+            socket_path: Path = SOCKET_PATH) -> Optional[Tuple[int, str]]:
+    """Render with a converter: (exit status, output), through the daemon when one runs.
+
+    Without a daemon the render runs in this process, or, with ``local=False``,
+    not at all (None) so the caller can start a fresh interpreter instead.
+    """
+    args = [str(arg) for arg in args]
+    if _hosted is None:
+        reply = request({'converter': Path(str(script)).name, 'args': args, 'cwd': os.getcwd(),
+                         'env': {key: os.environ.get(key) for key in FORWARDED_ENV}}, socket_path)
+        if reply is not None:
+            return reply['status'], reply.get('output', '')
+        if not local:
+            return None
+    return local_service().render(script, args)
+
+
+def start_background(socket_path: Path = SOCKET_PATH) -> Optional[ConverterServer]:
+    """Host the daemon in this process, on a background thread, unless one already runs."""
+    global _hosted
+    if _hosted is not None or not hasattr(socket, 'AF_UNIX') or request({'op': 'status'}, socket_path):
+        return None
+    try:
+        _hosted = ConverterServer(local_service(), socket_path)
+    except OSError:
+        return None
+    threading.Thread(target=_hosted.serve_forever, daemon=True).start()
+    return _hosted
+
+
+def stop_background() -> None:
+    global _hosted
+    if _hosted is not None:
+        _hosted.shutdown()
+        _hosted.server_close()
+        _hosted = None
+
+
+def serve_stdio(service: ConverterService) -> None:
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = {'op': 'invalid'}
+        sys.stdout.write(json.dumps(service.handle(request), ensure_ascii=False) + '\n')
+        sys.stdout.flush()
+        if request.get('op') == 'stop':
+            return
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Warm converter daemon and its client')
+    parser.add_argument('--socket', default=str(SOCKET_PATH), help='daemon socket (default: .cache/converter.sock)')
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='run the daemon')
+    serve.add_argument('--stdio', action='store_true', help='read requests on stdin instead of a socket')
+    commands.add_parser('status', help='report whether a daemon is running')
+    commands.add_parser('stop', help='stop the running daemon')
+    convert_cmd = commands.add_parser('convert', help='render a report through the daemon (or in-process)')
+    convert_cmd.add_argument('converter', help='converter script, e.g. json_to_html_converter_v2.py')
+    convert_cmd.add_argument('args', nargs=argparse.REMAINDER, help="the converter's own arguments")
+    args = parser.parse_args()
+    socket_path = Path(args.socket)
+
+    if args.command == 'convert':
+        status, output = convert(args.converter, *args.args, socket_path=socket_path)
+        sys.stdout.write(output)
+        return status
+
+    if args.command in ('status', 'stop'):
+        reply = request({'op': args.command}, socket_path)
+        if reply is None:
+            print(f"💤 No converter daemon at {socket_path}")
+            return 1
+        if args.command == 'stop':
+            print("✅ Converter daemon stopped")
+        else:
+            print(f"⚡ Converter daemon pid {reply['pid']}: {reply['rendered']} renders, up {reply['uptime']} s")
+        return 0
+
+    service = ConverterService()
+    t0 = time.perf_counter()
+    failed = service.preload()
+    if args.stdio:
+        serve_stdio(service)
+        return 0
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Unix sockets are not available here; use serve --stdio")
+        return 2
+    if request({'op': 'status'}, socket_path):
+        print(f"⚡ A converter daemon is already listening at {socket_path}")
+        return 1
+    server = ConverterServer(service, socket_path)
+    for name in failed:
+        print(f"⚠️  {name} failed to import; its requests will report the error")
+    print(f"⚡ Converter daemon listening at {socket_path} (warm in {time.perf_counter() - t0:.2f} s; Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✅ Converter daemon stopped")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+The one date parser of the merger, the item archive, the columnar cache, trend
+analytics and issue metadata.
+
+Reports write dates as ``DD-MM-YYYY``, ``YYYY-MM-DD``, ``DD/MM/YYYY``,
+``YYYY/MM/DD`` and, occasionally, ``MM-DD-YYYY``. ``date_ordinal`` turns any of
+them into a proleptic Gregorian ordinal (see ``date.toordinal``), so sorting,
+clustering and range filters agree on every path. Each distinct string is
+parsed once per process.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+# Tried in order: a day-first reading wins over a month-first one
+DATE_FORMATS = ('%d-%m-%Y', '%Y-%m-%d', '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y')
+
+_DMY_RE = re.compile(r'(\d{1,2})([-/])(\d{1,2})\2(\d{4})')
+_YMD_RE = re.compile(r'(\d{4})([-/])(\d{1,2})\2(\d{1,2})')
+
+
+def parse_date(value: Any) -> datetime | None:
+    """``value`` parsed with the first of ``DATE_FORMATS`` that fits, or None."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def date_ordinal(value: Any) -> int | None:
+    """Ordinal of the date ``value`` holds (see ``parse_date``), or None; memoised per string."""
+    return _ordinal(value.strip()) if isinstance(value, str) else None
+
+
+@lru_cache(maxsize=None)
+def _ordinal(text: str) -> int | None:
+    # The common shapes are matched with a regex and built directly, with the
+    # precedence of DATE_FORMATS; anything else goes through parse_date
+    if not text:
+        return None
+    try:
+        m = _DMY_RE.fullmatch(text)
+        if m:
+            first, sep, second, year = int(m[1]), m[2], int(m[3]), int(m[4])
+            try:
+                return date(year, second, first).toordinal()
+            except ValueError:
+                if sep == '/':
+                    return None
+                # '%m-%d-%Y'
+                return date(year, first, second).toordinal()
+        m = _YMD_RE.fullmatch(text)
+        if m:
+            return date(int(m[1]), int(m[3]), int(m[4])).toordinal()
+    except ValueError:
+        return None
+    parsed = parse_date(text)
+    return parsed.toordinal() if parsed else None
+
+
+date_ordinal.cache_clear = _ordinal.cache_clear
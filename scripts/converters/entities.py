@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Canonical countries and jurisdictions shared by the merger and every converter.
+
+Items spell the same place many ways: ISO codes (``US``, ``GB``), English and
+Spanish names (``United States``, ``Estados Unidos``), abbreviations
+(``EE.UU.``, ``UK``, ``UE``), code/name pairs (``["ZM", "Zambia"]``) and free
+text (``US — Smithsonian Institution``, ``Nueva York, Estados Unidos``).
+The alias table below is folded into a dict on first use (not at import, which
+every entry point pays for), so every lookup is a single O(1) probe on an
+accent- and case-folded key.
+
+Canonical codes are ISO 3166-1 alpha-2, plus ``EU`` (European Union), ``EZ``
+(Eurozone) and ``XW`` (global / international), which are not assigned to any
+country.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+
+class Entity(NamedTuple):
+    code: str
+    name_en: str
+    name_es: str
+    region: str
+
+    def name(self, lang: str = 'en') -> str:
+        return self.name_es if lang == 'es' else self.name_en
+
+
+# code | ISO alpha-3 | English | Spanish | region | extra aliases (";"-separated)
+_TABLE = """
+AF|AFG|Afghanistan|Afganistán|Asia|
+AL|ALB|Albania|Albania|Europe|
+DZ|DZA|Algeria|Argelia|Africa|
+AD|AND|Andorra|Andorra|Europe|
+AO|AGO|Angola|Angola|Africa|
+AG|ATG|Antigua and Barbuda|Antigua y Barbuda|Latin America|
+AR|ARG|Argentina|Argentina|Latin America|
+AM|ARM|Armenia|Armenia|Asia|
+AU|AUS|Australia|Australia|Oceania|
+AT|AUT|Austria|Austria|Europe|
+AZ|AZE|Azerbaijan|Azerbaiyán|Asia|
+BS|BHS|Bahamas|Bahamas|Latin America|The Bahamas
+BH|BHR|Bahrain|Baréin|Middle East|Bahréin
+BD|BGD|Bangladesh|Bangladés|Asia|Bangladesh
+BB|BRB|Barbados|Barbados|Latin America|
+BY|BLR|Belarus|Bielorrusia|Europe|
+BE|BEL|Belgium|Bélgica|Europe|
+BZ|BLZ|Belize|Belice|Latin America|
+BJ|BEN|Benin|Benín|Africa|
+BT|BTN|Bhutan|Bután|Asia|
+BO|BOL|Bolivia|Bolivia|Latin America|
+BA|BIH|Bosnia and Herzegovina|Bosnia y Herzegovina|Europe|Bosnia-Herzegovina
+BW|BWA|Botswana|Botsuana|Africa|
+BR|BRA|Brazil|Brasil|Latin America|
+BN|BRN|Brunei|Brunéi|Asia|
+BG|BGR|Bulgaria|Bulgaria|Europe|
+BF|BFA|Burkina Faso|Burkina Faso|Africa|
+BI|BDI|Burundi|Burundi|Africa|
+CV|CPV|Cape Verde|Cabo Verde|Africa|Cabo Verde
+KH|KHM|Cambodia|Camboya|Asia|
+CM|CMR|Cameroon|Camerún|Africa|
+CA|CAN|Canada|Canadá|North America|
+CF|CAF|Central African Republic|República Centroafricana|Africa|
+TD|TCD|Chad|Chad|Africa|
+CL|CHL|Chile|Chile|Latin America|
+CN|CHN|China|China|Asia|PRC
+CO|COL|Colombia|Colombia|Latin America|
+KM|COM|Comoros|Comoras|Africa|
+CG|COG|Congo|Congo|Africa|Republic of the Congo
+CD|COD|Democratic Republic of the Congo|República Democrática del Congo|Africa|DRC;RDC
+CR|CRI|Costa Rica|Costa Rica|Latin America|
+CI|CIV|Ivory Coast|Costa de Marfil|Africa|Côte d'Ivoire
+HR|HRV|Croatia|Croacia|Europe|
+CU|CUB|Cuba|Cuba|Latin America|
+CY|CYP|Cyprus|Chipre|Europe|
+CZ|CZE|Czech Republic|República Checa|Europe|Czechia;Chequia
+DK|DNK|Denmark|Dinamarca|Europe|
+DJ|DJI|Djibouti|Yibuti|Africa|
+DM|DMA|Dominica|Dominica|Latin America|
+DO|DOM|Dominican Republic|República Dominicana|Latin America|
+TL|TLS|East Timor|Timor Oriental|Asia|Timor-Leste
+EC|ECU|Ecuador|Ecuador|Latin America|
+EG|EGY|Egypt|Egipto|Middle East|
+SV|SLV|El Salvador|El Salvador|Latin America|
+GQ|GNQ|Equatorial Guinea|Guinea Ecuatorial|Africa|
+ER|ERI|Eritrea|Eritrea|Africa|
+EE|EST|Estonia|Estonia|Europe|
+SZ|SWZ|Eswatini|Esuatini|Africa|Swaziland
+ET|ETH|Ethiopia|Etiopía|Africa|
+FJ|FJI|Fiji|Fiyi|Oceania|
+FI|FIN|Finland|Finlandia|Europe|
+FR|FRA|France|Francia|Europe|
+GA|GAB|Gabon|Gabón|Africa|
+GM|GMB|Gambia|Gambia|Africa|The Gambia
+GE|GEO|Georgia|Georgia|Asia|
+DE|DEU|Germany|Alemania|Europe|
+GH|GHA|Ghana|Ghana|Africa|
+GR|GRC|Greece|Grecia|Europe|
+GD|GRD|Grenada|Granada|Latin America|
+GT|GTM|Guatemala|Guatemala|Latin America|
+GN|GIN|Guinea|Guinea|Africa|
+GW|GNB|Guinea-Bissau|Guinea-Bisáu|Africa|
+GY|GUY|Guyana|Guyana|Latin America|
+GL|GRL|Greenland|Groenlandia|North America|
+HT|HTI|Haiti|Haití|Latin America|
+HN|HND|Honduras|Honduras|Latin America|
+HU|HUN|Hungary|Hungría|Europe|
+IS|ISL|Iceland|Islandia|Europe|
+IN|IND|India|India|Asia|
+ID|IDN|Indonesia|Indonesia|Asia|
+IR|IRN|Iran|Irán|Middle East|
+IQ|IRQ|Iraq|Irak|Middle East|
+IE|IRL|Ireland|Irlanda|Europe|
+IL|ISR|Israel|Israel|Middle East|
+IT|ITA|Italy|Italia|Europe|
+JM|JAM|Jamaica|Jamaica|Latin America|
+JP|JPN|Japan|Japón|Asia|
+JO|JOR|Jordan|Jordania|Middle East|
+KZ|KAZ|Kazakhstan|Kazajistán|Asia|
+KE|KEN|Kenya|Kenia|Africa|
+KI|KIR|Kiribati|Kiribati|Oceania|
+XK|XKX|Kosovo|Kosovo|Europe|
+KW|KWT|Kuwait|Kuwait|Middle East|
+KG|KGZ|Kyrgyzstan|Kirguistán|Asia|
+LA|LAO|Laos|Laos|Asia|
+LV|LVA|Latvia|Letonia|Europe|
+LB|LBN|Lebanon|Líbano|Middle East|
+LS|LSO|Lesotho|Lesoto|Africa|
+LR|LBR|Liberia|Liberia|Africa|
+LY|LBY|Libya|Libia|Africa|
+LI|LIE|Liechtenstein|Liechtenstein|Europe|
+LT|LTU|Lithuania|Lituania|Europe|
+LU|LUX|Luxembourg|Luxemburgo|Europe|
+MG|MDG|Madagascar|Madagascar|Africa|
+MW|MWI|Malawi|Malaui|Africa|
+MY|MYS|Malaysia|Malasia|Asia|
+MV|MDV|Maldives|Maldivas|Asia|
+ML|MLI|Mali|Malí|Africa|
+MT|MLT|Malta|Malta|Europe|
+MH|MHL|Marshall Islands|Islas Marshall|Oceania|
+MR|MRT|Mauritania|Mauritania|Africa|
+MU|MUS|Mauritius|Mauricio|Africa|
+MX|MEX|Mexico|México|Latin America|
+FM|FSM|Micronesia|Micronesia|Oceania|
+MD|MDA|Moldova|Moldavia|Europe|
+MC|MCO|Monaco|Mónaco|Europe|
+MN|MNG|Mongolia|Mongolia|Asia|
+ME|MNE|Montenegro|Montenegro|Europe|
+MA|MAR|Morocco|Marruecos|Africa|
+MZ|MOZ|Mozambique|Mozambique|Africa|
+MM|MMR|Myanmar|Myanmar|Asia|Birmania;Burma
+NA|NAM|Namibia|Namibia|Africa|
+NR|NRU|Nauru|Nauru|Oceania|
+NP|NPL|Nepal|Nepal|Asia|
+NL|NLD|Netherlands|Países Bajos|Europe|Holanda;Holland
+NC|NCL|New Caledonia|Nueva Caledonia|Oceania|
+NZ|NZL|New Zealand|Nueva Zelanda|Oceania|
+NI|NIC|Nicaragua|Nicaragua|Latin America|
+NE|NER|Niger|Níger|Africa|
+NG|NGA|Nigeria|Nigeria|Africa|
+KP|PRK|North Korea|Corea del Norte|Asia|DPRK
+MK|MKD|North Macedonia|Macedonia del Norte|Europe|
+NO|NOR|Norway|Noruega|Europe|
+OM|OMN|Oman|Omán|Middle East|
+PK|PAK|Pakistan|Pakistán|Asia|
+PW|PLW|Palau|Palaos|Oceania|
+PS|PSE|Palestine|Palestina|Middle East|
+PA|PAN|Panama|Panamá|Latin America|
+PG|PNG|Papua New Guinea|Papúa Nueva Guinea|Oceania|Papua-Nueva Guinea
+PY|PRY|Paraguay|Paraguay|Latin America|
+PE|PER|Peru|Perú|Latin America|
+PH|PHL|Philippines|Filipinas|Asia|
+PL|POL|Poland|Polonia|Europe|
+PT|PRT|Portugal|Portugal|Europe|
+PR|PRI|Puerto Rico|Puerto Rico|Latin America|
+QA|QAT|Qatar|Catar|Middle East|
+RO|ROU|Romania|Rumania|Europe|Rumanía
+RU|RUS|Russia|Rusia|Europe|Russian Federation
+RW|RWA|Rwanda|Ruanda|Africa|
+KN|KNA|Saint Kitts and Nevis|San Cristóbal y Nieves|Latin America|
+LC|LCA|Saint Lucia|Santa Lucía|Latin America|
+VC|VCT|Saint Vincent and the Grenadines|San Vicente y las Granadinas|Latin America|
+WS|WSM|Samoa|Samoa|Oceania|
+SM|SMR|San Marino|San Marino|Europe|
+ST|STP|Sao Tome and Principe|Santo Tomé y Príncipe|Africa|
+SA|SAU|Saudi Arabia|Arabia Saudita|Middle East|Arabia Saudí
+SN|SEN|Senegal|Senegal|Africa|
+RS|SRB|Serbia|Serbia|Europe|
+SC|SYC|Seychelles|Seychelles|Africa|
+SL|SLE|Sierra Leone|Sierra Leona|Africa|
+SG|SGP|Singapore|Singapur|Asia|
+SK|SVK|Slovakia|Eslovaquia|Europe|
+SI|SVN|Slovenia|Eslovenia|Europe|
+SB|SLB|Solomon Islands|Islas Salomón|Oceania|
+SO|SOM|Somalia|Somalia|Africa|
+ZA|ZAF|South Africa|Sudáfrica|Africa|
+KR|KOR|South Korea|Corea del Sur|Asia|Korea
+SS|SSD|South Sudan|Sudán del Sur|Africa|
+ES|ESP|Spain|España|Europe|
+LK|LKA|Sri Lanka|Sri Lanka|Asia|
+SD|SDN|Sudan|Sudán|Africa|
+SR|SUR|Suriname|Surinam|Latin America|
+SE|SWE|Sweden|Suecia|Europe|
+CH|CHE|Switzerland|Suiza|Europe|
+SY|SYR|Syria|Siria|Middle East|
+TW|TWN|Taiwan|Taiwán|Asia|
+TJ|TJK|Tajikistan|Tayikistán|Asia|
+TZ|TZA|Tanzania|Tanzania|Africa|
+TH|THA|Thailand|Tailandia|Asia|
+TG|TGO|Togo|Togo|Africa|
+TO|TON|Tonga|Tonga|Oceania|
+TT|TTO|Trinidad and Tobago|Trinidad y Tobago|Latin America|
+TN|TUN|Tunisia|Túnez|Africa|
+TR|TUR|Turkey|Turquía|Europe|Türkiye
+TM|TKM|Turkmenistan|Turkmenistán|Asia|
+TV|TUV|Tuvalu|Tuvalu|Oceania|
+UG|UGA|Uganda|Uganda|Africa|
+UA|UKR|Ukraine|Ucrania|Europe|
+AE|ARE|United Arab Emirates|Emiratos Árabes Unidos|Middle East|UAE;EAU
+GB|GBR|United Kingdom|Reino Unido|Europe|UK;Great Britain;Gran Bretaña;Britain
+US|USA|United States|Estados Unidos|North America|U.S.;U.S.A.;EE.UU.;EEUU;EE. UU.;United States of America;Estados Unidos de América
+UY|URY|Uruguay|Uruguay|Latin America|
+UZ|UZB|Uzbekistan|Uzbekistán|Asia|
+VU|VUT|Vanuatu|Vanuatu|Oceania|
+VA|VAT|Vatican City|Ciudad del Vaticano|Europe|Holy See;Santa Sede
+VE|VEN|Venezuela|Venezuela|Latin America|
+VN|VNM|Vietnam|Vietnam|Asia|Viet Nam
+YE|YEM|Yemen|Yemen|Middle East|
+ZM|ZMB|Zambia|Zambia|Africa|
+ZW|ZWE|Zimbabwe|Zimbabue|Africa|
+EU||European Union|Unión Europea|Europe|UE;Union Europea
+EZ||Eurozone|Eurozona|Europe|Euro area;Zona euro
+XW||Global|Global|Global|International;Internacional;Worldwide;Multilateral
+"""
+
+# Sub-national places that appear as jurisdictions, resolved to their country
+_SUBNATIONAL = {
+    'US': (
+        'New York', 'Nueva York', 'Delaware', 'California', 'Florida', 'Texas', 'Washington D.C.',
+        'District of Columbia', 'Distrito Sur Nueva York', 'Distrito Sur Florida',
+        'Southern District of New York', 'SDNY', 'Manhattan', 'Los Angeles', 'Los Ángeles',
+    ),
+    'GB': ('England', 'Inglaterra', 'Scotland', 'Escocia', 'Wales', 'Gales', 'London', 'Londres'),
+}
+
+# Code of the global / international entity, left out of country charts
+GLOBAL_CODE = 'XW'
+# Entities that are not countries: the European Union, the Eurozone and global
+NON_COUNTRY_CODES = frozenset({'EU', 'EZ', GLOBAL_CODE})
+
+# ISO codes that are also common English or Spanish words; never treated as
+# aliases, so only the upper-case code itself ("DE", "IT") resolves
+_AMBIGUOUS_ALIASES = {
+    'and', 'are', 'can', 'per',
+    'al', 'at', 'be', 'by', 'de', 'do', 'es', 'in', 'is', 'it', 'la', 'me', 'ni', 'no', 'se', 'si', 'so', 'to',
+}
+
+# Separators of composite jurisdiction strings. Each part is looked up whole
+# first, and only split on the joining words and hyphens when it is not a name
+# itself: "Guinea-Bissau / Senegal", "Trinidad and Tobago, Jamaica", "España-Italia".
+_SPLIT_RE = re.compile(r'\s+[—–-]\s+|/|,|;')
+_JOIN_RE = re.compile(r'\s+y\s+|\s+and\s+|-')
+
+
+def fold(text: str) -> str:
+    """Lookup key: accents stripped, case-folded, dots dropped, whitespace collapsed."""
+    text = unicodedata.normalize('NFKD', text.replace('\xa0', ' '))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.casefold().replace('.', '').split())
+
+
+@lru_cache(maxsize=None)
+def _tables() -> tuple[Dict[str, Entity], Dict[str, Entity]]:
+    """(code -> entity, folded alias -> entity), built once."""
+    by_code: Dict[str, Entity] = {}
+    aliases: Dict[str, Entity] = {}
+    for line in _TABLE.strip().splitlines():
+        code, iso3, name_en, name_es, region, extra = line.split('|')
+        entity = Entity(code, name_en, name_es, region)
+        by_code[code] = entity
+        for alias in (code, iso3, name_en, name_es, *extra.split(';')):
+            key = fold(alias)
+            if key and key not in _AMBIGUOUS_ALIASES:
+                aliases.setdefault(key, entity)
+    for code, places in _SUBNATIONAL.items():
+        for place in places:
+            aliases.setdefault(fold(place), by_code[code])
+    return by_code, aliases
+
+
+def __getattr__(name: str) -> Dict[str, Entity]:
+    # ENTITIES_BY_CODE and ALIASES stay importable, built on first access
+    if name == 'ENTITIES_BY_CODE':
+        return _tables()[0]
+    if name == 'ALIASES':
+        return _tables()[1]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _lookup(text: str) -> Entity | None:
+    by_code, aliases = _tables()
+    return aliases.get(fold(text)) or by_code.get(text.strip())
+
+
+def lookup(text: Any) -> Entity | None:
+    """Exact alias lookup (after folding); no splitting of composite strings."""
+    if not isinstance(text, str) or not text.strip():
+        return None
+    return _lookup(text)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_text(text: str) -> tuple[Entity, ...]:
+    entity = _lookup(text)
+    if entity:
+        return (entity,)
+    # "US — Smithsonian Institution": the jurisdiction is the head
+    head = re.split(r'\s+[—–]\s+', text, maxsplit=1)[0]
+    if head != text:
+        entity = _lookup(head)
+        if entity:
+            return (entity,)
+    # "US/MX", "Nueva York, Estados Unidos", "España-Italia"
+    found: List[Entity] = []
+    for part in _SPLIT_RE.split(head):
+        if not part.strip():
+            continue
+        entity = _lookup(part)
+        candidates = [entity] if entity else [_lookup(word) for word in _JOIN_RE.split(part) if word.strip()]
+        for entity in candidates:
+            if entity and entity not in found:
+                found.append(entity)
+    return tuple(found)
+
+
+def resolve_all(value: Any) -> List[Entity]:
+    """Every distinct entity referenced by a string, a list/pair of strings, or None."""
+    if isinstance(value, str):
+        return list(_resolve_text(value)) if value.strip() else []
+    if isinstance(value, (list, tuple)):
+        found: List[Entity] = []
+        for i, part in enumerate(value):
+            entities = resolve_all(part)
+            following = value[i + 1] if i + 1 < len(value) else None
+            if entities and _is_code(part) and isinstance(following, str) and not _is_code(following):
+                # In a [code, name] pair the name wins when the two disagree: ["GL", "Global"]
+                named = resolve_all(following)
+                if named and named[0] != entities[0]:
+                    continue
+            for entity in entities:
+                if entity not in found:
+                    found.append(entity)
+        return found
+    return []
+
+
+def _is_code(value: Any) -> bool:
+    return isinstance(value, str) and len(value.strip()) == 2 and value.strip().isupper()
+
+
+def resolve(value: Any) -> Entity | None:
+    """The first entity referenced by ``value`` (see ``resolve_all``)."""
+    found = resolve_all(value)
+    return found[0] if found else None
+
+
+def country_code(name: Any, default: str = 'XX') -> str:
+    entity = resolve(name)
+    return entity.code if entity else default
+
+
+def display_name(value: Any, lang: str = 'en') -> str:
+    """Canonical name of ``value`` in ``lang``, or the value itself when unknown."""
+    entity = resolve(value)
+    if entity:
+        return entity.name(lang)
+    if isinstance(value, (list, tuple)):
+        return str(value[-1]) if value else ''
+    return str(value)
+
+
+def item_entities(item: Dict[str, Any]) -> List[Entity]:
+    """Entities of an item from its ``countries`` list or ``jurisdiction`` string."""
+    found = resolve_all(item.get('countries'))
+    return found or resolve_all(item.get('jurisdiction'))
+
+
+def canonical_counts(counts: Iterable[tuple[Any, int]], lang: str = 'en') -> List[tuple[str, int]]:
+    """
+    Fold a distribution keyed by raw spellings into one keyed by canonical names.
+    Unresolved keys are kept verbatim. Order: count desc, then first appearance.
+    """
+    merged: Dict[str, int] = {}
+    for key, count in counts:
+        label = display_name(key, lang)
+        merged[label] = merged.get(label, 0) + count
+    return sorted(merged.items(), key=lambda kv: -kv[1])
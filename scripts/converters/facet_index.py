@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Faceted inverted index over newsletter items.
+
+Every item gets an integer document id (its position in the report's ``items``
+list). For each facet (category, jurisdiction, country, ...) the index maps a
+facet value to the sorted, de-duplicated array of document ids carrying it, so
+clusters, counts and multi-facet intersections never re-scan the items.
+
+The merger persists the index in the merged JSON under ``facet_index`` and
+records the written file's content hash under .cache/facets/. The converters
+load it with ``FacetIndex.for_payload``, which trusts it only for a file whose
+content hash is recorded (a stat and a lookup, no pass over the items) and
+otherwise builds the index in a single pass: for reports that predate it, were
+edited by hand since, or were changed in memory (e.g. by the client review
+workflow).
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from entities import item_entities
+from item_archive import content_key
+
+FORMAT_VERSION = 3
+CACHE_DIR = Path('.cache') / 'facets'
+
+Extractor = Callable[[Dict[str, Any]], Iterable[Any]]
+
+
+def _classification(item: Dict[str, Any]) -> Dict[str, Any]:
+    classification = item.get('classification')
+    return classification if isinstance(classification, dict) else {}
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _category(item: Dict[str, Any]) -> Iterable[Any]:
+    if item.get('normalized_category'):
+        return [item['normalized_category']]
+    primary = _classification(item).get('primary_category')
+    if primary:
+        return [primary]
+    return _as_list(item.get('categories')) or ['uncategorized']
+
+
+def _jurisdiction(item: Dict[str, Any]) -> Iterable[Any]:
+    return [item.get('jurisdiction') or 'Unspecified']
+
+
+def _country(item: Dict[str, Any]) -> Iterable[Any]:
+    # Canonical codes, so "US", "Estados Unidos" and ["US", "United States"] share a posting
+    return [entity.code for entity in item_entities(item)]
+
+
+def _legal_stage(item: Dict[str, Any]) -> Iterable[Any]:
+    return [item.get('legal_stage') or 'Unspecified']
+
+
+def _compliance_label(item: Dict[str, Any]) -> Iterable[Any]:
+    return _as_list(item.get('compliance_labels'))
+
+
+def _region(item: Dict[str, Any]) -> Iterable[Any]:
+    return _as_list(item.get('regions'))
+
+
+def _instrument(item: Dict[str, Any]) -> Iterable[Any]:
+    return _as_list(_classification(item).get('instruments'))
+
+
+def _institution(item: Dict[str, Any]) -> Iterable[Any]:
+    return _as_list(_classification(item).get('institutions'))
+
+
+def _tag(item: Dict[str, Any]) -> Iterable[Any]:
+    return _as_list(_classification(item).get('secondary_tags'))
+
+
+def _publication_month(item: Dict[str, Any]) -> Iterable[Any]:
+    # Uses the ordinal stored by the merger's date normalisation stage; undated items are bucketed
+    ordinal = item.get('date_ordinal')
+    if not ordinal:
+        return ['Unspecified']
+    d = date.fromordinal(ordinal)
+    return [f'{d.year:04d}-{d.month:02d}']
+
+
+DEFAULT_FACETS: Dict[str, Extractor] = {
+    'category': _category,
+    'jurisdiction': _jurisdiction,
+    'country': _country,
+    'legal_stage': _legal_stage,
+    'compliance_label': _compliance_label,
+    'region': _region,
+    'instrument': _instrument,
+    'institution': _institution,
+    'tag': _tag,
+    'publication_month': _publication_month,
+}
+
+
+class FacetIndex:
+    """(facet, value) -> sorted array of integer document ids."""
+
+    def __init__(self, doc_keys: List[str]):
+        self.doc_keys = list(doc_keys)
+        self._facets: Dict[str, Dict[str, array]] = {}
+
+    # -- building -------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        items: List[Dict[str, Any]],
+        facets: Dict[str, Extractor] | None = None,
+        key: str = 'item_id',
+    ) -> 'FacetIndex':
+        """Index ``items`` in one pass. Value order follows first appearance."""
+        facets = DEFAULT_FACETS if facets is None else facets
+        index = cls([str(it.get(key) or f'#{pos}') for pos, it in enumerate(items)])
+        for facet in facets:
+            index._facets[facet] = {}
+        for doc, item in enumerate(items):
+            for facet, extract in facets.items():
+                for value in extract(item):
+                    if value in (None, ''):
+                        continue
+                    index.add(facet, str(value), doc)
+        return index
+
+    def add(self, facet: str, value: str, doc: int) -> None:
+        """Add ``doc`` to a posting. Docs must be added in ascending order."""
+        postings = self._facets.setdefault(facet, {}).get(value)
+        if postings is None:
+            self._facets[facet][value] = array('I', [doc])
+        elif postings[-1] != doc:
+            postings.append(doc)
+
+    # -- queries --------------------------------------------------------
+
+    def facet_names(self) -> List[str]:
+        return list(self._facets)
+
+    def values(self, facet: str) -> List[str]:
+        return list(self._facets.get(facet, {}))
+
+    def postings(self, facet: str, value: str) -> array:
+        return self._facets.get(facet, {}).get(value, array('I'))
+
+    def count(self, facet: str, value: str) -> int:
+        return len(self.postings(facet, value))
+
+    def counts(self, facet: str) -> Dict[str, int]:
+        """Value -> number of documents, in first-appearance order."""
+        return {value: len(docs) for value, docs in self._facets.get(facet, {}).items()}
+
+    def most_common(self, facet: str, n: int | None = None) -> List[Tuple[str, int]]:
+        """Like ``Counter.most_common``: count desc, ties in first-appearance order."""
+        ranked = sorted(self.counts(facet).items(), key=lambda kv: -kv[1])
+        return ranked if n is None else ranked[:n]
+
+    def intersect(self, *terms: Tuple[str, str]) -> List[int]:
+        """Documents matching every (facet, value) term."""
+        if not terms:
+            return list(range(len(self.doc_keys)))
+        lists = sorted((self.postings(f, v) for f, v in terms), key=len)
+        result = list(lists[0])
+        for other in lists[1:]:
+            if not result:
+                break
+            result = [doc for doc in result if _contains(other, doc)]
+        return result
+
+    def intersect_count(self, *terms: Tuple[str, str]) -> int:
+        return len(self.intersect(*terms))
+
+    def cross_counts(self, facet: str, within: Tuple[str, str]) -> Dict[str, int]:
+        """Counts of ``facet`` values restricted to documents matching ``within``."""
+        result = {}
+        for value in self._facets.get(facet, {}):
+            n = self.intersect_count((facet, value), within)
+            if n:
+                result[value] = n
+        return result
+
+    def keys(self, docs: Iterable[int]) -> List[str]:
+        """Map document ids back to item ids."""
+        return [self.doc_keys[doc] for doc in docs]
+
+    def clusters(self, facet: str) -> Dict[str, List[str]]:
+        """Value -> item ids (the legacy ``clusters`` shape)."""
+        return {value: self.keys(docs) for value, docs in self._facets.get(facet, {}).items()}
+
+    # -- persistence ----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': FORMAT_VERSION,
+            'doc_keys': self.doc_keys,
+            'facets': {
+                facet: {value: docs.tolist() for value, docs in values.items()}
+                for facet, values in self._facets.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'FacetIndex':
+        index = cls(payload.get('doc_keys', []))
+        for facet, values in (payload.get('facets') or {}).items():
+            index._facets[facet] = {value: array('I', docs) for value, docs in values.items()}
+        return index
+
+    @classmethod
+    def for_payload(cls, data: Dict[str, Any], source: Path | str | None = None,
+                    cache_dir: Path = CACHE_DIR) -> 'FacetIndex':
+        """
+        Persisted index of a report, or one built from its items when absent or stale.
+        ``source`` is the file ``data`` was read from, unmodified; the persisted
+        index is fresh when that file's content hash was recorded by ``record``.
+        A built index equal to the persisted one records the file, so the next
+        conversion of a report merged elsewhere skips the build too.
+        """
+        persisted = data.get('facet_index')
+        if not isinstance(persisted, dict) or persisted.get('version') != FORMAT_VERSION:
+            return cls.build(data.get('items', []))
+        marker = None
+        if source is not None:
+            try:
+                marker = cache_dir / content_key(Path(source), cache_dir)
+            except OSError:
+                pass
+        if marker is not None and marker.exists():
+            return cls.from_dict(persisted)
+        index = cls.build(data.get('items', []))
+        if marker is not None and index.to_dict() == persisted:
+            _touch(marker)
+        return index
+
+    @staticmethod
+    def record(path: Path | str, cache_dir: Path = CACHE_DIR) -> None:
+        """Record that the index persisted in ``path`` matches the file's items."""
+        try:
+            _touch(cache_dir / content_key(Path(path), cache_dir))
+        except OSError:
+            pass  # the record is an optimisation only
+
+
+def _touch(marker: Path) -> None:
+    try:
+        marker.touch()
+    except OSError:
+        pass
+
+
+def _contains(sorted_docs: array, doc: int) -> bool:
+    pos = bisect_left(sorted_docs, doc)
+    return pos < len(sorted_docs) and sorted_docs[pos] == doc
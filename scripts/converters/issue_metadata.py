@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Machine-readable issue metadata embedded in every generated page.
+
+The converters put one compact JSON-LD block (schema.org PublicationIssue)
+right after the page's <title>:
+
+  <script type="application/ld+json" id="issue-metadata">{...}</script>
+
+with the issue's title, publication date, coverage period, newsletter, item
+count and languages. build_index.py reads only this block, which sits in the
+first few hundred bytes of the page, instead of scraping titles and guessing
+dates from file names; search engines read the same block.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dates import date_ordinal
+from item_archive import report_date
+
+METADATA_ID = 'issue-metadata'
+SCRIPT_OPEN = f'<script type="application/ld+json" id="{METADATA_ID}">'
+SCRIPT_CLOSE = '</script>'
+READ_CHUNK = 4096
+
+NEWSLETTER_NAMES = {
+    'sovereign-debt': 'Sovereign Debt Weekly Digests',
+    'art-law': 'Arte y Derecho',
+    'data-governance': 'Gobernanza de Datos Empresarial',
+}
+
+TITLE_RE = re.compile(r'<title>(.*?)</title>', re.S)
+# 05082025 (day, month, year) and 2025_08_20 (year, month, day) in file names
+STEM_DATES = ((re.compile(r'(\d{2})(\d{2})(\d{4})'), (3, 2, 1)), (re.compile(r'(\d{4})_(\d{2})_(\d{2})'), (1, 2, 3)))
+
+
+def issue_date(data: Dict[str, Any], stem: str) -> Optional[date]:
+    """Publication date of a report, from its metadata, else from its file name."""
+    ordinal = report_date(data)
+    if ordinal:
+        return date.fromordinal(ordinal)
+    for pattern, (y, m, d) in STEM_DATES:
+        match = pattern.search(stem)
+        if match:
+            try:
+                return date(int(match.group(y)), int(match.group(m)), int(match.group(d)))
+            except ValueError:
+                continue
+    return None
+
+
+def _coverage(metadata: Dict[str, Any]) -> Optional[str]:
+    period = metadata.get('period') or metadata.get('coverage_period')
+    if isinstance(period, dict):
+        start, end = date_ordinal(period.get('start_date')), date_ordinal(period.get('end_date'))
+        if start and end:
+            return f'{date.fromordinal(start).isoformat()}/{date.fromordinal(end).isoformat()}'
+        return None
+    return period if isinstance(period, str) and period else None
+
+
+def issue_metadata(data: Dict[str, Any], newsletter: str, stem: str, lang: str) -> Dict[str, Any]:
+    """JSON-LD description of one issue (the page title is filled in by embed_issue_metadata)."""
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    published = issue_date(data, stem)
+    languages = [lang]
+    if isinstance(metadata.get('language'), str) and metadata['language'] not in languages:
+        languages.append(metadata['language'])
+    block: Dict[str, Any] = {
+        '@context': 'https://schema.org',
+        '@type': 'PublicationIssue',
+        'name': metadata.get('title') or metadata.get('report_title') or metadata.get('digest_title') or stem,
+        'identifier': stem,
+        'isPartOf': {'@type': 'Periodical', 'name': NEWSLETTER_NAMES.get(newsletter, newsletter),
+                     'identifier': newsletter},
+        'inLanguage': languages,
+        'hasPart': {'@type': 'ItemList', 'numberOfItems': len(data.get('items') or [])},
+    }
+    if published:
+        block['datePublished'] = published.isoformat()
+    coverage = _coverage(metadata)
+    if coverage:
+        block['temporalCoverage'] = coverage
+    return block
+
+
+def embed_issue_metadata(page: str, block: Dict[str, Any]) -> str:
+    """Insert the metadata block after the page's <title>, whose text becomes the block's name."""
+    match = TITLE_RE.search(page)
+    if match is None:
+        return page
+    block = {**block, 'name': html.unescape(match.group(1).strip())}
+    # "</" cannot appear inside a script element
+    payload = json.dumps(block, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    return f'{page[:match.end()]}\n    {SCRIPT_OPEN}{payload}{SCRIPT_CLOSE}{page[match.end():]}'
+
+
+def read_issue_metadata(path: Path) -> Optional[Dict[str, Any]]:
+    """The metadata block of a generated page, reading only as far as the block (None without one)."""
+    head = ''
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(READ_CHUNK)
+            head += chunk
+            start = head.find(SCRIPT_OPEN)
+            if start >= 0:
+                end = head.find(SCRIPT_CLOSE, start)
+                if end >= 0:
+                    try:
+                        return json.loads(head[start + len(SCRIPT_OPEN):end])
+                    except ValueError:
+                        return None
+            elif '</head>' in head:
+                return None
+            if not chunk:
+                return None
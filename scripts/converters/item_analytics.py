@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Analytics recomputed from a report's items.
+
+The ``analytics`` block of a JSON report is written together with the digest
+and often disagrees with the items it describes. ``compute_analytics`` derives,
+in one pass over ``items``:
+
+  content_metrics      average_score, score_distribution, word_count_statistics
+  coverage_analysis    category, geographical (regions), jurisdiction, vendor,
+                       cloud and source tier distributions and countries_covered,
+                       for the fields the items carry
+  processing_statistics.items_published
+
+The cl digest schema writes a flat block instead (thematic_breakdown,
+geographic_distribution, ...); ``FLAT_KEYS`` maps its names onto these.
+
+Results are cached under .cache/analytics/ keyed by the file's content hash.
+``ItemAggregate`` holds the single pass and also collects the term counts the
+digest and dashboard pages chart (tags, instruments, countries, ...).
+``effective_analytics`` overlays them on the embedded block, keeping figures
+that items cannot tell (sources scanned, URLs validated, ...), and is what the
+meta pages render. ``discrepancies`` lists where the two disagree.
+
+Usage:
+  python scripts/converters/item_analytics.py data/sovereign-debt/*.json
+  python scripts/converters/item_analytics.py data/art-law/*.json --lang es --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from entities import GLOBAL_CODE, NON_COUNTRY_CODES, canonical_counts, item_entities, resolve, resolve_all
+from item_archive import content_key, item_category, item_score, read_report
+
+ANALYTICS_VERSION = 2
+CACHE_DIR = Path('.cache') / 'analytics'
+SCORE_BUCKETS = ('90-100', '80-89', '70-79', '60-69')
+LOW_BUCKET = '0-59'
+
+_CITATION_RE = re.compile(r'【[^】]*】|†[A-Z]\d+-\d+')
+
+# Flat analytics of the cl digest schema: its key -> (section, key) of compute_analytics
+FLAT_KEYS = {
+    'thematic_breakdown': ('coverage_analysis', 'category_distribution'),
+    'geographic_distribution': ('coverage_analysis', 'geographical_distribution'),
+    'source_tier_distribution': ('coverage_analysis', 'source_tier_distribution'),
+    'countries_covered': ('coverage_analysis', 'countries_covered'),
+    'average_score': ('content_metrics', 'average_score'),
+}
+
+
+def score_bucket(score: float) -> str:
+    """Decile bucket of a score; scores above 100 (annual bonuses) count as 90-100."""
+    if score >= 90:
+        return '90-100'
+    if score < 60:
+        return LOW_BUCKET
+    low = int(score) // 10 * 10
+    return f'{low}-{low + 9}'
+
+
+def _bucket_label(label: str) -> str:
+    """Normalise embedded bucket labels ('<60', '90+') to the computed ones."""
+    s = str(label).strip().replace(' ', '')
+    match = re.fullmatch(r'<=?(\d+)', s)
+    if match:
+        return LOW_BUCKET if int(match.group(1)) <= 60 else s
+    match = re.fullmatch(r'(?:>=?)?(\d+)\+?', s)
+    if match and int(match.group(1)) >= 90:
+        return '90-100'
+    return s
+
+
+def _summary_words(item: Dict[str, Any]) -> int | None:
+    content = item.get('content')
+    text = content.get('summary') if isinstance(content, dict) else content
+    if not isinstance(text, str) or not text.strip():
+        return None
+    return len(_CITATION_RE.sub(' ', text).split())
+
+
+def _jurisdictions(item: Dict[str, Any], lang: str) -> List[str]:
+    labels = [entity.name(lang) for entity in resolve_all(item.get('jurisdiction'))]
+    if not labels and isinstance(item.get('jurisdiction'), str) and item['jurisdiction'].strip():
+        labels = [item['jurisdiction'].strip()]
+    return list(dict.fromkeys(labels))
+
+
+def _regions(item: Dict[str, Any]) -> List[str]:
+    regions = item.get('regions')
+    if isinstance(regions, list):
+        return list(dict.fromkeys(str(r).strip() for r in regions if r and str(r).strip()))
+    return list(dict.fromkeys(entity.region for entity in item_entities(item)))
+
+
+def _source_tier(item: Dict[str, Any]) -> str | None:
+    source = item.get('source')
+    tier = str(source.get('tier', '')).strip() if isinstance(source, dict) else ''
+    return f'Tier {tier}' if tier.isdigit() else None
+
+
+def _strings(value: Any) -> List[str]:
+    values = value if isinstance(value, list) else [value]
+    return list(dict.fromkeys(str(v).strip() for v in values if isinstance(v, str) and v.strip()))
+
+
+def _raw_list(value: Any) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def _classification_values(item: Dict[str, Any], key: str) -> List[Any]:
+    classification = item.get('classification')
+    return _raw_list(classification.get(key)) if isinstance(classification, dict) else []
+
+
+def _primary_country(item: Dict[str, Any]) -> List[str]:
+    # Codes, names and [code, name] pairs all resolve to one canonical country
+    entity = resolve(item.get('countries', []))
+    return [] if entity is None or entity.code == GLOBAL_CODE else [entity.name_en]
+
+
+# Term counters of the dashboards: secondary tags and instruments (meta pages),
+# free-form categories and innovation elements (cl schema), and the first
+# resolved country of each item (digest country chart).
+FACETS: Dict[str, Callable[[Dict[str, Any]], Iterable[Any]]] = {
+    'secondary_tag': lambda item: _classification_values(item, 'secondary_tags'),
+    'instrument': lambda item: _classification_values(item, 'instruments'),
+    'category': lambda item: _raw_list(item.get('categories', [])),
+    'innovation': lambda item: _raw_list(item.get('innovation_elements', [])),
+    'primary_country': _primary_country,
+}
+
+
+class ItemAggregate:
+    """
+    Every count, histogram and min/max the digest and dashboard pages need,
+    accumulated in a single walk over the items.
+
+    ``most_common(facet, n)`` matches ``ItemColumns.most_common``, so the meta
+    pages take either as their source of term counts.
+    """
+
+    def __init__(self, items: Iterable[Any], lang: str = 'en'):
+        self.lang = lang
+        self.items = 0
+        self.scores: List[float] = []
+        self.words: List[int] = []
+        self.score_buckets: Counter = Counter()
+        self.facets: Dict[str, Counter] = {facet: Counter() for facet in FACETS}
+        self.distributions: Dict[str, Counter] = {
+            'category_distribution': Counter(),
+            'geographical_distribution': Counter(),
+            'jurisdiction_distribution': Counter(),
+            'vendor_distribution': Counter(),
+            'cloud_distribution': Counter(),
+            'source_tier_distribution': Counter(),
+        }
+        self.countries: set = set()
+        self.present = {'category_distribution'}
+        for item in items:
+            if isinstance(item, dict):
+                self.add(item)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.items += 1
+        score = item_score(item)
+        if score is not None:
+            self.scores.append(score)
+            self.score_buckets[score_bucket(score)] += 1
+        count = _summary_words(item)
+        if count is not None:
+            self.words.append(count)
+        for facet, extract in FACETS.items():
+            self.facets[facet].update(extract(item))
+
+        distributions = self.distributions
+        distributions['category_distribution'][item_category(item) or 'uncategorized'] += 1
+        if 'regions' in item or 'countries' in item:
+            self.present.add('geographical_distribution')
+            distributions['geographical_distribution'].update(_regions(item))
+            self.countries.update(e.code for e in item_entities(item) if e.code not in NON_COUNTRY_CODES)
+        if 'jurisdiction' in item:
+            self.present.add('jurisdiction_distribution')
+            distributions['jurisdiction_distribution'].update(_jurisdictions(item, self.lang))
+        if 'vendors' in item:
+            self.present.add('vendor_distribution')
+            distributions['vendor_distribution'].update(_strings(item['vendors']))
+        if 'cloud_environment' in item:
+            self.present.add('cloud_distribution')
+            # 'AWS|Azure' lists several environments
+            clouds = item['cloud_environment']
+            distributions['cloud_distribution'].update(_strings(clouds.split('|') if isinstance(clouds, str) else clouds))
+        tier = _source_tier(item)
+        if tier is not None:
+            self.present.add('source_tier_distribution')
+            distributions['source_tier_distribution'][tier] += 1
+
+    def most_common(self, facet: str, n: int | None = None) -> List[Tuple[Any, int]]:
+        return self.facets[facet].most_common(n)
+
+    def analytics(self) -> Dict[str, Any]:
+        """The ``analytics`` block the items support (see ``compute_analytics``)."""
+        content_metrics: Dict[str, Any] = {}
+        if self.scores:
+            content_metrics['average_score'] = round(sum(self.scores) / len(self.scores), 1)
+            distribution = {label: self.score_buckets.get(label, 0) for label in SCORE_BUCKETS}
+            if self.score_buckets.get(LOW_BUCKET):
+                distribution[LOW_BUCKET] = self.score_buckets[LOW_BUCKET]
+            content_metrics['score_distribution'] = distribution
+        if self.words:
+            content_metrics['word_count_statistics'] = {
+                'average_words': round(sum(self.words) / len(self.words)),
+                'min_words': min(self.words),
+                'max_words': max(self.words),
+            }
+        coverage_analysis = {
+            name: dict(counter.most_common())
+            for name, counter in self.distributions.items()
+            if name in self.present and counter
+        }
+        if 'geographical_distribution' in self.present:
+            coverage_analysis['countries_covered'] = len(self.countries)
+        return {
+            'processing_statistics': {'items_published': self.items},
+            'content_metrics': content_metrics,
+            'coverage_analysis': coverage_analysis,
+        }
+
+
+def compute_analytics(items: List[Dict[str, Any]], lang: str = 'en') -> Dict[str, Any]:
+    """Distributions, averages, word counts and score buckets of ``items`` in one pass."""
+    return ItemAggregate(items, lang).analytics()
+
+
+def cached_analytics(path: Path | str, data: Dict[str, Any] | None = None, lang: str = 'en',
+                     cache_dir: Path = CACHE_DIR, aggregate: ItemAggregate | None = None) -> Dict[str, Any]:
+    """
+    ``compute_analytics`` of a report file, cached by the file's content hash.
+    On a cache miss ``aggregate`` (an ItemAggregate of the same items and lang,
+    which the caller also renders from) is reused instead of walking the items again.
+    """
+    path = Path(path)
+    try:
+        cache_file = cache_dir / f'{content_key(path, cache_dir)}-{lang}.json'
+    except OSError:
+        cache_file = None
+    if cache_file is not None and cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == ANALYTICS_VERSION:
+                return cached['analytics']
+        except (OSError, ValueError, KeyError):
+            pass
+    if aggregate is not None:
+        analytics = aggregate.analytics()
+    else:
+        if data is None:
+            data = read_report(path)
+        analytics = compute_analytics(data.get('items') or [], lang)
+    if cache_file is not None:
+        tmp = cache_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': ANALYTICS_VERSION, 'analytics': analytics}, f, ensure_ascii=False)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # the cache is an optimisation only
+    return analytics
+
+
+def flat_analytics(computed: Dict[str, Any]) -> Dict[str, Any]:
+    """The figures of ``computed`` under the cl schema's flat key names."""
+    flat = {}
+    for name, (section, key) in FLAT_KEYS.items():
+        value = (computed.get(section) or {}).get(key)
+        if value is not None:
+            flat[name] = copy.deepcopy(value)
+    return flat
+
+
+def effective_analytics(embedded: Any, computed: Dict[str, Any], flat: bool = False) -> Dict[str, Any]:
+    """
+    Embedded analytics with every figure derivable from the items replaced by the computed one.
+    With ``flat``, the embedded block uses the cl schema's key names (``FLAT_KEYS``).
+    """
+    merged = copy.deepcopy(embedded) if isinstance(embedded, dict) else {}
+    if flat:
+        merged.update(flat_analytics(computed))
+        return merged
+    for section, values in computed.items():
+        target = merged.get(section)
+        if not isinstance(target, dict):
+            target = merged[section] = {}
+        target.update(copy.deepcopy(values))
+    return merged
+
+
+def _comparable(section: str, key: str, value: Any, lang: str) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if key == 'score_distribution':
+        folded: Dict[str, Any] = {}
+        for label, count in value.items():
+            folded[_bucket_label(label)] = folded.get(_bucket_label(label), 0) + (count or 0)
+        return folded
+    if key == 'jurisdiction_distribution':
+        return dict(canonical_counts(value.items(), lang=lang))
+    return value
+
+
+def discrepancies(embedded: Any, computed: Dict[str, Any], lang: str = 'en', flat: bool = False) -> List[Dict[str, Any]]:
+    """Figures where the embedded analytics disagree with the items (missing counts read as 0)."""
+    embedded = embedded if isinstance(embedded, dict) else {}
+    if flat:
+        sectioned: Dict[str, Dict[str, Any]] = {}
+        for name, (section, key) in FLAT_KEYS.items():
+            if name in embedded:
+                sectioned.setdefault(section, {})[key] = embedded[name]
+        embedded = sectioned
+    found = []
+    for section, values in computed.items():
+        stated_section = embedded.get(section) if isinstance(embedded.get(section), dict) else {}
+        for key, value in values.items():
+            if key not in stated_section:
+                continue
+            stated = _comparable(section, key, stated_section[key], lang)
+            if isinstance(value, dict) and isinstance(stated, dict):
+                for term in dict.fromkeys([*value, *stated]):
+                    if (stated.get(term) or 0) != (value.get(term) or 0):
+                        found.append({'field': f'{section}.{key}.{term}',
+                                      'embedded': stated.get(term, 0), 'computed': value.get(term, 0)})
+            elif isinstance(value, (int, float)) and isinstance(stated, (int, float)):
+                if abs(float(stated) - float(value)) > 0.05:
+                    found.append({'field': f'{section}.{key}', 'embedded': stated, 'computed': value})
+            elif stated != value:
+                found.append({'field': f'{section}.{key}', 'embedded': stated, 'computed': value})
+    return found
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Recompute report analytics from items and list discrepancies')
+    parser.add_argument('files', nargs='+', help='JSON reports')
+    parser.add_argument('--lang', default='en', choices=('en', 'es'), help='language of jurisdiction labels')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = {}
+    for name in args.files:
+        data = read_report(name)
+        computed = cached_analytics(name, data, args.lang)
+        # thematic_breakdown only appears in the cl schema's flat block
+        flat = 'thematic_breakdown' in (data.get('analytics') or {})
+        report[name] = discrepancies(data.get('analytics'), computed, args.lang, flat)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    for name, found in report.items():
+        print(f'{name}: {len(found)} discrepanc{"y" if len(found) == 1 else "ies"}')
+        for entry in found:
+            print(f"  {entry['field']}: embedded {entry['embedded']!r}, items {entry['computed']!r}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+SQLite archive of every newsletter issue under data/.
+
+Each JSON report is ingested once into normalised tables: files, items (kept and
+discarded), sources, countries, tags, instruments and institutions. Files are
+keyed by content hash, so re-running the ingestion only touches files that
+changed. Queries over the whole archive (by country, tag, instrument,
+institution, source, newsletter or date range) then run against indexes
+instead of re-opening every JSON file.
+
+Usage:
+  python scripts/converters/item_archive.py ingest [files...]
+  python scripts/converters/item_archive.py stats
+  python scripts/converters/item_archive.py query --country AR --since 01-08-2025
+  python scripts/converters/item_archive.py query --tag "IMF program" --newsletter sovereign-debt --json
+
+The database defaults to .cache/newsletter_archive.sqlite (override with --db
+or the NEWSLETTER_ARCHIVE environment variable). When NEWSLETTER_ARCHIVE is
+set, the converters, the merger and the index builder read reports through
+``read_report`` / ``archived_issues``, which serve up-to-date files from the
+archive and fall back to the JSON file otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from dates import date_ordinal
+from entities import item_entities, resolve
+
+DEFAULT_DB = Path('.cache') / 'newsletter_archive.sqlite'
+DATA_DIR = Path('data')
+ENV_VAR = 'NEWSLETTER_ARCHIVE'
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    newsletter TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    title TEXT,
+    published INTEGER,
+    period_start INTEGER,
+    period_end INTEGER,
+    item_count INTEGER NOT NULL,
+    discarded_count INTEGER NOT NULL,
+    metadata TEXT,
+    analytics TEXT,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    discarded INTEGER NOT NULL,
+    item_id TEXT,
+    rank INTEGER,
+    headline TEXT,
+    publication_date TEXT,
+    date_ordinal INTEGER,
+    category TEXT,
+    score REAL,
+    jurisdiction TEXT,
+    url TEXT,
+    source_id INTEGER REFERENCES sources(id),
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS countries (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tags (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS instruments (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS institutions (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS item_countries (
+    item INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    code TEXT NOT NULL REFERENCES countries(code),
+    PRIMARY KEY (code, item)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_tags (
+    item INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    tag INTEGER NOT NULL REFERENCES tags(id),
+    PRIMARY KEY (tag, item)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_instruments (
+    item INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    instrument INTEGER NOT NULL REFERENCES instruments(id),
+    PRIMARY KEY (instrument, item)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_institutions (
+    item INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    institution INTEGER NOT NULL REFERENCES institutions(id),
+    PRIMARY KEY (institution, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_file ON items(file_id, discarded, position);
+CREATE INDEX IF NOT EXISTS items_date ON items(date_ordinal);
+CREATE INDEX IF NOT EXISTS items_item_id ON items(item_id);
+CREATE INDEX IF NOT EXISTS items_source ON items(source_id);
+CREATE INDEX IF NOT EXISTS item_countries_item ON item_countries(item);
+CREATE INDEX IF NOT EXISTS item_tags_item ON item_tags(item);
+CREATE INDEX IF NOT EXISTS item_instruments_item ON item_instruments(item);
+CREATE INDEX IF NOT EXISTS item_institutions_item ON item_institutions(item);
+"""
+
+# Junction table, lookup table and column for each multi-valued facet
+_LOOKUPS = {
+    'tag': ('item_tags', 'tags', 'tag'),
+    'instrument': ('item_instruments', 'instruments', 'instrument'),
+    'institution': ('item_institutions', 'institutions', 'institution'),
+}
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def archive_key(path: Path) -> str:
+    return Path(path).resolve().as_posix()
+
+
+def content_key(path: Path, cache_dir: Path) -> str:
+    """Short hash of the file's bytes, memoised by (size, mtime) in ``cache_dir``/index.json."""
+    index_path = cache_dir / 'index.json'
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    st = path.stat()
+    key = archive_key(path)
+    entry = index.get(key)
+    if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+        return entry[2]
+    digest = file_sha256(path)[:24]
+    index[key] = [st.st_size, st.st_mtime_ns, digest]
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Several converters may refresh the index at once (parallel builds)
+    tmp = index_path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp, index_path)
+    return digest
+
+
+# -- item field extraction ----------------------------------------------------
+
+def _classification(item: Dict[str, Any]) -> Dict[str, Any]:
+    classification = item.get('classification')
+    return classification if isinstance(classification, dict) else {}
+
+
+def report_date(data: Dict[str, Any]) -> int | None:
+    """Date ordinal of a report: its generation date, else the end of its coverage period."""
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    processing = metadata.get('processing') if isinstance(metadata.get('processing'), dict) else {}
+    period = metadata.get('period') if isinstance(metadata.get('period'), dict) else {}
+    generated = processing.get('generated_at')
+    # The coverage period comes last: annual reports end it in the future
+    for value in (generated[:10] if isinstance(generated, str) else None,
+                  metadata.get('generation_date'), metadata.get('publication_date'), period.get('end_date')):
+        ordinal = date_ordinal(value)
+        if ordinal:
+            return ordinal
+    return None
+
+
+def _source(item: Dict[str, Any]) -> Tuple[str | None, str | None]:
+    source = item.get('source')
+    if isinstance(source, dict):
+        return source.get('name'), source.get('original_url') or source.get('url')
+    return (source if isinstance(source, str) else None), item.get('url')
+
+
+def item_category(item: Dict[str, Any]) -> str | None:
+    """Primary category of an item in any of the newsletter schemas."""
+    primary = _classification(item).get('primary_category')
+    if primary:
+        return primary
+    categories = _as_list(item.get('categories'))
+    return categories[0] if categories else item.get('normalized_category')
+
+
+def item_score(item: Dict[str, Any]) -> float | None:
+    """Total score of a kept item, or the ``score`` of a discarded one."""
+    scoring = item.get('scoring')
+    value = scoring.get('total_score') if isinstance(scoring, dict) else item.get('score')
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def item_facets(item: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Tags, instruments and institutions of an item."""
+    classification = _classification(item)
+    tags = _as_list(classification.get('secondary_tags')) + _as_list(classification.get('secondary_categories'))
+    if not classification:
+        tags += _as_list(item.get('categories'))
+    return {
+        'tag': tags,
+        'instrument': _as_list(classification.get('instruments')) + _as_list(classification.get('legal_instruments')),
+        'institution': _as_list(classification.get('institutions')),
+    }
+
+
+# -- archive ------------------------------------------------------------------
+
+class Archive:
+    """Connection to the archive database; creates the schema on first use."""
+
+    def __init__(self, path: Path | str = DEFAULT_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f'{self.path} has archive schema {version}, expected {SCHEMA_VERSION}; delete it and re-ingest')
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._lookup_cache: Dict[Tuple[str, str], int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'Archive':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- ingestion ----------------------------------------------------------
+
+    def ingest(self, paths: Iterable[Path], prune: bool = False) -> Dict[str, int]:
+        """
+        Ingest JSON reports. Unchanged files (same hash) are skipped; changed ones
+        are replaced. With ``prune``, archived files no longer on disk are dropped.
+        """
+        stats = {'added': 0, 'updated': 0, 'unchanged': 0, 'pruned': 0}
+        seen = set()
+        for path in paths:
+            path = Path(path)
+            key = archive_key(path)
+            seen.add(key)
+            st = path.stat()
+            row = self.conn.execute('SELECT id, sha256, size, mtime_ns FROM files WHERE path = ?', (key,)).fetchone()
+            if row and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns:
+                stats['unchanged'] += 1
+                continue
+            sha = file_sha256(path)
+            if row and row['sha256'] == sha:
+                # Touched but not modified: refresh the stat fingerprint only
+                self.conn.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?', (st.st_size, st.st_mtime_ns, row['id']))
+                self.conn.commit()
+                stats['unchanged'] += 1
+                continue
+            with path.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self.conn:
+                if row:
+                    self.conn.execute('DELETE FROM files WHERE id = ?', (row['id'],))
+                self._insert_file(key, path, sha, st, data)
+            stats['updated' if row else 'added'] += 1
+        if prune:
+            for row in self.conn.execute('SELECT id, path FROM files').fetchall():
+                if row['path'] not in seen and not Path(row['path']).exists():
+                    with self.conn:
+                        self.conn.execute('DELETE FROM files WHERE id = ?', (row['id'],))
+                    stats['pruned'] += 1
+        return stats
+
+    def _insert_file(self, key: str, path: Path, sha: str, st: os.stat_result, data: Dict[str, Any]) -> None:
+        metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+        period = metadata.get('period') if isinstance(metadata.get('period'), dict) else {}
+        items = data.get('items') or []
+        discarded = data.get('discarded_items') or []
+        # The document keeps its key order; item lists are rebuilt from the items table
+        document = {k: (None if k in ('items', 'discarded_items') else v) for k, v in data.items()}
+        cur = self.conn.execute(
+            'INSERT INTO files (path, newsletter, sha256, size, mtime_ns, title, published, period_start,'
+            ' period_end, item_count, discarded_count, metadata, analytics, document)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                key, path.resolve().parent.name, sha, st.st_size, st.st_mtime_ns,
+                metadata.get('title') or metadata.get('report_title') or metadata.get('digest_title'),
+                report_date(data), date_ordinal(period.get('start_date')),
+                date_ordinal(period.get('end_date') or metadata.get('publication_date')),
+                len(items), len(discarded),
+                _dumps(metadata), _dumps(data.get('analytics')), _dumps(document),
+            ),
+        )
+        file_id = cur.lastrowid
+        for is_discarded, group in ((0, items), (1, discarded)):
+            for position, item in enumerate(group):
+                if isinstance(item, dict):
+                    self._insert_item(file_id, position, is_discarded, item)
+
+    def _lookup_id(self, table: str, name: str) -> int:
+        cache_key = (table, name)
+        if cache_key not in self._lookup_cache:
+            self.conn.execute(f'INSERT OR IGNORE INTO {table} (name) VALUES (?)', (name,))
+            row = self.conn.execute(f'SELECT id FROM {table} WHERE name = ?', (name,)).fetchone()
+            self._lookup_cache[cache_key] = row[0]
+        return self._lookup_cache[cache_key]
+
+    def _insert_item(self, file_id: int, position: int, discarded: int, item: Dict[str, Any]) -> None:
+        source_name, url = _source(item)
+        publication_date = item.get('publication_date') or item.get('date')
+        cur = self.conn.execute(
+            'INSERT INTO items (file_id, position, discarded, item_id, rank, headline, publication_date,'
+            ' date_ordinal, category, score, jurisdiction, url, source_id, payload)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                file_id, position, discarded, item.get('item_id'),
+                item.get('rank') if isinstance(item.get('rank'), int) else None,
+                item.get('headline') or item.get('title'), publication_date, date_ordinal(publication_date),
+                item_category(item), item_score(item), item.get('jurisdiction'), url,
+                self._lookup_id('sources', source_name) if source_name else None,
+                _dumps(item),
+            ),
+        )
+        row_id = cur.lastrowid
+        for entity in item_entities(item):
+            self.conn.execute('INSERT OR IGNORE INTO countries (code, name) VALUES (?, ?)', (entity.code, entity.name_en))
+            self.conn.execute('INSERT OR IGNORE INTO item_countries (item, code) VALUES (?, ?)', (row_id, entity.code))
+        for facet, values in item_facets(item).items():
+            junction, table, column = _LOOKUPS[facet]
+            for value in values:
+                if isinstance(value, str) and value.strip():
+                    self.conn.execute(
+                        f'INSERT OR IGNORE INTO {junction} (item, {column}) VALUES (?, ?)',
+                        (row_id, self._lookup_id(table, value.strip())),
+                    )
+
+    # -- reading ------------------------------------------------------------
+
+    def fresh_file_id(self, path: Path) -> int | None:
+        """Archive id of ``path`` if the archived copy matches the file on disk."""
+        row = self.conn.execute('SELECT id, size, mtime_ns FROM files WHERE path = ?', (archive_key(path),)).fetchone()
+        if row is None:
+            return None
+        st = Path(path).stat()
+        return row['id'] if (row['size'], row['mtime_ns']) == (st.st_size, st.st_mtime_ns) else None
+
+    def load_report(self, path: Path) -> Dict[str, Any] | None:
+        """The report as ``json.load`` would return it, or None when not archived/stale."""
+        file_id = self.fresh_file_id(path)
+        if file_id is None:
+            return None
+        document = json.loads(self.conn.execute('SELECT document FROM files WHERE id = ?', (file_id,)).fetchone()[0])
+        groups: Dict[int, List[Any]] = {0: [], 1: []}
+        for discarded, payload in self.conn.execute(
+            'SELECT discarded, payload FROM items WHERE file_id = ? ORDER BY discarded, position', (file_id,)
+        ):
+            groups[discarded].append(json.loads(payload))
+        if 'items' in document:
+            document['items'] = groups[0]
+        if 'discarded_items' in document:
+            document['discarded_items'] = groups[1]
+        return document
+
+    def issues(self, newsletter: str | None = None) -> List[Dict[str, Any]]:
+        """One row per archived report: path, title, dates (ordinals) and item counts."""
+        sql = ('SELECT path, newsletter, title, published, period_start, period_end, item_count, discarded_count'
+               ' FROM files')
+        params: Tuple[Any, ...] = ()
+        if newsletter:
+            sql += ' WHERE newsletter = ?'
+            params = (newsletter,)
+        return [dict(row) for row in self.conn.execute(sql + ' ORDER BY newsletter, path', params)]
+
+    def query_items(
+        self,
+        newsletter: str | None = None,
+        country: str | None = None,
+        tag: str | None = None,
+        instrument: str | None = None,
+        institution: str | None = None,
+        source: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        include_discarded: bool = False,
+        limit: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Items matching every given filter, newest first. Dates are ordinals."""
+        where, params = [], []
+        if not include_discarded:
+            where.append('i.discarded = 0')
+        if newsletter:
+            where.append('f.newsletter = ?')
+            params.append(newsletter)
+        if country:
+            where.append('i.id IN (SELECT item FROM item_countries WHERE code = ?)')
+            params.append(country)
+        for facet, value in (('tag', tag), ('instrument', instrument), ('institution', institution)):
+            if value:
+                junction, table, column = _LOOKUPS[facet]
+                where.append(f'i.id IN (SELECT j.item FROM {junction} j JOIN {table} t ON t.id = j.{column} WHERE t.name = ?)')
+                params.append(value)
+        if source:
+            where.append('i.source_id = (SELECT id FROM sources WHERE name = ?)')
+            params.append(source)
+        if since is not None:
+            where.append('i.date_ordinal >= ?')
+            params.append(since)
+        if until is not None:
+            where.append('i.date_ordinal <= ?')
+            params.append(until)
+        sql = ('SELECT f.path, f.newsletter, i.item_id, i.headline, i.publication_date, i.category, i.score,'
+               ' i.discarded, i.payload FROM items i JOIN files f ON f.id = i.file_id')
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY i.date_ordinal DESC, f.path, i.discarded, i.position'
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def stats(self) -> Dict[str, int]:
+        tables = ('files', 'items', 'sources', 'countries', 'tags', 'instruments', 'institutions')
+        return {t: self.conn.execute(f'SELECT COUNT(*) FROM {t}').fetchone()[0] for t in tables}
+
+
+# -- read-through helpers for the converters ---------------------------------
+
+# sqlite3 connections belong to the thread that opened them, and reports are read
+# from thread pools (the merger, build.py) and the converter daemon's threads
+_shared = threading.local()
+
+
+def shared_archive() -> Archive | None:
+    """The archive named by NEWSLETTER_ARCHIVE, if set and present (one connection per thread)."""
+    db = os.environ.get(ENV_VAR)
+    if not db or not Path(db).exists():
+        return None
+    archive = getattr(_shared, 'archive', None)
+    if archive is None or archive.path != Path(db):
+        if archive is not None:
+            archive.close()
+        archive = _shared.archive = Archive(db)
+    return archive
+
+
+def read_report(path: str | Path) -> Dict[str, Any]:
+    """
+    Load a JSON report, from the archive when NEWSLETTER_ARCHIVE points at one
+    holding an up-to-date copy. Raises like ``json.load`` otherwise.
+    """
+    path = Path(path)
+    archive = shared_archive()
+    if archive is not None and path.exists():
+        data = archive.load_report(path)
+        if data is not None:
+            return data
+    with path.open('r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def archived_issues(newsletter: str) -> Dict[str, Dict[str, Any]]:
+    """Archived reports of a newsletter keyed by file stem (empty without an archive)."""
+    archive = shared_archive()
+    if archive is None:
+        return {}
+    return {Path(row['path']).stem: row for row in archive.issues(newsletter)}
+
+
+# -- CLI ----------------------------------------------------------------------
+
+def _print_items(rows: List[Dict[str, Any]], as_json: bool) -> None:
+    if as_json:
+        print(_dumps([json.loads(row['payload']) for row in rows]))
+        return
+    for row in rows:
+        flag = ' (discarded)' if row['discarded'] else ''
+        print(f"{row['publication_date'] or '??-??-????':>10}  {row['newsletter']:<16} {row['item_id'] or '-':<18} {row['headline']}{flag}")
+    print(f'{len(rows)} items')
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='SQLite archive of all newsletter issues.')
+    parser.add_argument('--db', default=os.environ.get(ENV_VAR) or str(DEFAULT_DB), help='archive database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    ingest = sub.add_parser('ingest', help='ingest reports (default: every data/**/*.json)')
+    ingest.add_argument('files', nargs='*', type=Path)
+
+    sub.add_parser('stats', help='row counts per table')
+
+    query = sub.add_parser('query', help='query items across the archive')
+    query.add_argument('--newsletter')
+    query.add_argument('--country', help='ISO code or country name')
+    query.add_argument('--tag')
+    query.add_argument('--instrument')
+    query.add_argument('--institution')
+    query.add_argument('--source')
+    query.add_argument('--since', help='DD-MM-YYYY')
+    query.add_argument('--until', help='DD-MM-YYYY')
+    query.add_argument('--discarded', action='store_true', help='include discarded items')
+    query.add_argument('--limit', type=int)
+    query.add_argument('--json', action='store_true', help='print item payloads as JSON')
+
+    args = parser.parse_args(argv)
+    with Archive(args.db) as archive:
+        if args.command == 'ingest':
+            files = args.files or sorted(DATA_DIR.glob('*/*.json'))
+            missing = [p for p in files if not p.exists()]
+            if missing:
+                print(f'Error: input not found: {missing[0]}')
+                return 2
+            stats = archive.ingest(files, prune=not args.files)
+            print(f"Archive {args.db}: {stats['added']} added, {stats['updated']} updated, "
+                  f"{stats['unchanged']} unchanged, {stats['pruned']} pruned")
+        elif args.command == 'stats':
+            for table, count in archive.stats().items():
+                print(f'{table:<13} {count:>8,}')
+        else:
+            since, until = date_ordinal(args.since), date_ordinal(args.until)
+            if (args.since and since is None) or (args.until and until is None):
+                print('Error: --since/--until expect a date such as DD-MM-YYYY')
+                return 2
+            country = None
+            if args.country:
+                entity = resolve(args.country)
+                country = entity.code if entity else args.country.upper()
+            rows = archive.query_items(
+                newsletter=args.newsletter, country=country, tag=args.tag,
+                instrument=args.instrument, institution=args.institution, source=args.source,
+                since=since, until=until, include_discarded=args.discarded, limit=args.limit,
+            )
+            _print_items(rows, args.json)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
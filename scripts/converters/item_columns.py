@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Columnar cache of report items for vectorised analytics.
+
+Each JSON report is flattened once into NumPy arrays:
+
+  score                float64 per item (NaN when missing)
+  date                 int32 date ordinal per item (0 when missing)
+  category             int32 code per item into the category vocabulary
+  <facet>_offsets      int64, len(items) + 1: item i owns codes[offsets[i]:offsets[i+1]]
+  <facet>_codes        int32 codes into the facet vocabulary
+
+for the ragged facets ``country`` (canonical entity codes), ``tag`` (the
+archive's tag definition), ``secondary_tag`` and ``instrument`` (the raw
+classification lists the meta pages chart). Vocabularies keep first-appearance
+order, so ``most_common`` breaks ties exactly like ``Counter.most_common``.
+
+The arrays are saved as .npy files under .cache/columns/<file hash>/ and
+memory-mapped on later runs, so counts, histograms and filters never walk the
+nested item dicts again. ``load_columns`` returns None without NumPy; callers
+keep their dict-walking path for that case.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # load_columns() then returns None
+    np = None
+
+from dates import date_ordinal
+from entities import item_entities
+from item_archive import content_key, item_category, item_facets, item_score, read_report
+
+FORMAT_VERSION = 3
+CACHE_DIR = Path('.cache') / 'columns'
+
+
+def _classification_list(key: str) -> Callable[[Dict[str, Any]], Iterable[Any]]:
+    def extract(item: Dict[str, Any]) -> Iterable[Any]:
+        classification = item.get('classification')
+        values = classification.get(key) if isinstance(classification, dict) else None
+        return values if isinstance(values, list) else []
+    return extract
+
+
+RAGGED_FACETS: Dict[str, Callable[[Dict[str, Any]], Iterable[Any]]] = {
+    'country': lambda item: [entity.code for entity in item_entities(item)],
+    'tag': lambda item: item_facets(item)['tag'],
+    'secondary_tag': _classification_list('secondary_tags'),
+    'instrument': _classification_list('instruments'),
+}
+
+
+class ItemColumns:
+    """Array-backed columns of one report's items."""
+
+    def __init__(self, arrays: Dict[str, Any], vocab: Dict[str, List[str]]):
+        self.arrays = arrays
+        self.vocab = vocab
+
+    def __len__(self) -> int:
+        return len(self.arrays['score'])
+
+    # -- building -------------------------------------------------------
+
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> 'ItemColumns':
+        items = [it for it in items if isinstance(it, dict)]
+        vocab: Dict[str, Dict[str, int]] = {'category': {}}
+        categories = vocab['category']
+        category_codes = [
+            categories.setdefault(item_category(it) or 'uncategorized', len(categories)) for it in items
+        ]
+        scores = [item_score(it) for it in items]
+        arrays: Dict[str, Any] = {
+            'score': np.array([np.nan if s is None else s for s in scores], dtype=np.float64),
+            'date': np.array([date_ordinal(it.get('publication_date') or it.get('date')) or 0 for it in items], dtype=np.int32),
+            'category': np.array(category_codes, dtype=np.int32),
+        }
+        for facet, extract in RAGGED_FACETS.items():
+            terms = vocab.setdefault(facet, {})
+            offsets = [0]
+            codes: List[int] = []
+            for it in items:
+                for value in extract(it):
+                    if value not in (None, ''):
+                        codes.append(terms.setdefault(str(value), len(terms)))
+                offsets.append(len(codes))
+            arrays[f'{facet}_offsets'] = np.array(offsets, dtype=np.int64)
+            arrays[f'{facet}_codes'] = np.array(codes, dtype=np.int32)
+        return cls(arrays, {facet: list(terms) for facet, terms in vocab.items()})
+
+    # -- persistence ----------------------------------------------------
+
+    def save(self, directory: Path) -> None:
+        """Write the columns atomically: a complete directory appears or nothing does."""
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix='.tmp-', dir=directory.parent))
+        try:
+            for name, array in self.arrays.items():
+                np.save(tmp / f'{name}.npy', array)
+            with open(tmp / 'vocab.json', 'w', encoding='utf-8') as f:
+                json.dump({'version': FORMAT_VERSION, 'vocab': self.vocab}, f, ensure_ascii=False)
+            os.replace(tmp, directory)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not directory.exists():
+                raise
+
+    @classmethod
+    def load(cls, directory: Path) -> 'ItemColumns | None':
+        """Memory-map cached columns; None when missing or from another format version."""
+        try:
+            with open(directory / 'vocab.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != FORMAT_VERSION:
+            return None
+        arrays = {}
+        for path in directory.glob('*.npy'):
+            try:
+                arrays[path.stem] = np.load(path, mmap_mode='r')
+            except ValueError:
+                # Zero-length arrays cannot be mapped
+                arrays[path.stem] = np.load(path)
+        return cls(arrays, meta['vocab'])
+
+    @classmethod
+    def for_file(cls, path: Path | str, cache_dir: Path = CACHE_DIR) -> 'ItemColumns':
+        """Columns of a JSON report, built on first use and memory-mapped afterwards."""
+        path = Path(path)
+        directory = cache_dir / content_key(path, cache_dir)
+        columns = cls.load(directory)
+        if columns is None:
+            columns = cls.from_items(read_report(path).get('items') or [])
+            columns.save(directory)
+        return columns
+
+    # -- queries --------------------------------------------------------
+
+    def codes(self, facet: str) -> Any:
+        return self.arrays['category'] if facet == 'category' else self.arrays[f'{facet}_codes']
+
+    def rows(self, facet: str) -> Any:
+        """Item index of every code of a facet (aligned with ``codes``)."""
+        if facet == 'category':
+            return np.arange(len(self), dtype=np.int64)
+        offsets = self.arrays[f'{facet}_offsets']
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(offsets))
+
+    def counts(self, facet: str) -> Any:
+        """Occurrences per vocabulary entry (duplicates within an item count)."""
+        return np.bincount(self.codes(facet), minlength=len(self.vocab[facet]))
+
+    def most_common(self, facet: str, n: int | None = None) -> List[Tuple[str, int]]:
+        """Like ``Counter.most_common``: count desc, ties in first-appearance order."""
+        counts = self.counts(facet)
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        if n is not None:
+            order = order[:n]
+        terms = self.vocab[facet]
+        return [(terms[i], int(counts[i])) for i in order]
+
+    def item_mask(self, facet: str, term: str) -> Any:
+        """Boolean mask of the items carrying ``term``."""
+        try:
+            code = self.vocab[facet].index(term)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.rows(facet)[self.codes(facet) == code]] = True
+        return mask
+
+    def score_histogram(self, edges: Iterable[float], mask: Any = None) -> Any:
+        """Item counts per score bin (``np.histogram`` semantics); unscored items are skipped."""
+        scores = self.arrays['score'] if mask is None else self.arrays['score'][mask]
+        return np.histogram(scores[~np.isnan(scores)], bins=np.asarray(list(edges), dtype=np.float64))[0]
+
+
+def load_columns(path: Path | str) -> ItemColumns | None:
+    """Cached columns of a report, or None without NumPy or when the cache is unusable."""
+    if np is None:
+        return None
+    try:
+        return ItemColumns.for_file(path)
+    except (OSError, ValueError, KeyError):
+        return None
@@ -5,16 +5,23 @@ Converts structured JSON data to Kepler Karst branded HTML
 """
 
 import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
+from collections import Counter
+
+from entities import GLOBAL_CODE, country_code, resolve
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_archive import read_report
+from output_files import write_if_changed
 
 def load_json_data(json_file):
     """Load JSON data from file"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except FileNotFoundError:
         print(f"Error: File {json_file} not found")
         sys.exit(1)
@@ -24,7 +31,6 @@ def load_json_data(json_file):
 
 def clean_text(text):
     """Clean text by removing citation references and other artifacts"""
-    import re
     if not text:
         return text
     
@@ -41,119 +47,86 @@ def clean_text(text):
     
     return text
 
+# Lista de países comunes en inglés y español
+COUNTRIES = [
+    # English country names
+    'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
+    'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
+    'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
+    'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
+    'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
+    'Fiji', 'Finland', 'France',
+    'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
+    'Haiti', 'Honduras', 'Hungary',
+    'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
+    'Jamaica', 'Japan', 'Jordan',
+    'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
+    'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
+    'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
+    'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
+    'Oman',
+    'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
+    'Qatar',
+    'Romania', 'Russia', 'Rwanda',
+    'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
+    'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
+    'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
+    'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
+    'Yemen',
+    'Zambia', 'Zimbabwe',
+    # Spanish country names
+    'Afganistán', 'Albania', 'Alemania', 'Andorra', 'Angola', 'Antigua y Barbuda', 'Arabia Saudita', 'Argelia', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaiyán',
+    'Bahamas', 'Bahrein', 'Bangladés', 'Barbados', 'Bélgica', 'Belice', 'Benín', 'Bielorrusia', 'Birmania', 'Bolivia', 'Bosnia y Herzegovina', 'Botsuana', 'Brasil', 'Brunéi', 'Bulgaria', 'Burkina Faso', 'Burundi',
+    'Camboya', 'Camerún', 'Canadá', 'Chad', 'Chile', 'China', 'Chipre', 'Colombia', 'Comoras', 'Congo', 'Corea del Norte', 'Corea del Sur', 'Costa Rica', 'Costa de Marfil', 'Croacia', 'Cuba', 'República Checa',
+    'Dinamarca', 'Dominica', 'República Dominicana',
+    'Ecuador', 'Egipto', 'El Salvador', 'Emiratos Árabes Unidos', 'Eritrea', 'Eslovaquia', 'Eslovenia', 'España', 'Estados Unidos', 'Estonia', 'Etiopía',
+    'Filipinas', 'Finlandia', 'Fiyi', 'Francia',
+    'Gabón', 'Gambia', 'Georgia', 'Ghana', 'Granada', 'Grecia', 'Guatemala', 'Guinea', 'Guinea-Bisáu', 'Guinea Ecuatorial', 'Guyana',
+    'Haití', 'Honduras', 'Hungría',
+    'India', 'Indonesia', 'Irán', 'Irak', 'Irlanda', 'Islandia', 'Islas Marshall', 'Islas Salomón', 'Israel', 'Italia',
+    'Jamaica', 'Japón', 'Jordania',
+    'Kazajistán', 'Kenia', 'Kirguistán', 'Kuwait',
+    'Laos', 'Lesoto', 'Letonia', 'Líbano', 'Liberia', 'Libia', 'Liechtenstein', 'Lituania', 'Luxemburgo',
+    'Macedonia del Norte', 'Madagascar', 'Malasia', 'Malaui', 'Maldivas', 'Malí', 'Malta', 'Marruecos', 'Mauricio', 'Mauritania', 'México', 'Micronesia', 'Moldavia', 'Mónaco', 'Mongolia', 'Montenegro', 'Mozambique',
+    'Namibia', 'Nauru', 'Nepal', 'Nicaragua', 'Níger', 'Nigeria', 'Noruega', 'Nueva Zelanda',
+    'Omán',
+    'Países Bajos', 'Pakistán', 'Palaos', 'Panamá', 'Papúa Nueva Guinea', 'Paraguay', 'Perú', 'Polonia', 'Portugal',
+    'Qatar',
+    'Reino Unido', 'República Centroafricana', 'República Democrática del Congo', 'República del Congo', 'Rumania', 'Rusia', 'Ruanda',
+    'Samoa', 'San Marino', 'Santa Lucía', 'San Vicente y las Granadinas', 'San Cristóbal y Nieves', 'Santo Tomé y Príncipe', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leona', 'Singapur', 'Siria', 'Somalia', 'Sudáfrica', 'Sudán', 'Sudán del Sur', 'Suecia', 'Suiza', 'Surinam',
+    'Tailandia', 'Tanzania', 'Tayikistán', 'Timor Oriental', 'Togo', 'Tonga', 'Trinidad y Tobago', 'Túnez', 'Turkmenistán', 'Turquía', 'Tuvalu',
+    'Ucrania', 'Uganda', 'Uruguay', 'Uzbekistán',
+    'Vanuatu', 'Vaticano', 'Venezuela', 'Vietnam',
+    'Yemen',
+    'Zambia', 'Zimbabue'
+]
+
+@lru_cache(maxsize=None)
+def _country_pattern():
+    """Regex de los países (case insensitive), compilado una sola vez al primer uso"""
+    return re.compile(r'\b(' + '|'.join(re.escape(country) for country in COUNTRIES) + r')\b', re.IGNORECASE)
+
 def highlight_countries(text):
     """Highlight country names in text by making them bold"""
-    import re
     if not text:
         return text
     
-    # Lista de países comunes en inglés y español
-    countries = [
-        # English country names
-        'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
-        'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
-        'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
-        'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
-        'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
-        'Fiji', 'Finland', 'France',
-        'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
-        'Haiti', 'Honduras', 'Hungary',
-        'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
-        'Jamaica', 'Japan', 'Jordan',
-        'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
-        'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
-        'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
-        'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
-        'Oman',
-        'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
-        'Qatar',
-        'Romania', 'Russia', 'Rwanda',
-        'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
-        'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
-        'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
-        'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
-        'Yemen',
-        'Zambia', 'Zimbabwe',
-        # Spanish country names
-        'Afganistán', 'Albania', 'Alemania', 'Andorra', 'Angola', 'Antigua y Barbuda', 'Arabia Saudita', 'Argelia', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaiyán',
-        'Bahamas', 'Bahrein', 'Bangladés', 'Barbados', 'Bélgica', 'Belice', 'Benín', 'Bielorrusia', 'Birmania', 'Bolivia', 'Bosnia y Herzegovina', 'Botsuana', 'Brasil', 'Brunéi', 'Bulgaria', 'Burkina Faso', 'Burundi',
-        'Camboya', 'Camerún', 'Canadá', 'Chad', 'Chile', 'China', 'Chipre', 'Colombia', 'Comoras', 'Congo', 'Corea del Norte', 'Corea del Sur', 'Costa Rica', 'Costa de Marfil', 'Croacia', 'Cuba', 'República Checa',
-        'Dinamarca', 'Dominica', 'República Dominicana',
-        'Ecuador', 'Egipto', 'El Salvador', 'Emiratos Árabes Unidos', 'Eritrea', 'Eslovaquia', 'Eslovenia', 'España', 'Estados Unidos', 'Estonia', 'Etiopía',
-        'Filipinas', 'Finlandia', 'Fiyi', 'Francia',
-        'Gabón', 'Gambia', 'Georgia', 'Ghana', 'Granada', 'Grecia', 'Guatemala', 'Guinea', 'Guinea-Bisáu', 'Guinea Ecuatorial', 'Guyana',
-        'Haití', 'Honduras', 'Hungría',
-        'India', 'Indonesia', 'Irán', 'Irak', 'Irlanda', 'Islandia', 'Islas Marshall', 'Islas Salomón', 'Israel', 'Italia',
-        'Jamaica', 'Japón', 'Jordania',
-        'Kazajistán', 'Kenia', 'Kirguistán', 'Kuwait',
-        'Laos', 'Lesoto', 'Letonia', 'Líbano', 'Liberia', 'Libia', 'Liechtenstein', 'Lituania', 'Luxemburgo',
-        'Macedonia del Norte', 'Madagascar', 'Malasia', 'Malaui', 'Maldivas', 'Malí', 'Malta', 'Marruecos', 'Mauricio', 'Mauritania', 'México', 'Micronesia', 'Moldavia', 'Mónaco', 'Mongolia', 'Montenegro', 'Mozambique',
-        'Namibia', 'Nauru', 'Nepal', 'Nicaragua', 'Níger', 'Nigeria', 'Noruega', 'Nueva Zelanda',
-        'Omán',
-        'Países Bajos', 'Pakistán', 'Palaos', 'Panamá', 'Papúa Nueva Guinea', 'Paraguay', 'Perú', 'Polonia', 'Portugal',
-        'Qatar',
-        'Reino Unido', 'República Centroafricana', 'República Democrática del Congo', 'República del Congo', 'Rumania', 'Rusia', 'Ruanda',
-        'Samoa', 'San Marino', 'Santa Lucía', 'San Vicente y las Granadinas', 'San Cristóbal y Nieves', 'Santo Tomé y Príncipe', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leona', 'Singapur', 'Siria', 'Somalia', 'Sudáfrica', 'Sudán', 'Sudán del Sur', 'Suecia', 'Suiza', 'Surinam',
-        'Tailandia', 'Tanzania', 'Tayikistán', 'Timor Oriental', 'Togo', 'Tonga', 'Trinidad y Tobago', 'Túnez', 'Turkmenistán', 'Turquía', 'Tuvalu',
-        'Ucrania', 'Uganda', 'Uruguay', 'Uzbekistán',
-        'Vanuatu', 'Vaticano', 'Venezuela', 'Vietnam',
-        'Yemen',
-        'Zambia', 'Zimbabue'
-    ]
-    
-    # Crear patrón regex para buscar países (case insensitive)
-    pattern = r'\b(' + '|'.join(re.escape(country) for country in countries) + r')\b'
-    
     # Reemplazar países encontrados con versión en negrita
-    highlighted_text = re.sub(pattern, r'<strong>\1</strong>', text, flags=re.IGNORECASE)
-    
-    return highlighted_text
+    return _country_pattern().sub(r'<strong>\1</strong>', text)
 
 def get_country_code(country_name):
     """Get country code based on country name"""
-    code_map = {
-        # Africa
-        'Malawi': 'MW', 'Zambia': 'ZM', 'Ghana': 'GH', 'Angola': 'AO', 'Ethiopia': 'ET', 'Kenya': 'KE', 'Nigeria': 'NG', 'South Africa': 'ZA', 'Egypt': 'EG', 'Morocco': 'MA', 'Tunisia': 'TN', 'Algeria': 'DZ', 'Sudan': 'SD', 'South Sudan': 'SS', 'Somalia': 'SO', 'Eritrea': 'ER', 'Djibouti': 'DJ', 'Chad': 'TD', 'Niger': 'NE', 'Mali': 'ML', 'Burkina Faso': 'BF', 'Senegal': 'SN', 'Gambia': 'GM', 'Guinea-Bissau': 'GW', 'Guinea': 'GN', 'Sierra Leone': 'SL', 'Liberia': 'LR', 'Ivory Coast': 'CI', 'Togo': 'TG', 'Benin': 'BJ', 'Cameroon': 'CM', 'Central African Republic': 'CF', 'Congo': 'CG', 'Democratic Republic of the Congo': 'CD', 'Gabon': 'GA', 'Equatorial Guinea': 'GQ', 'Sao Tome and Principe': 'ST', 'Mauritania': 'MR', 'Mauritius': 'MU', 'Seychelles': 'SC', 'Comoros': 'KM', 'Madagascar': 'MG', 'Mozambique': 'MZ', 'Zimbabwe': 'ZW', 'Botswana': 'BW', 'Namibia': 'NA', 'Lesotho': 'LS', 'Eswatini': 'SZ', 'Burundi': 'BI', 'Rwanda': 'RW', 'Uganda': 'UG', 'Tanzania': 'TZ',
-        
-        # Asia
-        'India': 'IN', 'Pakistan': 'PK', 'Sri Lanka': 'LK', 'Bangladesh': 'BD', 'Nepal': 'NP', 'Bhutan': 'BT', 'Maldives': 'MV', 'China': 'CN', 'Japan': 'JP', 'South Korea': 'KR', 'North Korea': 'KP', 'Mongolia': 'MN', 'Taiwan': 'TW', 'Vietnam': 'VN', 'Laos': 'LA', 'Cambodia': 'KH', 'Thailand': 'TH', 'Myanmar': 'MM', 'Malaysia': 'MY', 'Singapore': 'SG', 'Indonesia': 'ID', 'Philippines': 'PH', 'Brunei': 'BN', 'East Timor': 'TL', 'Kazakhstan': 'KZ', 'Kyrgyzstan': 'KG', 'Tajikistan': 'TJ', 'Uzbekistan': 'UZ', 'Turkmenistan': 'TM', 'Afghanistan': 'AF', 'Iran': 'IR', 'Iraq': 'IQ', 'Syria': 'SY', 'Lebanon': 'LB', 'Jordan': 'JO', 'Israel': 'IL', 'Palestine': 'PS', 'Saudi Arabia': 'SA', 'Yemen': 'YE', 'Oman': 'OM', 'United Arab Emirates': 'AE', 'Qatar': 'QA', 'Kuwait': 'KW', 'Bahrain': 'BH', 'Armenia': 'AM', 'Azerbaijan': 'AZ', 'Georgia': 'GE', 'Turkey': 'TR', 'Cyprus': 'CY',
-        
-        # Europe
-        'Ukraine': 'UA', 'Russia': 'RU', 'Belarus': 'BY', 'Poland': 'PL', 'Lithuania': 'LT', 'Latvia': 'LV', 'Estonia': 'EE', 'Finland': 'FI', 'Sweden': 'SE', 'Norway': 'NO', 'Denmark': 'DK', 'Iceland': 'IS', 'Germany': 'DE', 'France': 'FR', 'Spain': 'ES', 'Portugal': 'PT', 'Italy': 'IT', 'Greece': 'GR', 'Albania': 'AL', 'North Macedonia': 'MK', 'Kosovo': 'XK', 'Serbia': 'RS', 'Montenegro': 'ME', 'Bosnia and Herzegovina': 'BA', 'Croatia': 'HR', 'Slovenia': 'SI', 'Hungary': 'HU', 'Slovakia': 'SK', 'Czech Republic': 'CZ', 'Austria': 'AT', 'Switzerland': 'CH', 'Liechtenstein': 'LI', 'Netherlands': 'NL', 'Belgium': 'BE', 'Luxembourg': 'LU', 'Ireland': 'IE', 'United Kingdom': 'GB', 'Malta': 'MT', 'Bulgaria': 'BG', 'Romania': 'RO', 'Moldova': 'MD',
-        
-        # Americas
-        'United States': 'US', 'Canada': 'CA', 'Mexico': 'MX', 'Guatemala': 'GT', 'Belize': 'BZ', 'El Salvador': 'SV', 'Honduras': 'HN', 'Nicaragua': 'NI', 'Costa Rica': 'CR', 'Panama': 'PA', 'Colombia': 'CO', 'Venezuela': 'VE', 'Guyana': 'GY', 'Suriname': 'SR', 'Brazil': 'BR', 'Ecuador': 'EC', 'Peru': 'PE', 'Bolivia': 'BO', 'Paraguay': 'PY', 'Uruguay': 'UY', 'Argentina': 'AR', 'Chile': 'CL', 'Cuba': 'CU', 'Jamaica': 'JM', 'Haiti': 'HT', 'Dominican Republic': 'DO', 'Puerto Rico': 'PR', 'Bahamas': 'BS', 'Barbados': 'BB', 'Trinidad and Tobago': 'TT', 'Grenada': 'GD', 'Saint Vincent and the Grenadines': 'VC', 'Saint Lucia': 'LC', 'Saint Kitts and Nevis': 'KN', 'Antigua and Barbuda': 'AG', 'Dominica': 'DM',
-        
-        # Oceania
-        'Australia': 'AU', 'New Zealand': 'NZ', 'Papua New Guinea': 'PG', 'Fiji': 'FJ', 'Solomon Islands': 'SB', 'Vanuatu': 'VU', 'New Caledonia': 'NC', 'Samoa': 'WS', 'Tonga': 'TO', 'Tuvalu': 'TV', 'Kiribati': 'KI', 'Nauru': 'NR', 'Palau': 'PW', 'Micronesia': 'FM', 'Marshall Islands': 'MH',
-        
-        # Global/International
-        'GLOBAL': 'GL', 'Global': 'GL'
-    }
-    
-    return code_map.get(country_name, 'XX')
+    return country_code(country_name)
 
 def generate_country_chart(items):
     """Generate a simple HTML/CSS chart showing country distribution"""
-    from collections import Counter
-    
-    # Extract countries from items
     country_counts = Counter()
     for item in items:
-        countries = item.get('countries', [])
-        # Get the full country name (second element if available, otherwise first)
-        if len(countries) > 1:
-            country_name = countries[1]  # Full name
-        elif countries:
-            country_name = countries[0]  # Code or name
-        else:
+        # Codes, names and [code, name] pairs all resolve to one canonical country
+        entity = resolve(item.get('countries', []))
+        if entity is None or entity.code == GLOBAL_CODE:
             continue
-        
-        # Skip if it's a code (2-3 letters) or GLOBAL
-        if len(country_name) <= 3 or country_name == 'GLOBAL':
-            continue
-            
-        country_counts[country_name] += 1
+        country_counts[entity.name_en] += 1
     
     # Get top 8 countries
     top_countries = country_counts.most_common(8)
@@ -192,13 +165,11 @@ def generate_country_chart(items):
 
 def create_google_search_url(headline, original_url):
     """Create a Google search URL using the URL slug instead of full headline"""
-    import re
     
     # Extract domain and slug from original URL
     domain = ""
     slug = ""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url)
         domain = parsed.netloc
         
@@ -219,13 +190,11 @@ def create_google_search_url(headline, original_url):
 
 def create_google_lucky_url(headline, original_url):
     """Create a Google 'I'm Feeling Lucky' URL that goes directly to the first result"""
-    import re
     
     # Extract domain and slug from original URL
     domain = ""
     slug = ""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url)
         domain = parsed.netloc
         
@@ -244,6 +213,13 @@ def create_google_lucky_url(headline, original_url):
     
     return f"https://www.google.com/search?q={encoded_search}&btnI"
 
+# Month names in English
+MONTHS = {
+    '01': 'January', '02': 'February', '03': 'March', '04': 'April',
+    '05': 'May', '06': 'June', '07': 'July', '08': 'August',
+    '09': 'September', '10': 'October', '11': 'November', '12': 'December'
+}
+
 def format_date_for_display(date_str):
     """Convert date from DD-MM-YYYY format to DD Month YYYY format"""
     if not date_str or date_str == 'DD-MM-YYYY':
@@ -253,14 +229,7 @@ def format_date_for_display(date_str):
         # Parse the date string (DD-MM-YYYY)
         day, month, year = date_str.split('-')
         
-        # Month names in English
-        months = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        
-        month_name = months.get(month, month)
+        month_name = MONTHS.get(month, month)
         return f"{day} {month_name} {year}"
     except:
         return date_str
@@ -770,13 +739,15 @@ def generate_html(data):
 
 def main():
     """Main function"""
-    if len(sys.argv) != 2:
-        print("Usage: python json_to_html_converter.py <json_file>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python json_to_html_converter.py <json_file> [output_dir]")
         print("Example: python json_to_html_converter.py weekly_digest.json")
         sys.exit(1)
     
     json_file = sys.argv[1]
-    output_file = Path(json_file).stem + '.html'
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path('.')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"{Path(json_file).stem}.html"
     
     # Load JSON data
     data = load_json_data(json_file)
@@ -785,8 +756,7 @@ def main():
     html = generate_html(data)
     
     # Write HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_if_changed(output_file, embed_issue_metadata(html, issue_metadata(data, 'sovereign-debt', Path(json_file).stem, 'en')))
     
     print(f"✅ HTML generated successfully: {output_file}")
     print(f"📊 Processed {len(data.get('items', []))} items")
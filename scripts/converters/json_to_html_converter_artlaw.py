@@ -9,18 +9,25 @@ Uso:
 """
 
 import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote
-from collections import Counter
+from urllib.parse import quote, urlparse
+
+from entities import canonical_counts
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_analytics import ItemAggregate, cached_analytics, effective_analytics
+from item_archive import read_report
+from item_columns import load_columns
+from output_files import write_outputs
 
 
 def load_json_data(json_file: str):
     """Cargar datos JSON desde archivo"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo {json_file}")
         sys.exit(1)
@@ -31,7 +38,6 @@ def load_json_data(json_file: str):
 
 def clean_text(text: str | None) -> str | None:
     """Limpia texto removiendo referencias y artefactos frecuentes"""
-    import re
     if not text:
         return text
 
@@ -47,112 +53,112 @@ def clean_text(text: str | None) -> str | None:
     return text
 
 
+# Países en español e inglés
+COUNTRIES = [
+    'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
+    'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
+    'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
+    'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
+    'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
+    'Fiji', 'Finland', 'France',
+    'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
+    'Haiti', 'Honduras', 'Hungary',
+    'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
+    'Jamaica', 'Japan', 'Jordan',
+    'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
+    'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
+    'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
+    'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
+    'Oman',
+    'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
+    'Qatar',
+    'Romania', 'Russia', 'Rwanda',
+    'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
+    'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
+    'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
+    'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
+    'Yemen',
+    'Zambia', 'Zimbabwe',
+    # Nombres en español
+    'Francia', 'Alemania', 'Italia', 'España', 'Reino Unido', 'Estados Unidos', 'Canadá', 'México', 'Brasil', 'Argentina', 'Chile', 'Perú', 'Colombia', 'Venezuela', 'Ecuador', 'Bolivia', 'Paraguay', 'Uruguay', 'Guyana', 'Surinam', 'Guayana Francesa', 'Islas Malvinas', 'Georgia del Sur', 'Islas Sandwich del Sur', 'Antártida', 'Groenlandia', 'Islandia', 'Noruega', 'Suecia', 'Finlandia', 'Dinamarca', 'Países Bajos', 'Bélgica', 'Luxemburgo', 'Suiza', 'Austria', 'Liechtenstein', 'Mónaco', 'Andorra', 'San Marino', 'Vaticano', 'Malta', 'Chipre', 'Grecia', 'Albania', 'Macedonia del Norte', 'Kosovo', 'Serbia', 'Montenegro', 'Bosnia y Herzegovina', 'Croacia', 'Eslovenia', 'Hungría', 'Eslovaquia', 'República Checa', 'Polonia', 'Lituania', 'Letonia', 'Estonia', 'Bielorrusia', 'Ucrania', 'Moldavia', 'Rumania', 'Bulgaria', 'Turquía', 'Georgia', 'Armenia', 'Azerbaiyán', 'Rusia', 'Kazajistán', 'Uzbekistán', 'Turkmenistán', 'Kirguistán', 'Tayikistán', 'Afganistán', 'Pakistán', 'India', 'Nepal', 'Bután', 'Bangladés', 'Sri Lanka', 'Maldivas', 'China', 'Mongolia', 'Corea del Norte', 'Corea del Sur', 'Japón', 'Taiwán', 'Filipinas', 'Vietnam', 'Laos', 'Camboya', 'Tailandia', 'Myanmar', 'Malasia', 'Singapur', 'Brunéi', 'Indonesia', 'Timor Oriental', 'Papúa Nueva Guinea', 'Australia', 'Nueva Zelanda', 'Fiyi', 'Vanuatu', 'Nueva Caledonia', 'Islas Salomón', 'Tuvalu', 'Kiribati', 'Nauru', 'Palaos', 'Micronesia', 'Islas Marshall', 'Polinesia Francesa', 'Samoa', 'Tonga', 'Niue', 'Islas Cook', 'Tokelau', 'Wallis y Futuna', 'Pitcairn', 'Isla de Pascua', 'Hawai', 'Alaska', 'Canadá', 'Estados Unidos', 'México', 'Guatemala', 'Belice', 'El Salvador', 'Honduras', 'Nicaragua', 'Costa Rica', 'Panamá', 'Cuba', 'Jamaica', 'Haití', 'República Dominicana', 'Puerto Rico', 'Bahamas', 'Antigua y Barbuda', 'San Cristóbal y Nieves', 'Dominica', 'Santa Lucía', 'San Vicente y las Granadinas', 'Granada', 'Barbados', 'Trinidad y Tobago', 'Guyana', 'Surinam', 'Brasil', 'Venezuela', 'Colombia', 'Ecuador', 'Perú', 'Bolivia', 'Paraguay', 'Uruguay', 'Argentina', 'Chile', 'Islas Malvinas', 'Georgia del Sur', 'Antártida',
+    # Abreviaciones comunes
+    'EE.UU.', 'EE. UU.', 'EEUU', 'UE', 'EE UU'
+]
+
+# Estados americanos
+US_STATES = [
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia',
+    'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland',
+    'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey',
+    'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
+    'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'
+]
+
+# Ciudades principales
+MAJOR_CITIES = [
+    'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose',
+    'Austin', 'Jacksonville', 'Fort Worth', 'Columbus', 'Charlotte', 'San Francisco', 'Indianapolis', 'Seattle', 'Denver', 'Washington',
+    'Boston', 'El Paso', 'Nashville', 'Detroit', 'Oklahoma City', 'Portland', 'Las Vegas', 'Memphis', 'Louisville', 'Baltimore',
+    'Milwaukee', 'Albuquerque', 'Tucson', 'Fresno', 'Sacramento', 'Atlanta', 'Kansas City', 'Long Beach', 'Colorado Springs', 'Raleigh',
+    'Miami', 'Virginia Beach', 'Omaha', 'Oakland', 'Minneapolis', 'Tulsa', 'Tampa', 'Arlington', 'New Orleans', 'Wichita',
+    'Cleveland', 'Bakersfield', 'Aurora', 'Anaheim', 'Honolulu', 'Santa Ana', 'Corpus Christi', 'Riverside', 'Lexington', 'Stockton',
+    'Henderson', 'Saint Paul', 'St. Louis', 'Fort Wayne', 'Jersey City', 'Chandler', 'Madison', 'Lubbock', 'Scottsdale', 'Reno',
+    'Buffalo', 'Gilbert', 'Glendale', 'North Las Vegas', 'Winston-Salem', 'Chesapeake', 'Norfolk', 'Fremont', 'Garland', 'Irving',
+    'Hialeah', 'Richmond', 'Boise', 'Spokane', 'Baton Rouge', 'Tacoma', 'San Bernardino', 'Grand Rapids', 'Huntsville', 'Salt Lake City',
+    'Frisco', 'Cary', 'Yonkers', 'Amarillo', 'Glendale', 'McKinney', 'Montgomery', 'Aurora', 'Akron', 'Little Rock',
+    'Oxnard', 'Amarillo', 'Knoxville', 'Garden Grove', 'Newport News', 'Huntsville', 'Tempe', 'Cape Coral', 'Santa Clarita', 'Providence',
+    'Overland Park', 'Jackson', 'Elk Grove', 'Springfield', 'Pembroke Pines', 'Salem', 'Corona', 'Eugene', 'McKinney', 'Fort Collins',
+    'Lancaster', 'Cary', 'Palmdale', 'Hayward', 'Salinas', 'Frisco', 'Springfield', 'Pasadena', 'Macon', 'Alexandria',
+    'Pomona', 'Hollywood', 'Sunnyvale', 'Escondido', 'Kansas City', 'Pasadena', 'Torrance', 'Syracuse', 'Naperville', 'Dayton',
+    'Savannah', 'Mesquite', 'Orange', 'Fullerton', 'Killeen', 'McAllen', 'Joliet', 'Rockford', 'Paterson', 'Bridgeport',
+    'Naperville', 'Laredo', 'Hampton', 'West Valley City', 'Warren', 'Gilbert', 'St. Louis', 'Las Vegas', 'Chandler', 'Scottsdale',
+    'London', 'Londres', 'Paris', 'Berlin', 'Madrid', 'Rome', 'Amsterdam', 'Brussels', 'Vienna', 'Prague', 'Budapest',
+    'Warsaw', 'Stockholm', 'Copenhagen', 'Oslo', 'Helsinki', 'Dublin', 'Edinburgh', 'Glasgow', 'Manchester', 'Birmingham',
+    'Liverpool', 'Leeds', 'Sheffield', 'Bristol', 'Cardiff', 'Belfast', 'Newcastle', 'Leicester', 'Nottingham', 'Southampton',
+    'Toronto', 'Montreal', 'Vancouver', 'Calgary', 'Edmonton', 'Ottawa', 'Winnipeg', 'Quebec City', 'Hamilton', 'Kitchener',
+    'Mexico City', 'Guadalajara', 'Monterrey', 'Puebla', 'Tijuana', 'Ciudad Juarez', 'Leon', 'Zapopan', 'Aguascalientes', 'Merida',
+    'Buenos Aires', 'Cordoba', 'Rosario', 'Mendoza', 'La Plata', 'San Miguel de Tucuman', 'Mar del Plata', 'Salta', 'Santa Fe', 'San Juan',
+    'Sao Paulo', 'Rio de Janeiro', 'Brasilia', 'Salvador', 'Fortaleza', 'Belo Horizonte', 'Manaus', 'Curitiba', 'Recife', 'Porto Alegre',
+    'Barcelona', 'Valencia', 'Seville', 'Zaragoza', 'Malaga', 'Murcia', 'Palma', 'Las Palmas', 'Bilbao', 'Alicante',
+    'Milan', 'Naples', 'Turin', 'Palermo', 'Genoa', 'Bologna', 'Florence', 'Bari', 'Catania', 'Venice',
+    'Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide', 'Gold Coast', 'Newcastle', 'Canberra', 'Sunshine Coast', 'Wollongong',
+    'Manhattan', 'Cambridge Bay', 'Islas Marianas', 'Guam', 'CNMI', 'Hawái', 'Oregón', 'Hungría'
+]
+
+# Casos especiales como EE.UU., que se aplican por separado y antes que el resto
+SPECIAL_CASES = ['EE.UU.', 'EE. UU.', 'EEUU', 'EE UU']
+
+
+@lru_cache(maxsize=None)
+def _entity_patterns():
+    """(casos especiales, patrón del resto), compilados una sola vez y solo cuando se usan"""
+    all_entities = COUNTRIES + US_STATES + MAJOR_CITIES
+    special = [(re.compile(r'(?<!\w)' + re.escape(case) + r'(?!\w)', re.IGNORECASE), r'<strong>' + case + r'</strong>')
+               for case in SPECIAL_CASES if case in all_entities]
+    regular_entities = [entity for entity in all_entities if entity not in SPECIAL_CASES]
+    pattern = None
+    if regular_entities:
+        pattern = re.compile(r'\b(' + '|'.join(re.escape(entity) for entity in regular_entities) + r')\b', re.IGNORECASE)
+    return special, pattern
+
+
 def highlight_countries(text: str | None) -> str | None:
     """Resalta nombres de países, estados americanos y ciudades principales en el texto haciéndolos negrita"""
-    import re
     if not text:
         return text
-    
-    # Países en español e inglés
-    countries = [
-        'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
-        'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
-        'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
-        'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
-        'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
-        'Fiji', 'Finland', 'France',
-        'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
-        'Haiti', 'Honduras', 'Hungary',
-        'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
-        'Jamaica', 'Japan', 'Jordan',
-        'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
-        'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
-        'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
-        'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
-        'Oman',
-        'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
-        'Qatar',
-        'Romania', 'Russia', 'Rwanda',
-        'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
-        'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
-        'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
-        'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
-        'Yemen',
-        'Zambia', 'Zimbabwe',
-        # Nombres en español
-        'Francia', 'Alemania', 'Italia', 'España', 'Reino Unido', 'Estados Unidos', 'Canadá', 'México', 'Brasil', 'Argentina', 'Chile', 'Perú', 'Colombia', 'Venezuela', 'Ecuador', 'Bolivia', 'Paraguay', 'Uruguay', 'Guyana', 'Surinam', 'Guayana Francesa', 'Islas Malvinas', 'Georgia del Sur', 'Islas Sandwich del Sur', 'Antártida', 'Groenlandia', 'Islandia', 'Noruega', 'Suecia', 'Finlandia', 'Dinamarca', 'Países Bajos', 'Bélgica', 'Luxemburgo', 'Suiza', 'Austria', 'Liechtenstein', 'Mónaco', 'Andorra', 'San Marino', 'Vaticano', 'Malta', 'Chipre', 'Grecia', 'Albania', 'Macedonia del Norte', 'Kosovo', 'Serbia', 'Montenegro', 'Bosnia y Herzegovina', 'Croacia', 'Eslovenia', 'Hungría', 'Eslovaquia', 'República Checa', 'Polonia', 'Lituania', 'Letonia', 'Estonia', 'Bielorrusia', 'Ucrania', 'Moldavia', 'Rumania', 'Bulgaria', 'Turquía', 'Georgia', 'Armenia', 'Azerbaiyán', 'Rusia', 'Kazajistán', 'Uzbekistán', 'Turkmenistán', 'Kirguistán', 'Tayikistán', 'Afganistán', 'Pakistán', 'India', 'Nepal', 'Bután', 'Bangladés', 'Sri Lanka', 'Maldivas', 'China', 'Mongolia', 'Corea del Norte', 'Corea del Sur', 'Japón', 'Taiwán', 'Filipinas', 'Vietnam', 'Laos', 'Camboya', 'Tailandia', 'Myanmar', 'Malasia', 'Singapur', 'Brunéi', 'Indonesia', 'Timor Oriental', 'Papúa Nueva Guinea', 'Australia', 'Nueva Zelanda', 'Fiyi', 'Vanuatu', 'Nueva Caledonia', 'Islas Salomón', 'Tuvalu', 'Kiribati', 'Nauru', 'Palaos', 'Micronesia', 'Islas Marshall', 'Polinesia Francesa', 'Samoa', 'Tonga', 'Niue', 'Islas Cook', 'Tokelau', 'Wallis y Futuna', 'Pitcairn', 'Isla de Pascua', 'Hawai', 'Alaska', 'Canadá', 'Estados Unidos', 'México', 'Guatemala', 'Belice', 'El Salvador', 'Honduras', 'Nicaragua', 'Costa Rica', 'Panamá', 'Cuba', 'Jamaica', 'Haití', 'República Dominicana', 'Puerto Rico', 'Bahamas', 'Antigua y Barbuda', 'San Cristóbal y Nieves', 'Dominica', 'Santa Lucía', 'San Vicente y las Granadinas', 'Granada', 'Barbados', 'Trinidad y Tobago', 'Guyana', 'Surinam', 'Brasil', 'Venezuela', 'Colombia', 'Ecuador', 'Perú', 'Bolivia', 'Paraguay', 'Uruguay', 'Argentina', 'Chile', 'Islas Malvinas', 'Georgia del Sur', 'Antártida',
-        # Abreviaciones comunes
-        'EE.UU.', 'EE. UU.', 'EEUU', 'UE', 'EE UU'
-    ]
-    
-    # Estados americanos
-    us_states = [
-        'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia',
-        'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland',
-        'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey',
-        'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
-        'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'
-    ]
-    
-    # Ciudades principales
-    major_cities = [
-        'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose',
-        'Austin', 'Jacksonville', 'Fort Worth', 'Columbus', 'Charlotte', 'San Francisco', 'Indianapolis', 'Seattle', 'Denver', 'Washington',
-        'Boston', 'El Paso', 'Nashville', 'Detroit', 'Oklahoma City', 'Portland', 'Las Vegas', 'Memphis', 'Louisville', 'Baltimore',
-        'Milwaukee', 'Albuquerque', 'Tucson', 'Fresno', 'Sacramento', 'Atlanta', 'Kansas City', 'Long Beach', 'Colorado Springs', 'Raleigh',
-        'Miami', 'Virginia Beach', 'Omaha', 'Oakland', 'Minneapolis', 'Tulsa', 'Tampa', 'Arlington', 'New Orleans', 'Wichita',
-        'Cleveland', 'Bakersfield', 'Aurora', 'Anaheim', 'Honolulu', 'Santa Ana', 'Corpus Christi', 'Riverside', 'Lexington', 'Stockton',
-        'Henderson', 'Saint Paul', 'St. Louis', 'Fort Wayne', 'Jersey City', 'Chandler', 'Madison', 'Lubbock', 'Scottsdale', 'Reno',
-        'Buffalo', 'Gilbert', 'Glendale', 'North Las Vegas', 'Winston-Salem', 'Chesapeake', 'Norfolk', 'Fremont', 'Garland', 'Irving',
-        'Hialeah', 'Richmond', 'Boise', 'Spokane', 'Baton Rouge', 'Tacoma', 'San Bernardino', 'Grand Rapids', 'Huntsville', 'Salt Lake City',
-        'Frisco', 'Cary', 'Yonkers', 'Amarillo', 'Glendale', 'McKinney', 'Montgomery', 'Aurora', 'Akron', 'Little Rock',
-        'Oxnard', 'Amarillo', 'Knoxville', 'Garden Grove', 'Newport News', 'Huntsville', 'Tempe', 'Cape Coral', 'Santa Clarita', 'Providence',
-        'Overland Park', 'Jackson', 'Elk Grove', 'Springfield', 'Pembroke Pines', 'Salem', 'Corona', 'Eugene', 'McKinney', 'Fort Collins',
-        'Lancaster', 'Cary', 'Palmdale', 'Hayward', 'Salinas', 'Frisco', 'Springfield', 'Pasadena', 'Macon', 'Alexandria',
-        'Pomona', 'Hollywood', 'Sunnyvale', 'Escondido', 'Kansas City', 'Pasadena', 'Torrance', 'Syracuse', 'Naperville', 'Dayton',
-        'Savannah', 'Mesquite', 'Orange', 'Fullerton', 'Killeen', 'McAllen', 'Joliet', 'Rockford', 'Paterson', 'Bridgeport',
-        'Naperville', 'Laredo', 'Hampton', 'West Valley City', 'Warren', 'Gilbert', 'St. Louis', 'Las Vegas', 'Chandler', 'Scottsdale',
-        'London', 'Londres', 'Paris', 'Berlin', 'Madrid', 'Rome', 'Amsterdam', 'Brussels', 'Vienna', 'Prague', 'Budapest',
-        'Warsaw', 'Stockholm', 'Copenhagen', 'Oslo', 'Helsinki', 'Dublin', 'Edinburgh', 'Glasgow', 'Manchester', 'Birmingham',
-        'Liverpool', 'Leeds', 'Sheffield', 'Bristol', 'Cardiff', 'Belfast', 'Newcastle', 'Leicester', 'Nottingham', 'Southampton',
-        'Toronto', 'Montreal', 'Vancouver', 'Calgary', 'Edmonton', 'Ottawa', 'Winnipeg', 'Quebec City', 'Hamilton', 'Kitchener',
-        'Mexico City', 'Guadalajara', 'Monterrey', 'Puebla', 'Tijuana', 'Ciudad Juarez', 'Leon', 'Zapopan', 'Aguascalientes', 'Merida',
-        'Buenos Aires', 'Cordoba', 'Rosario', 'Mendoza', 'La Plata', 'San Miguel de Tucuman', 'Mar del Plata', 'Salta', 'Santa Fe', 'San Juan',
-        'Sao Paulo', 'Rio de Janeiro', 'Brasilia', 'Salvador', 'Fortaleza', 'Belo Horizonte', 'Manaus', 'Curitiba', 'Recife', 'Porto Alegre',
-        'Barcelona', 'Valencia', 'Seville', 'Zaragoza', 'Malaga', 'Murcia', 'Palma', 'Las Palmas', 'Bilbao', 'Alicante',
-        'Milan', 'Naples', 'Turin', 'Palermo', 'Genoa', 'Bologna', 'Florence', 'Bari', 'Catania', 'Venice',
-        'Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide', 'Gold Coast', 'Newcastle', 'Canberra', 'Sunshine Coast', 'Wollongong',
-        'Manhattan', 'Cambridge Bay', 'Islas Marianas', 'Guam', 'CNMI', 'Hawái', 'Oregón', 'Hungría'
-    ]
-    
-    # Combinar todas las entidades geográficas
-    all_entities = countries + us_states + major_cities
-    
-    # Crear patrón regex más robusto
-    # Manejar casos especiales como EE.UU. por separado
-    special_cases = ['EE.UU.', 'EE. UU.', 'EEUU', 'EE UU']
-    regular_entities = [entity for entity in all_entities if entity not in special_cases]
-    
-    # Aplicar primero los casos especiales
-    for special in special_cases:
-        if special in all_entities:
-            special_pattern = r'(?<!\w)' + re.escape(special) + r'(?!\w)'
-            text = re.sub(special_pattern, r'<strong>' + special + r'</strong>', text, flags=re.IGNORECASE)
-    
-    # Luego aplicar el patrón normal para el resto
-    if regular_entities:
-        pattern = r'\b(' + '|'.join(re.escape(entity) for entity in regular_entities) + r')\b'
-        text = re.sub(pattern, r'<strong>\1</strong>', text, flags=re.IGNORECASE)
-    
-    highlighted_text = text
-    
-    return highlighted_text
+
+    special, pattern = _entity_patterns()
+    # Aplicar primero los casos especiales, luego el patrón normal para el resto
+    for special_pattern, replacement in special:
+        text = special_pattern.sub(replacement, text)
+    if pattern is not None:
+        text = pattern.sub(r'<strong>\1</strong>', text)
+    return text
 
 
 def create_google_search_url(headline: str, original_url: str) -> str:
     """Crea URL de búsqueda en Google usando el slug de la URL si existe"""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url or '')
         path_parts = (parsed.path or '').strip('/').split('/')
         slug = path_parts[-1] if path_parts and path_parts[-1] else ''
@@ -211,24 +217,8 @@ def generate_jurisdiction_chart(data: dict) -> str:
     if not jurisdiction_distribution:
         return ""
     
-    # Mapeo de códigos de región a nombres completos
-    region_mapping = {
-        'US': 'Estados Unidos',
-        'UK': 'Reino Unido', 
-        'EU': 'Unión Europea',
-        'CA': 'Canadá',
-        'Global': 'Global'
-    }
-    
-    # Convertir los datos a una lista ordenada
-    jurisdiction_items = []
-    for region, count in jurisdiction_distribution.items():
-        region_name = region_mapping.get(region, region)
-        jurisdiction_items.append((region_name, count))
-    
-    # Ordenar por count descendente
-    jurisdiction_items.sort(key=lambda x: x[1], reverse=True)
-    top_jurisdictions = jurisdiction_items[:8]
+    # Unificar variantes de una misma jurisdicción (US, EE.UU., Estados Unidos)
+    top_jurisdictions = canonical_counts(jurisdiction_distribution.items(), lang='es')[:8]
     
     if not top_jurisdictions:
         return ""
@@ -261,7 +251,7 @@ def generate_jurisdiction_chart(data: dict) -> str:
     return chart_html
 
 
-def generate_meta_html(data: dict) -> str:
+def generate_meta_html(data: dict, counts=None) -> str:
     """Genera HTML de analytics con gráficos y métricas"""
     
     metadata = data.get('metadata', {})
@@ -276,23 +266,10 @@ def generate_meta_html(data: dict) -> str:
     jurisdiction_distribution = coverage_analysis.get('jurisdiction_distribution', {})
     score_distribution = content_metrics.get('score_distribution', {})
     
-    # Recolectar tags secundarios
-    all_secondary_tags = []
-    for item in items:
-        secondary_tags = item.get('classification', {}).get('secondary_tags', [])
-        all_secondary_tags.extend(secondary_tags)
-    
-    tag_counts = Counter(all_secondary_tags)
-    top_tags = tag_counts.most_common(10)
-    
-    # Recolectar instrumentos
-    all_instruments = []
-    for item in items:
-        instruments = item.get('classification', {}).get('instruments', [])
-        all_instruments.extend(instruments)
-    
-    instrument_counts = Counter(all_instruments)
-    top_instruments = instrument_counts.most_common(8)
+    # Conteos desde la caché columnar o, si no, desde una sola pasada por los items
+    counts = counts if counts is not None else ItemAggregate(items)
+    top_tags = counts.most_common('secondary_tag', 10)
+    top_instruments = counts.most_common('instrument', 8)
     
     html = f"""<!DOCTYPE html>
 <html lang="es">
@@ -1052,8 +1029,8 @@ def generate_original_html(data: dict) -> str:
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python json_to_html_converter_artlaw.py <archivo_json>")
+    if len(sys.argv) not in (2, 3):
+        print("Uso: python json_to_html_converter_artlaw.py <archivo_json> [directorio_salida]")
         print("Ejemplo: python json_to_html_converter_artlaw.py artlaw_digest.json")
         sys.exit(1)
 
@@ -1062,28 +1039,34 @@ def main():
     
     # Cargar datos JSON
     data = load_json_data(json_file)
+    # Sin caché columnar, una sola pasada por los items alimenta el dashboard y los analytics
+    columns = load_columns(json_file)
+    counts = ItemAggregate(data.get('items', []), lang='es') if columns is None else None
+    # Mostrar analytics recalculados desde los items, no los conteos embebidos
+    data['analytics'] = effective_analytics(data.get('analytics'),
+                                            cached_analytics(json_file, data, lang='es', aggregate=counts))
     
     # Generar ambos archivos HTML
     original_html = generate_original_html(data)
-    meta_html = generate_meta_html(data)
+    meta_html = generate_meta_html(data, columns if columns is not None else counts)
     
     # Crear directorio de salida si no existe
-    output_dir = Path("docs/art-law/issues")
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("docs/art-law/issues")
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Escribir archivos HTML en la carpeta correcta
     original_output = output_dir / f"{base_name}.html"
     meta_output = output_dir / f"{base_name}_meta.html"
     
-    with open(original_output, 'w', encoding='utf-8') as f:
-        f.write(original_html)
-    
-    with open(meta_output, 'w', encoding='utf-8') as f:
-        f.write(meta_html)
+    block = issue_metadata(data, 'art-law', base_name, 'es')
+    written = write_outputs({original_output: embed_issue_metadata(original_html, block),
+                             meta_output: embed_issue_metadata(meta_html, block)})
     
     print(f"✅ Archivos HTML generados exitosamente:")
     print(f"   📄 Digest original: {original_output}")
     print(f"   📊 Dashboard de analytics: {meta_output}")
+    if not written:
+        print("   ♻️  Sin cambios: los archivos ya estaban al día")
     print(f"📈 Procesados {len(data.get('items', []))} ítems")
     print(f"🔍 Usando fallback de Google para URLs")
     print(f"📁 Archivos guardados en: {output_dir}")
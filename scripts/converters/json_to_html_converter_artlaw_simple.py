@@ -5,17 +5,21 @@ Convierte datos JSON estructurados a HTML con marca Kepler Karst.
 """
 
 import json
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote
 
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_archive import read_report
+from output_files import write_if_changed
+
 
 def load_json_data(json_file: str):
     """Cargar datos JSON desde archivo"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo {json_file}")
         sys.exit(1)
@@ -26,7 +30,6 @@ def load_json_data(json_file: str):
 
 def clean_text(text: str | None) -> str | None:
     """Limpia texto removiendo referencias y artefactos frecuentes"""
-    import re
     if not text:
         return text
     text = re.sub(r'【[^】]*】', '', text)
@@ -193,7 +196,7 @@ def generate_html(data: dict) -> str:
         <section class="tldr">
             <h2>Resumen</h2>
             <p>{clean_text(summary_text)}</p>
-            {f"<ul>{''.join(f'<li>{clean_text(str(b or ''))}</li>' for b in annual_bullets if b)}</ul>" if annual_bullets else ""}
+            {f"<ul>{''.join(f'<li>{clean_text(str(b))}</li>' for b in annual_bullets if b)}</ul>" if annual_bullets else ""}
         </section>
 
         <section class="items">
@@ -255,8 +258,8 @@ def generate_html(data: dict) -> str:
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python json_to_html_converter_artlaw_simple.py <archivo_json>")
+    if len(sys.argv) not in (2, 3):
+        print("Uso: python json_to_html_converter_artlaw_simple.py <archivo_json> [directorio_salida]")
         print("Ejemplo: python json_to_html_converter_artlaw_simple.py arte_derecho_report_2025_08_20_cl.json")
         sys.exit(1)
 
@@ -270,14 +273,13 @@ def main():
     html = generate_html(data)
     
     # Crear directorio de salida si no existe
-    output_dir = Path("docs/art-law/issues")
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("docs/art-law/issues")
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Escribir archivo HTML
     output_file = output_dir / f"{base_name}.html"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_if_changed(output_file, embed_issue_metadata(html, issue_metadata(data, 'art-law', base_name, 'es')))
     
     print(f"✅ Archivo HTML generado exitosamente:")
     print(f"   📄 Digest: {output_file}")
@@ -6,17 +6,22 @@ Generates two files: original digest and meta analytics
 """
 
 import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote
-from collections import Counter
+from urllib.parse import quote, urlparse
+
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_analytics import ItemAggregate, cached_analytics, effective_analytics
+from item_archive import read_report
+from output_files import write_outputs
 
 def load_json_data(json_file):
     """Load JSON data from file"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except FileNotFoundError:
         print(f"Error: File {json_file} not found")
         sys.exit(1)
@@ -26,7 +31,6 @@ def load_json_data(json_file):
 
 def clean_text(text):
     """Clean text by removing citation references and other artifacts"""
-    import re
     if not text:
         return text
     
@@ -39,43 +43,44 @@ def clean_text(text):
     
     return text
 
+# Countries that highlight_countries makes bold
+COUNTRIES = [
+    'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
+    'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
+    'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
+    'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
+    'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
+    'Fiji', 'Finland', 'France',
+    'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
+    'Haiti', 'Honduras', 'Hungary',
+    'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
+    'Jamaica', 'Japan', 'Jordan',
+    'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
+    'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
+    'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
+    'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
+    'Oman',
+    'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
+    'Qatar',
+    'Romania', 'Russia', 'Rwanda',
+    'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
+    'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
+    'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
+    'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
+    'Yemen',
+    'Zambia', 'Zimbabwe'
+]
+
+@lru_cache(maxsize=None)
+def _country_pattern():
+    """Country-name regex, compiled once on first use"""
+    return re.compile(r'\b(' + '|'.join(re.escape(country) for country in COUNTRIES) + r')\b', re.IGNORECASE)
+
 def highlight_countries(text):
     """Highlight country names in text by making them bold"""
-    import re
     if not text:
         return text
-    
-    countries = [
-        'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola', 'Antigua and Barbuda', 'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
-        'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan', 'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
-        'Cambodia', 'Cameroon', 'Canada', 'Cape Verde', 'Central African Republic', 'Chad', 'Chile', 'China', 'Colombia', 'Comoros', 'Congo', 'Costa Rica', 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
-        'Democratic Republic of the Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic',
-        'East Timor', 'Ecuador', 'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia',
-        'Fiji', 'Finland', 'France',
-        'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea', 'Guinea-Bissau', 'Guyana',
-        'Haiti', 'Honduras', 'Hungary',
-        'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Ivory Coast',
-        'Jamaica', 'Japan', 'Jordan',
-        'Kazakhstan', 'Kenya', 'Kiribati', 'Kuwait', 'Kyrgyzstan',
-        'Laos', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
-        'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta', 'Marshall Islands', 'Mauritania', 'Mauritius', 'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar',
-        'Namibia', 'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Korea', 'North Macedonia', 'Norway',
-        'Oman',
-        'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines', 'Poland', 'Portugal',
-        'Qatar',
-        'Romania', 'Russia', 'Rwanda',
-        'Saint Kitts and Nevis', 'Saint Lucia', 'Saint Vincent and the Grenadines', 'Samoa', 'San Marino', 'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore', 'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Korea', 'South Sudan', 'Spain', 'Sri Lanka', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
-        'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia', 'Turkey', 'Turkmenistan', 'Tuvalu',
-        'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
-        'Vanuatu', 'Vatican City', 'Venezuela', 'Vietnam',
-        'Yemen',
-        'Zambia', 'Zimbabwe'
-    ]
-    
-    pattern = r'\b(' + '|'.join(re.escape(country) for country in countries) + r')\b'
-    highlighted_text = re.sub(pattern, r'<strong>\1</strong>', text, flags=re.IGNORECASE)
-    
-    return highlighted_text
+    return _country_pattern().sub(r'<strong>\1</strong>', text)
 
 def get_smart_url(headline, original_url):
     """Get original URL, Google search URL, and Google Lucky URL"""
@@ -86,12 +91,9 @@ def get_smart_url(headline, original_url):
 
 def create_google_search_url(headline, original_url):
     """Create a Google search URL using the URL slug instead of full headline"""
-    import re
-    
     domain = ""
     slug = ""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url)
         domain = parsed.netloc
         path_parts = parsed.path.strip('/').split('/')
@@ -107,12 +109,9 @@ def create_google_search_url(headline, original_url):
 
 def create_google_lucky_url(headline, original_url):
     """Create a Google 'I'm Feeling Lucky' URL that goes directly to the first result"""
-    import re
-    
     domain = ""
     slug = ""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url)
         domain = parsed.netloc
         path_parts = parsed.path.strip('/').split('/')
@@ -126,6 +125,12 @@ def create_google_lucky_url(headline, original_url):
     
     return f"https://www.google.com/search?q={encoded_search}&btnI"
 
+MONTHS = {
+    '01': 'January', '02': 'February', '03': 'March', '04': 'April',
+    '05': 'May', '06': 'June', '07': 'July', '08': 'August',
+    '09': 'September', '10': 'October', '11': 'November', '12': 'December'
+}
+
 def format_date_for_display(date_str):
     """Convert date from DD-MM-YYYY format to DD Month YYYY format"""
     if not date_str or date_str == 'DD-MM-YYYY':
@@ -133,34 +138,15 @@ def format_date_for_display(date_str):
     
     try:
         day, month, year = date_str.split('-')
-        months = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        month_name = months.get(month, month)
+        month_name = MONTHS.get(month, month)
         return f"{day} {month_name} {year}"
     except:
         return date_str
 
-def generate_country_chart(items):
+def generate_country_chart(counts):
     """Generate a simple HTML/CSS chart showing country distribution"""
-    country_counts = Counter()
-    for item in items:
-        countries = item.get('countries', [])
-        if countries:
-            # Handle both single country and multiple countries
-            if isinstance(countries, list):
-                country_name = countries[0]  # Take first country
-            else:
-                country_name = countries
-            
-            if len(country_name) <= 3 or country_name == 'GLOBAL':
-                continue
-                
-            country_counts[country_name] += 1
-    
-    top_countries = country_counts.most_common(8)
+    # First canonical country of each item (Global excluded), counted by ItemAggregate
+    top_countries = counts.most_common('primary_country', 8)
     
     if not top_countries:
         return ""
@@ -222,7 +208,7 @@ def _score_bucket_sort_key(label):
     # Fallback to ensure deterministic order
     return (3, 0)
 
-def generate_meta_html(data):
+def generate_meta_html(data, counts=None):
     """Generate meta analytics HTML with charts and metrics"""
     
     metadata = data.get('metadata', {})
@@ -232,29 +218,10 @@ def generate_meta_html(data):
     thematic_breakdown = analytics.get('thematic_breakdown', {})
     source_tier_distribution = analytics.get('source_tier_distribution', {})
     
-    # Collect categories from items
-    all_categories = []
-    for item in items:
-        categories = item.get('categories', [])
-        if isinstance(categories, list):
-            all_categories.extend(categories)
-        elif categories:
-            all_categories.append(categories)
-    
-    category_counts = Counter(all_categories)
-    top_categories = category_counts.most_common(10)
-    
-    # Collect innovation elements
-    all_innovation_elements = []
-    for item in items:
-        innovation_elements = item.get('innovation_elements', [])
-        if isinstance(innovation_elements, list):
-            all_innovation_elements.extend(innovation_elements)
-        elif innovation_elements:
-            all_innovation_elements.append(innovation_elements)
-    
-    innovation_counts = Counter(all_innovation_elements)
-    top_innovations = innovation_counts.most_common(8)
+    # Categories and innovation elements from a single pass over the items
+    counts = counts if counts is not None else ItemAggregate(items)
+    top_categories = counts.most_common('category', 10)
+    top_innovations = counts.most_common('innovation', 8)
     
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -602,12 +569,13 @@ def generate_meta_html(data):
 
     return html
 
-def generate_original_html(data):
+def generate_original_html(data, counts=None):
     """Generate the original HTML digest for CL format"""
     
     metadata = data.get('metadata', {})
     executive_summary = data.get('executive_summary', {})
     items = data.get('items', [])
+    counts = counts if counts is not None else ItemAggregate(items)
     analytics = data.get('analytics', {})
     discarded_items = data.get('discarded_items', [])
     
@@ -970,7 +938,7 @@ def generate_original_html(data):
             </div>
         </section>
 
-        {generate_country_chart(items)}
+        {generate_country_chart(counts)}
 
         <section class="items">
 """
@@ -1047,8 +1015,8 @@ def generate_original_html(data):
 
 def main():
     """Main function"""
-    if len(sys.argv) != 2:
-        print("Usage: python json_to_html_converter_cl.py <json_file>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python json_to_html_converter_cl.py <json_file> [output_dir]")
         print("Example: python json_to_html_converter_cl.py weekly_digest.json")
         sys.exit(1)
     
@@ -1058,23 +1026,29 @@ def main():
     # Load JSON data
     data = load_json_data(json_file)
     
-    # Generate both HTML files
-    original_html = generate_original_html(data)
-    meta_html = generate_meta_html(data)
-    
-    # Write HTML files
-    original_output = f"{base_name}.html"
-    meta_output = f"{base_name}_meta.html"
+    # Generate both HTML files from one pass over the items
+    counts = ItemAggregate(data.get('items', []))
+    # Render analytics recomputed from the items (under the schema's flat key names)
+    computed = cached_analytics(json_file, data, aggregate=counts)
+    data['analytics'] = effective_analytics(data.get('analytics'), computed, flat=True)
+    original_html = generate_original_html(data, counts)
+    meta_html = generate_meta_html(data, counts)
     
-    with open(original_output, 'w', encoding='utf-8') as f:
-        f.write(original_html)
+    # Write HTML files (to the current directory unless an output directory is given)
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path('.')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    original_output = output_dir / f"{base_name}.html"
+    meta_output = output_dir / f"{base_name}_meta.html"
     
-    with open(meta_output, 'w', encoding='utf-8') as f:
-        f.write(meta_html)
+    block = issue_metadata(data, 'sovereign-debt', base_name, 'en')
+    written = write_outputs({original_output: embed_issue_metadata(original_html, block),
+                             meta_output: embed_issue_metadata(meta_html, block)})
     
     print(f"✅ HTML files generated successfully:")
     print(f"   📄 Original digest: {original_output}")
     print(f"   📊 Analytics dashboard: {meta_output}")
+    if not written:
+        print("   ♻️  Unchanged: both files were already up to date")
     print(f"📈 Processed {len(data.get('items', []))} items")
     print(f"🔍 Using Google search fallback for URLs")
 
@@ -9,18 +9,25 @@ Uso:
 """
 
 import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote
-from collections import Counter
+from urllib.parse import quote, urlparse
+
+from entities import canonical_counts
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_analytics import ItemAggregate, cached_analytics, effective_analytics
+from item_archive import read_report
+from item_columns import load_columns
+from output_files import write_outputs
 
 
 def load_json_data(json_file: str):
     """Cargar datos JSON desde archivo"""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo {json_file}")
         sys.exit(1)
@@ -31,7 +38,6 @@ def load_json_data(json_file: str):
 
 def clean_text(text: str | None) -> str | None:
     """Limpia texto removiendo referencias y artefactos frecuentes"""
-    import re
     if not text:
         return text
     text = re.sub(r'【[^】]*】', '', text)
@@ -41,46 +47,47 @@ def clean_text(text: str | None) -> str | None:
     return text
 
 
+# Países principales para data governance
+COUNTRIES = [
+    'United States', 'United Kingdom', 'European Union', 'Canada', 'Brazil', 'Australia', 'Japan', 'South Korea',
+    'India', 'China', 'Singapore', 'Switzerland', 'Norway', 'Iceland', 'Liechtenstein', 'New Zealand',
+    'Estados Unidos', 'Reino Unido', 'Unión Europea', 'Canadá', 'Brasil', 'Australia', 'Japón', 'Corea del Sur',
+    'India', 'China', 'Singapur', 'Suiza', 'Noruega', 'Islandia', 'Liechtenstein', 'Nueva Zelanda'
+]
+
+# Estados americanos principales
+US_STATES = [
+    'California', 'New York', 'Texas', 'Florida', 'Illinois', 'Pennsylvania', 'Ohio', 'Georgia',
+    'North Carolina', 'Michigan', 'New Jersey', 'Virginia', 'Washington', 'Arizona', 'Massachusetts'
+]
+
+# Ciudades principales de tech
+MAJOR_CITIES = [
+    'San Francisco', 'Silicon Valley', 'Seattle', 'Austin', 'New York', 'Boston', 'Los Angeles',
+    'Chicago', 'Washington DC', 'Atlanta', 'Denver', 'Portland', 'Miami', 'Dallas', 'Houston',
+    'London', 'Paris', 'Berlin', 'Amsterdam', 'Brussels', 'Dublin', 'Stockholm', 'Copenhagen',
+    'Toronto', 'Vancouver', 'Montreal', 'São Paulo', 'Rio de Janeiro', 'Sydney', 'Melbourne',
+    'Tokyo', 'Seoul', 'Singapore', 'Hong Kong', 'Mumbai', 'Bangalore', 'New Delhi'
+]
+
+
+@lru_cache(maxsize=None)
+def _entity_pattern():
+    """Patrón de todas las entidades, compilado una sola vez y solo cuando se usa"""
+    all_entities = COUNTRIES + US_STATES + MAJOR_CITIES
+    return re.compile(r'\b(' + '|'.join(re.escape(entity) for entity in all_entities) + r')\b', re.IGNORECASE)
+
+
 def highlight_countries(text: str | None) -> str | None:
     """Resalta nombres de países, estados americanos y ciudades principales en el texto"""
-    import re
     if not text:
         return text
-    
-    # Países principales para data governance
-    countries = [
-        'United States', 'United Kingdom', 'European Union', 'Canada', 'Brazil', 'Australia', 'Japan', 'South Korea',
-        'India', 'China', 'Singapore', 'Switzerland', 'Norway', 'Iceland', 'Liechtenstein', 'New Zealand',
-        'Estados Unidos', 'Reino Unido', 'Unión Europea', 'Canadá', 'Brasil', 'Australia', 'Japón', 'Corea del Sur',
-        'India', 'China', 'Singapur', 'Suiza', 'Noruega', 'Islandia', 'Liechtenstein', 'Nueva Zelanda'
-    ]
-    
-    # Estados americanos principales
-    us_states = [
-        'California', 'New York', 'Texas', 'Florida', 'Illinois', 'Pennsylvania', 'Ohio', 'Georgia',
-        'North Carolina', 'Michigan', 'New Jersey', 'Virginia', 'Washington', 'Arizona', 'Massachusetts'
-    ]
-    
-    # Ciudades principales de tech
-    major_cities = [
-        'San Francisco', 'Silicon Valley', 'Seattle', 'Austin', 'New York', 'Boston', 'Los Angeles',
-        'Chicago', 'Washington DC', 'Atlanta', 'Denver', 'Portland', 'Miami', 'Dallas', 'Houston',
-        'London', 'Paris', 'Berlin', 'Amsterdam', 'Brussels', 'Dublin', 'Stockholm', 'Copenhagen',
-        'Toronto', 'Vancouver', 'Montreal', 'São Paulo', 'Rio de Janeiro', 'Sydney', 'Melbourne',
-        'Tokyo', 'Seoul', 'Singapore', 'Hong Kong', 'Mumbai', 'Bangalore', 'New Delhi'
-    ]
-    
-    all_entities = countries + us_states + major_cities
-    pattern = r'\b(' + '|'.join(re.escape(entity) for entity in all_entities) + r')\b'
-    highlighted_text = re.sub(pattern, r'<strong>\1</strong>', text, flags=re.IGNORECASE)
-    
-    return highlighted_text
+    return _entity_pattern().sub(r'<strong>\1</strong>', text)
 
 
 def create_google_search_url(headline: str, original_url: str) -> str:
     """Crea URL de búsqueda en Google usando el slug de la URL si existe"""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(original_url or '')
         path_parts = (parsed.path or '').strip('/').split('/')
         slug = path_parts[-1] if path_parts and path_parts[-1] else ''
@@ -133,22 +140,8 @@ def generate_jurisdiction_chart(data: dict) -> str:
     if not jurisdiction_distribution:
         return ""
     
-    region_mapping = {
-        'US': 'Estados Unidos',
-        'UK': 'Reino Unido', 
-        'EU': 'Unión Europea',
-        'CA': 'Canadá',
-        'BR': 'Brasil',
-        'Global': 'Global'
-    }
-    
-    jurisdiction_items = []
-    for region, count in jurisdiction_distribution.items():
-        region_name = region_mapping.get(region, region)
-        jurisdiction_items.append((region_name, count))
-    
-    jurisdiction_items.sort(key=lambda x: x[1], reverse=True)
-    top_jurisdictions = jurisdiction_items[:8]
+    # Unificar variantes de una misma jurisdicción (US, EE.UU., Estados Unidos)
+    top_jurisdictions = canonical_counts(jurisdiction_distribution.items(), lang='es')[:8]
     
     if not top_jurisdictions:
         return ""
@@ -181,7 +174,7 @@ def generate_jurisdiction_chart(data: dict) -> str:
     return chart_html
 
 
-def generate_meta_html(data: dict) -> str:
+def generate_meta_html(data: dict, counts=None) -> str:
     """Genera HTML de analytics con gráficos y métricas"""
     
     metadata = data.get('metadata', {})
@@ -195,21 +188,10 @@ def generate_meta_html(data: dict) -> str:
     jurisdiction_distribution = coverage_analysis.get('jurisdiction_distribution', {})
     score_distribution = content_metrics.get('score_distribution', {})
     
-    all_secondary_tags = []
-    for item in items:
-        secondary_tags = item.get('classification', {}).get('secondary_tags', [])
-        all_secondary_tags.extend(secondary_tags)
-    
-    tag_counts = Counter(all_secondary_tags)
-    top_tags = tag_counts.most_common(10)
-    
-    all_instruments = []
-    for item in items:
-        instruments = item.get('classification', {}).get('instruments', [])
-        all_instruments.extend(instruments)
-    
-    instrument_counts = Counter(all_instruments)
-    top_instruments = instrument_counts.most_common(8)
+    # Conteos desde la caché columnar o, si no, desde una sola pasada por los items
+    counts = counts if counts is not None else ItemAggregate(items)
+    top_tags = counts.most_common('secondary_tag', 10)
+    top_instruments = counts.most_common('instrument', 8)
     
     html = f"""<!DOCTYPE html>
 <html lang="es">
@@ -928,8 +910,8 @@ def generate_original_html(data: dict) -> str:
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python json_to_html_converter_datagovernance.py <archivo_json>")
+    if len(sys.argv) not in (2, 3):
+        print("Uso: python json_to_html_converter_datagovernance.py <archivo_json> [directorio_salida]")
         print("Ejemplo: python json_to_html_converter_datagovernance.py datagovernance_digest.json")
         sys.exit(1)
 
@@ -938,28 +920,34 @@ def main():
     
     # Cargar datos JSON
     data = load_json_data(json_file)
+    # Sin caché columnar, una sola pasada por los items alimenta el dashboard y los analytics
+    columns = load_columns(json_file)
+    counts = ItemAggregate(data.get('items', []), lang='es') if columns is None else None
+    # Mostrar analytics recalculados desde los items, no los conteos embebidos
+    data['analytics'] = effective_analytics(data.get('analytics'),
+                                            cached_analytics(json_file, data, lang='es', aggregate=counts))
     
     # Generar ambos archivos HTML
     original_html = generate_original_html(data)
-    meta_html = generate_meta_html(data)
+    meta_html = generate_meta_html(data, columns if columns is not None else counts)
     
     # Crear directorio de salida si no existe
-    output_dir = Path("docs/data-governance/issues")
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("docs/data-governance/issues")
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Escribir archivos HTML en la carpeta correcta
     original_output = output_dir / f"{base_name}.html"
     meta_output = output_dir / f"{base_name}_meta.html"
     
-    with open(original_output, 'w', encoding='utf-8') as f:
-        f.write(original_html)
-    
-    with open(meta_output, 'w', encoding='utf-8') as f:
-        f.write(meta_html)
+    block = issue_metadata(data, 'data-governance', base_name, 'es')
+    written = write_outputs({original_output: embed_issue_metadata(original_html, block),
+                             meta_output: embed_issue_metadata(meta_html, block)})
     
     print(f"✅ Archivos HTML generados exitosamente:")
     print(f"   📄 Digest original: {original_output}")
     print(f"   📊 Dashboard de analytics: {meta_output}")
+    if not written:
+        print("   ♻️  Sin cambios: los archivos ya estaban al día")
     print(f"📈 Procesados {len(data.get('items', []))} ítems")
     print(f"🔍 Usando fallback de Google para URLs")
     print(f"📁 Archivos guardados en: {output_dir}")
@@ -10,17 +10,23 @@ This script converts the merged JSON structure into HTML with:
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 from collections import Counter
 from typing import Dict, List, Any
 
+from entities import display_name
+from facet_index import FacetIndex
+from issue_metadata import embed_issue_metadata, issue_metadata
+from item_archive import read_report
+from output_files import write_outputs
+
 
 def load_json_data(json_file: str) -> Dict[str, Any]:
     """Load JSON data from file."""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_report(json_file)
     except Exception as e:
         print(f"Error loading JSON file: {e}")
         sys.exit(1)
@@ -38,7 +44,6 @@ def clean_text(text: str | None) -> str | None:
         text = text.replace('\\t', ' ')    # Tabs
         
         # Remove reference patterns comprehensively
-        import re
         # Remove all content between 【 and 】 brackets
         text = re.sub(r'【.*?】', '', text)
         # Remove numeric references in parentheses
@@ -67,14 +72,16 @@ def format_date_for_display(date_str: str) -> str:
     return date_str
 
 
+MONTHS = {
+    '01': 'Enero', '02': 'Febrero', '03': 'Marzo', '04': 'Abril',
+    '05': 'Mayo', '06': 'Junio', '07': 'Julio', '08': 'Agosto',
+    '09': 'Septiembre', '10': 'Octubre', '11': 'Noviembre', '12': 'Diciembre'
+}
+
+
 def get_month_name(month: str) -> str:
     """Get month name from number."""
-    months = {
-        '01': 'Enero', '02': 'Febrero', '03': 'Marzo', '04': 'Abril',
-        '05': 'Mayo', '06': 'Junio', '07': 'Julio', '08': 'Agosto',
-        '09': 'Septiembre', '10': 'Octubre', '11': 'Noviembre', '12': 'Diciembre'
-    }
-    return months.get(month, month)
+    return MONTHS.get(month, month)
 
 
 def extract_date_range_from_metadata(data: Dict[str, Any]) -> tuple[str, str]:
@@ -88,58 +95,60 @@ def extract_date_range_from_metadata(data: Dict[str, Any]) -> tuple[str, str]:
     return start_date, end_date
 
 
+# Define important entities to bold
+IMPORTANT_ENTITIES = [
+    # Countries
+    'España', 'Italia', 'Francia', 'Reino Unido', 'Estados Unidos', 'Australia', 
+    'Nueva Zelanda', 'Nigeria', 'Alemania', 'Holanda', 'Bélgica', 'Suiza',
+    # Regions
+    'Unión Europea', 'UE', 'EU', 'EE.UU.', 'EEUU',
+    # Cities
+    'Washington D.C.', 'Washington', 'Londres', 'París', 'Roma', 'Madrid', 
+    'Berlín', 'Ámsterdam', 'Bruselas', 'Ginebra', 'Nueva York', 'Los Ángeles',
+    # Cultural/Historical
+    'Holocausto', 'Nazi', 'Benín', 'Mesopotámica', 'Africana',
+    # Institutions
+    'UNESCO', 'UNIDROIT', 'Congreso estadounidense', 'Casa Blanca', 'Smithsonian',
+    'TJUE', 'ICOM', 'Suprema Corte', 'ICG', 'Oficina de Copyright de EE.UU.',
+    # Operations/Funds
+    'Pandora IX', 'Altarpiece', 'Arts Everywhere Fund',
+    # Laws and Regulations
+    'HEAR Act', 'Art Market Integrity Act', 'Artist\'s Resale Right', 'ARR',
+    # Financial/Compliance Terms
+    'KYC', 'AML/KYC', 'AML'
+]
+
+
 def bold_important_entities(text: str) -> str:
     """Add bold formatting to important entities like countries, cities, institutions."""
     if not text:
         return text
     
-    # Define important entities to bold
-    entities = [
-        # Countries
-        'España', 'Italia', 'Francia', 'Reino Unido', 'Estados Unidos', 'Australia', 
-        'Nueva Zelanda', 'Nigeria', 'Alemania', 'Holanda', 'Bélgica', 'Suiza',
-        # Regions
-        'Unión Europea', 'UE', 'EU', 'EE.UU.', 'EEUU',
-        # Cities
-        'Washington D.C.', 'Washington', 'Londres', 'París', 'Roma', 'Madrid', 
-        'Berlín', 'Ámsterdam', 'Bruselas', 'Ginebra', 'Nueva York', 'Los Ángeles',
-        # Cultural/Historical
-        'Holocausto', 'Nazi', 'Benín', 'Mesopotámica', 'Africana',
-        # Institutions
-        'UNESCO', 'UNIDROIT', 'Congreso estadounidense', 'Casa Blanca', 'Smithsonian',
-        'TJUE', 'ICOM', 'Suprema Corte', 'ICG', 'Oficina de Copyright de EE.UU.',
-        # Operations/Funds
-        'Pandora IX', 'Altarpiece', 'Arts Everywhere Fund',
-        # Laws and Regulations
-        'HEAR Act', 'Art Market Integrity Act', 'Artist\'s Resale Right', 'ARR',
-        # Financial/Compliance Terms
-        'KYC', 'AML/KYC', 'AML'
-    ]
-    
-    for entity in entities:
+    for entity in IMPORTANT_ENTITIES:
         if entity in text:
             text = text.replace(entity, f'<strong>{entity}</strong>')
     
     return text
 
+# Fields to exclude from display
+EXCLUDED_FIELDS = [
+    'objects', 'remedies', 'deadline_days', 'case_refs', 'amount', 
+    'items_returned', 'annual_impact', 'works_removed', 'artists_affected',
+    'canvas_size', 'safety_zone', 'document_date', 'years_missing', 
+    'pages_missing', 'artist', 'title', 'year', 'medium', 'quantity', 'period'
+]
+
+
 def format_json_content(content) -> str:
     """Format JSON content to readable text."""
     if not content:
         return ""
     
-    # Fields to exclude from display
-    excluded_fields = [
-        'objects', 'remedies', 'deadline_days', 'case_refs', 'amount', 
-        'items_returned', 'annual_impact', 'works_removed', 'artists_affected',
-        'canvas_size', 'safety_zone', 'document_date', 'years_missing', 
-        'pages_missing', 'artist', 'title', 'year', 'medium', 'quantity', 'period'
-    ]
-    
     # If content is already a dict, format it directly
     if isinstance(content, dict):
         formatted_parts = []
         for key, value in content.items():
-            if key in excluded_fields:
+            if key in EXCLUDED_FIELDS:
                 continue
                 
             if key == 'summary':
@@ -164,14 +173,13 @@ def format_json_content(content) -> str:
     if isinstance(content, str):
         if content.startswith('{') or content.startswith('['):
             try:
-                import json
                 data = json.loads(content)
                 
                 # Format as readable text
                 if isinstance(data, dict):
                     formatted_parts = []
                     for key, value in data.items():
-                        if key in excluded_fields:
+                        if key in EXCLUDED_FIELDS:
                             continue
                             
                         if key == 'summary':
@@ -199,57 +207,60 @@ def format_json_content(content) -> str:
     
     return clean_text(content)
 
+# Technical cluster names -> human-readable titles
+CLUSTER_TITLES = {
+    'restitution': 'Restituciones de Patrimonio',
+    'copyright': 'Derechos de Autor y Propiedad Intelectual',
+    'compliance': 'Cumplimiento y Regulaciones',
+    'market_integrity': 'Integridad del Mercado del Arte',
+    'cultural_policy': 'Políticas Culturales',
+    'museum_operations': 'Operaciones de Museos',
+    'legal_developments': 'Desarrollos Legales',
+    'international_cooperation': 'Cooperación Internacional',
+    'sanctions': 'Sanciones y Embargos',
+    'labor_issues': 'Asuntos Laborales en Museos',
+    'censorship': 'Censura y Libertad de Expresión',
+    'ethical_collections': 'Colecciones Éticas',
+    'free_expression': 'Libertad de Expresión',
+    'heritage_protection': 'Protección del Patrimonio',
+    'art_market': 'Mercado del Arte',
+    'cultural_heritage': 'Patrimonio Cultural',
+    'legal_framework': 'Marco Legal',
+    'international_law': 'Derecho Internacional',
+    'museum_ethics': 'Ética Museística',
+    'cultural_diplomacy': 'Diplomacia Cultural',
+    # Additional mappings for specific cluster names found in data
+    'labor employment': 'Asuntos Laborales',
+    'ip copyright': 'Propiedad Intelectual',
+    'compliance regulatory': 'Cumplimiento Regulatorio',
+    'policy politics': 'Políticas y Política',
+    'fraud authenticity': 'Fraude y Autenticidad',
+    'ethics governance': 'Ética y Gobernanza',
+    'public art': 'Arte Público',
+    'museum governance': 'Gobernanza de Museos',
+    'data privacy': 'Privacidad de Datos',
+    'Labor Employment': 'Asuntos Laborales',
+    'Ip Copyright': 'Propiedad Intelectual',
+    'Compliance Regulatory': 'Cumplimiento Regulatorio',
+    'Policy Politics': 'Políticas y Política',
+    'Fraud Authenticity': 'Fraude y Autenticidad',
+    'Ethics Governance': 'Ética y Gobernanza',
+    'Public Art': 'Arte Público',
+    'Museum Governance': 'Gobernanza de Museos',
+    'Data Privacy': 'Privacidad de Datos'
+}
+
+
 def get_human_cluster_title(cluster_name: str) -> str:
     """Convert technical cluster names to human-readable titles."""
-    title_mapping = {
-        'restitution': 'Restituciones de Patrimonio',
-        'copyright': 'Derechos de Autor y Propiedad Intelectual',
-        'compliance': 'Cumplimiento y Regulaciones',
-        'market_integrity': 'Integridad del Mercado del Arte',
-        'cultural_policy': 'Políticas Culturales',
-        'museum_operations': 'Operaciones de Museos',
-        'legal_developments': 'Desarrollos Legales',
-        'international_cooperation': 'Cooperación Internacional',
-        'sanctions': 'Sanciones y Embargos',
-        'labor_issues': 'Asuntos Laborales en Museos',
-        'censorship': 'Censura y Libertad de Expresión',
-        'ethical_collections': 'Colecciones Éticas',
-        'free_expression': 'Libertad de Expresión',
-        'heritage_protection': 'Protección del Patrimonio',
-        'art_market': 'Mercado del Arte',
-        'cultural_heritage': 'Patrimonio Cultural',
-        'legal_framework': 'Marco Legal',
-        'international_law': 'Derecho Internacional',
-        'museum_ethics': 'Ética Museística',
-        'cultural_diplomacy': 'Diplomacia Cultural',
-        # Additional mappings for specific cluster names found in data
-        'labor employment': 'Asuntos Laborales',
-        'ip copyright': 'Propiedad Intelectual',
-        'compliance regulatory': 'Cumplimiento Regulatorio',
-        'policy politics': 'Políticas y Política',
-        'fraud authenticity': 'Fraude y Autenticidad',
-        'ethics governance': 'Ética y Gobernanza',
-        'public art': 'Arte Público',
-        'museum governance': 'Gobernanza de Museos',
-        'data privacy': 'Privacidad de Datos',
-        'Labor Employment': 'Asuntos Laborales',
-        'Ip Copyright': 'Propiedad Intelectual',
-        'Compliance Regulatory': 'Cumplimiento Regulatorio',
-        'Policy Politics': 'Políticas y Política',
-        'Fraud Authenticity': 'Fraude y Autenticidad',
-        'Ethics Governance': 'Ética y Gobernanza',
-        'Public Art': 'Arte Público',
-        'Museum Governance': 'Gobernanza de Museos',
-        'Data Privacy': 'Privacidad de Datos'
-    }
     
     # Try exact match first
-    if cluster_name in title_mapping:
-        return title_mapping[cluster_name]
+    if cluster_name in CLUSTER_TITLES:
+        return CLUSTER_TITLES[cluster_name]
     
     # Try lowercase match
-    if cluster_name.lower() in title_mapping:
-        return title_mapping[cluster_name.lower()]
+    if cluster_name.lower() in CLUSTER_TITLES:
+        return CLUSTER_TITLES[cluster_name.lower()]
     
     # For jurisdiction-based clusters, create a readable title
     if ' — ' in cluster_name:
@@ -261,6 +272,77 @@ def get_human_cluster_title(cluster_name: str) -> str:
     # Default: clean up the cluster name
     return cluster_name.replace('_', ' ').title()
 
+def generate_item_html(item: Dict[str, Any], item_number: int, human_title: str) -> str:
+    """Generate HTML for one article of a cluster."""
+    title = clean_text(item.get('headline') or item.get('title', ''))
+    content = item.get('content', '')
+    url = item.get('url', '#')
+    date = item.get('date', '')
+    jurisdiction = item.get('jurisdiction', '')
+    legal_stage = item.get('legal_stage', '')
+    
+    # Generate title if missing
+    if not title or title == 'Sin título':
+        # Try to extract title from content
+        if isinstance(content, dict) and 'summary' in content:
+            summary = content['summary']
+            # Clean summary first
+            summary = clean_text(summary)
+            # Extract first sentence or meaningful phrase
+            sentences = summary.split('.')
+            if sentences and len(sentences[0]) > 10:
+                title = sentences[0].strip()
+                if len(title) > 80:
+                    title = title[:77] + "..."
+            else:
+                title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
+        elif isinstance(content, str):
+            # Clean content first
+            clean_content = clean_text(content)
+            # Extract first meaningful sentence
+            sentences = clean_content.split('.')
+            if sentences and len(sentences[0]) > 10:
+                title = sentences[0].strip()
+                if len(title) > 80:
+                    title = title[:77] + "..."
+            else:
+                title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
+        else:
+            title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
+    
+    # Clean title as well
+    title = clean_text(title)
+    
+    # Format content properly
+    formatted_content = format_json_content(content)
+    # Apply additional cleaning to formatted content
+    formatted_content = clean_text(formatted_content)
+    formatted_content = bold_important_entities(formatted_content)
+    
+    # Get compliance labels
+    compliance_labels = item.get('compliance_labels', [])
+    compliance_chips = ""
+    for label in compliance_labels:
+        compliance_chips += f'<span class="chip">Cumplimiento: {label}</span>'
+    
+    return f'''
+                <article class="item">
+                    <div class="item-number">{item_number}</div>
+                    <div class="cluster-flag">{human_title}</div>
+                    <h3><a href="{url}" target="_blank">{title}</a></h3>
+                    <div class="item-content">{formatted_content}</div>
+                    <div class="chips">
+                        <span class="chip">Fecha: {date}</span>
+                        <span class="chip">Jurisdicción: {jurisdiction}</span>
+                        <span class="chip">Etapa: {legal_stage}</span>
+                        {compliance_chips}
+                    </div>
+                    <div class="item-links">
+                        <a href="https://www.google.com/search?q={title.replace(' ', '%20')}" target="_blank" class="link-btn google-link">Buscar en Google</a>
+                    </div>
+                </article>'''
+
+
 def generate_cluster_section(cluster_name: str, item_ids: List[str], items_by_id: Dict[str, Any], cluster_index: int, global_item_counter: int) -> tuple[str, int]:
     """Generate HTML for a cluster section."""
     if not item_ids:
@@ -286,78 +368,10 @@ def generate_cluster_section(cluster_name: str, item_ids: List[str], items_by_id
             <h2 class="cluster-title">{human_title}</h2>
             <div class="cluster-items">'''
     
-    for i, item in enumerate(cluster_items, 1):
-        title = clean_text(item.get('title', ''))
-        content = item.get('content', '')
-        url = item.get('url', '#')
-        date = item.get('date', '')
-        jurisdiction = item.get('jurisdiction', '')
-        legal_stage = item.get('legal_stage', '')
-        
+    for item in cluster_items:
         # Use global counter for sequential numbering
-        current_item_number = global_item_counter
+        html += generate_item_html(item, global_item_counter, human_title)
         global_item_counter += 1
-        
-        # Generate title if missing
-        if not title or title == 'Sin título':
-            # Try to extract title from content
-            if isinstance(content, dict) and 'summary' in content:
-                summary = content['summary']
-                # Clean summary first
-                summary = clean_text(summary)
-                # Extract first sentence or meaningful phrase
-                sentences = summary.split('.')
-                if sentences and len(sentences[0]) > 10:
-                    title = sentences[0].strip()
-                    if len(title) > 80:
-                        title = title[:77] + "..."
-                else:
-                    title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
-            elif isinstance(content, str):
-                # Clean content first
-                clean_content = clean_text(content)
-                # Extract first meaningful sentence
-                sentences = clean_content.split('.')
-                if sentences and len(sentences[0]) > 10:
-                    title = sentences[0].strip()
-                    if len(title) > 80:
-                        title = title[:77] + "..."
-                else:
-                    title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
-            else:
-                title = "Desarrollo en " + jurisdiction if jurisdiction else "Actualización Legal"
-        
-        # Clean title as well
-        title = clean_text(title)
-        
-        # Format content properly
-        formatted_content = format_json_content(content)
-        # Apply additional cleaning to formatted content
-        formatted_content = clean_text(formatted_content)
-        formatted_content = bold_important_entities(formatted_content)
-        
-        # Get compliance labels
-        compliance_labels = item.get('compliance_labels', [])
-        compliance_chips = ""
-        for label in compliance_labels:
-            compliance_chips += f'<span class="chip">Cumplimiento: {label}</span>'
-        
-        html += f'''
-                <article class="item">
-                    <div class="item-number">{current_item_number}</div>
-                    <div class="cluster-flag">{human_title}</div>
-                    <h3><a href="{url}" target="_blank">{title}</a></h3>
-                    <div class="item-content">{formatted_content}</div>
-                    <div class="chips">
-                        <span class="chip">Fecha: {date}</span>
-                        <span class="chip">Jurisdicción: {jurisdiction}</span>
-                        <span class="chip">Etapa: {legal_stage}</span>
-                        {compliance_chips}
-                    </div>
-                    <div class="item-links">
-                        <a href="https://www.google.com/search?q={title.replace(' ', '%20')}" target="_blank" class="link-btn google-link">Buscar en Google</a>
-                    </div>
-                </article>'''
     
     html += '''
             </div>
@@ -366,28 +380,8 @@ def generate_cluster_section(cluster_name: str, item_ids: List[str], items_by_id
     return html, global_item_counter
 
 
-def generate_original_html(data: dict) -> str:
-    """Generate the main HTML report."""
-    
-    metadata = data.get('metadata', {})
-    executive_summary = data.get('executive_summary', {})
-    items = data.get('items', [])
-    clusters = data.get('clusters', {})
-    analytics = data.get('analytics', {})
-    
-    # Get date range
-    start_date, end_date = extract_date_range_from_metadata(data)
-    
-    # Create items lookup
-    items_by_id = {item.get('item_id', ''): item for item in items}
-    
-    # Get analytics data
-    totals = analytics.get('totals', {})
-    total_items = totals.get('items_combined', 0)
-    unique_items = totals.get('unique_item_ids', 0)
-    total_sources = len(totals.get('source_items', {}))
-    
-    # Get executive summary
+def generate_summary_html(executive_summary: Dict[str, Any]) -> str:
+    """Generate the executive summary section."""
     bullets = executive_summary.get('bullets', [])
     key_findings = executive_summary.get('key_findings', [])
     overview = executive_summary.get('overview', '')
@@ -409,37 +403,70 @@ def generate_original_html(data: dict) -> str:
         formatted_finding = bold_important_entities(cleaned_finding)
         findings_html += f'<li>{formatted_finding}</li>'
     
+    return f'''<section class="tldr">
+            <h2>Resumen Ejecutivo</h2>
+            <p>{overview}</p>
+            
+            <h3>Puntos Clave</h3>
+            <ul>
+{bullets_html}
+            </ul>
+            
+            <h3>Hallazgos Principales</h3>
+            <ul>
+{findings_html}
+            </ul>
+        </section>'''
+
+
+def generate_original_html(data: dict, facets: FacetIndex | None = None) -> str:
+    """Generate the main HTML report."""
+    
+    metadata = data.get('metadata', {})
+    executive_summary = data.get('executive_summary', {})
+    items = data.get('items', [])
+    analytics = data.get('analytics', {})
+    
+    # Get date range
+    start_date, end_date = extract_date_range_from_metadata(data)
+    
+    # Create items lookup
+    items_by_id = {item.get('item_id', ''): item for item in items}
+    
+    # Category clusters come straight from the facet index (no item re-scan)
+    if facets is None:
+        facets = FacetIndex.for_payload(data)
+    category_clusters = facets.clusters('category')
+    
+    # Get analytics data
+    totals = analytics.get('totals', {})
+    total_items = totals.get('items_combined', 0)
+    unique_items = totals.get('unique_item_ids', 0)
+    total_sources = len(totals.get('source_items', {}))
+    
+    # Get executive summary
+    summary_html = generate_summary_html(executive_summary)
+    
     # Generate glossary with cross-references
     glossary_html = ""
     cluster_index = 1
     cluster_mapping = {}  # To track cluster names and their indices
     
-    # Only use by_normalized_category clusters to avoid duplicates
-    if 'by_normalized_category' in clusters:
-        cluster_data = clusters['by_normalized_category']
-        if isinstance(cluster_data, dict):
-            for cluster_name, item_ids in cluster_data.items():
-                if isinstance(item_ids, list) and item_ids:
-                    human_title = get_human_cluster_title(cluster_name)
-                    item_count = len([item_id for item_id in item_ids if item_id in items_by_id])
-                    cluster_mapping[cluster_name] = cluster_index
-                    glossary_html += f'<li><a href="#cluster-{cluster_index}">{human_title}</a> <span class="glossary-count">({item_count} artículos)</span></li>'
-                    cluster_index += 1
+    for cluster_name, item_ids in category_clusters.items():
+        human_title = get_human_cluster_title(cluster_name)
+        cluster_mapping[cluster_name] = cluster_index
+        glossary_html += f'<li><a href="#cluster-{cluster_index}">{human_title}</a> <span class="glossary-count">({len(item_ids)} artículos)</span></li>'
+        cluster_index += 1
     
     # Generate clusters HTML with global sequential numbering
     clusters_html = ""
     cluster_index = 1
     global_item_counter = 1  # Start global counter at 1
     
-    # Only use by_normalized_category clusters to avoid duplicates
-    if 'by_normalized_category' in clusters:
-        cluster_data = clusters['by_normalized_category']
-        if isinstance(cluster_data, dict):
-            for cluster_name, item_ids in cluster_data.items():
-                if isinstance(item_ids, list):
-                    cluster_html, global_item_counter = generate_cluster_section(cluster_name, item_ids, items_by_id, cluster_index, global_item_counter)
-                    clusters_html += cluster_html
-                    cluster_index += 1
+    for cluster_name, item_ids in category_clusters.items():
+        cluster_html, global_item_counter = generate_cluster_section(cluster_name, item_ids, items_by_id, cluster_index, global_item_counter)
+        clusters_html += cluster_html
+        cluster_index += 1
     
     html = f'''<!DOCTYPE html>
 <html lang="es">
@@ -763,20 +790,7 @@ def generate_original_html(data: dict) -> str:
             </div>
         </section>
 
-        <section class="tldr">
-            <h2>Resumen Ejecutivo</h2>
-            <p>{overview}</p>
-            
-            <h3>Puntos Clave</h3>
-            <ul>
-{bullets_html}
-            </ul>
-            
-            <h3>Hallazgos Principales</h3>
-            <ul>
-{findings_html}
-            </ul>
-        </section>
+        {summary_html}
 
         {clusters_html}
 
@@ -799,13 +813,14 @@ def generate_original_html(data: dict) -> str:
     return html
 
 
-def generate_meta_html(data: dict) -> str:
+def generate_meta_html(data: dict, facets: FacetIndex | None = None) -> str:
     """Generate meta HTML with analytics and charts for merged reports."""
     
     # Extract analytics data from merged structure
     analytics = data.get('analytics', {})
     totals = analytics.get('totals', {})
-    distributions = analytics.get('distributions', {})
+    if facets is None:
+        facets = FacetIndex.for_payload(data)
     
     # Get basic stats
     total_items = totals.get('items_combined', 0)
@@ -813,17 +828,12 @@ def generate_meta_html(data: dict) -> str:
     source_items = totals.get('source_items', {})
     total_sources = len(source_items)
     
-    # Get distributions
-    category_dist = distributions.get('normalized_category', {})
-    jurisdiction_dist = distributions.get('jurisdiction', {})
-    legal_stage_dist = distributions.get('legal_stage', {})
-    compliance_dist = distributions.get('compliance_label', {})
-    
-    # Sort distributions by count
-    category_sorted = sorted(category_dist.items(), key=lambda x: x[1], reverse=True)
-    jurisdiction_sorted = sorted(jurisdiction_dist.items(), key=lambda x: x[1], reverse=True)
-    legal_stage_sorted = sorted(legal_stage_dist.items(), key=lambda x: x[1], reverse=True)
-    compliance_sorted = sorted(compliance_dist.items(), key=lambda x: x[1], reverse=True)
+    # Distributions sorted by count, read from the facet index
+    category_sorted = facets.most_common('category')
+    # Geographic chart uses canonical countries so spellings of one place don't fragment
+    jurisdiction_sorted = [(display_name(code, 'es'), count) for code, count in facets.most_common('country')]
+    legal_stage_sorted = facets.most_common('legal_stage')
+    compliance_sorted = facets.most_common('compliance_label')
     
     # Generate chart HTML
     category_chart = ""
@@ -1155,31 +1165,43 @@ def generate_meta_html(data: dict) -> str:
     return html
 
 
-def main():
-    """Main function."""
-    if len(sys.argv) < 2:
-        print("Usage: python json_to_html_converter_merged.py <json_file>")
-        sys.exit(1)
+def convert_json_to_html(data: Dict[str, Any], output_dir: Path, base_name: str,
+                         source: str | None = None) -> tuple[Path, Path]:
+    """Write the issue page and its meta page for an already loaded report.
     
-    json_file = sys.argv[1]
-    data = load_json_data(json_file)
-    
-    # Generate output filenames
-    base_name = Path(json_file).stem
-    output_dir = Path("docs/art-law/issues")
+    ``source`` is the file ``data`` was loaded from, when it was not changed
+    since; its persisted facet index is then used without re-scanning the items.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
+    # One facet index for both pages
+    facets = FacetIndex.for_payload(data, source)
     
     # Generate main HTML
-    main_html = generate_original_html(data)
+    main_html = generate_original_html(data, facets)
     main_output = output_dir / f"{base_name}.html"
-    with open(main_output, 'w', encoding='utf-8') as f:
-        f.write(main_html)
     
     # Generate meta HTML
-    meta_html = generate_meta_html(data)
+    meta_html = generate_meta_html(data, facets)
     meta_output = output_dir / f"{base_name}_meta.html"
-    with open(meta_output, 'w', encoding='utf-8') as f:
-        f.write(meta_html)
+    
+    # Files whose content did not change keep their mtime
+    block = issue_metadata(data, 'art-law', base_name, 'es')
+    write_outputs({main_output: embed_issue_metadata(main_html, block),
+                   meta_output: embed_issue_metadata(meta_html, block)})
+    return main_output, meta_output
+
+
+def main():
+    """Main function."""
+    if len(sys.argv) < 2:
+        print("Usage: python json_to_html_converter_merged.py <json_file> [output_dir]")
+        sys.exit(1)
+    
+    json_file = sys.argv[1]
+    data = load_json_data(json_file)
+    
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("docs/art-law/issues")
+    main_output, meta_output = convert_json_to_html(data, output_dir, Path(json_file).stem, json_file)
     
     print(f"Generated: {main_output}")
     print(f"Generated: {meta_output}")
@@ -11,33 +11,76 @@ Output (default):
 Usage:
   python scripts/converters/merge_artlaw_reports.py
   python scripts/converters/merge_artlaw_reports.py <input1> <input2> ... [output]
+  python scripts/converters/merge_artlaw_reports.py --workers 4 [inputs...]
+  python scripts/converters/merge_artlaw_reports.py --since 01-07-2025 --until 31-08-2025
+  python scripts/converters/merge_artlaw_reports.py --decision-log merge_log.json [--threshold 0.45]
+  python scripts/converters/merge_artlaw_reports.py --replay merge_log.json
+
+Items that share an item_id or source article URL are scored for similarity and
+merged only above the threshold. Every decision is embedded in the output under
+``merge_decisions`` and optionally written to --decision-log. --replay re-applies
+the verdicts of a saved log (or of a previous merged report) without rescoring;
+edit a verdict in the log to override it editorially.
+
+Sources are parsed concurrently and, for large inputs, normalised in a process
+pool. The reduce step always walks sources in input order, so the merged output
+is identical for any --workers value (--workers 1 runs fully in-process).
 """
 
 from __future__ import annotations
 
-import json
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict, Counter
-from typing import Any, Dict, List, Tuple
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple
+
+from dates import date_ordinal
+from facet_index import FacetIndex
+from item_archive import read_report
+from merge_decisions import MERGE, DecisionLog, article_url
+from output_files import build_time, canonical_json, write_if_changed
+
+
+# Below this many items in total, normalisation stays in-process: spawning a
+# process pool costs more than normalising a few hundred items.
+PROCESS_POOL_MIN_ITEMS = 5_000
+
+Normalization = Tuple[str, List[str]]
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+    # Served from the item archive when NEWSLETTER_ARCHIVE holds a fresh copy
+    return read_report(path)
 
 
-def parse_date(date_str: str | None) -> datetime | None:
-    if not date_str:
-        return None
-    # Try common formats found in the sources
-    for fmt in ('%d-%m-%Y', '%Y-%m-%d', '%d/%m/%Y', '%m-%d-%Y'):
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    return None
+def source_key(path: Path) -> str:
+    return str(path).replace('\\', '/')
+
+
+def load_sources(paths: List[Path], workers: int | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Parse all inputs concurrently (I/O bound). Results keep the order of ``paths``."""
+    if workers == 1 or len(paths) < 2:
+        payloads = [load_json(p) for p in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            payloads = list(pool.map(load_json, paths))
+    return [(source_key(p), data) for p, data in zip(paths, payloads)]
+
+
+def normalize_dates(items: Iterable[Dict[str, Any]]) -> None:
+    """Store the canonical ``date_ordinal`` of each item's publication_date on the item."""
+    for it in items:
+        it['date_ordinal'] = date_ordinal(it.get('publication_date'))
+
+
+def filter_by_date_range(items: List[Dict[str, Any]], start: int | None, end: int | None) -> List[Dict[str, Any]]:
+    """Keep items whose date_ordinal lies in [start, end]. Undated items are dropped."""
+    if start is None and end is None:
+        return items
+    lo = start if start is not None else 0
+    hi = end if end is not None else date.max.toordinal()
+    return [it for it in items if it.get('date_ordinal') is not None and lo <= it['date_ordinal'] <= hi]
 
 
 SPANISH_TO_NORMALIZED_CATEGORY = {
@@ -95,30 +138,113 @@ def collect_compliance_labels(item: Dict[str, Any]) -> List[str]:
     return sorted(labels)
 
 
-def merge_items(sources: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+def normalize_item(item: Dict[str, Any]) -> Normalization:
+    return normalize_category(item), collect_compliance_labels(item)
+
+
+def _normalize_chunk(items: List[Dict[str, Any]]) -> List[Normalization]:
+    return [normalize_item(it) for it in items]
+
+
+def normalize_sources(sources: List[Tuple[str, Dict[str, Any]]], workers: int | None = None) -> List[List[Normalization]]:
     """
-    Merge items across sources by item_id, preserving per-source payloads.
+    Compute (normalized_category, compliance_labels) for every item of every source.
+    Returns one list per source, aligned with that source's ``items``.
+    Large inputs are split into fixed-size chunks and normalised in a process pool;
+    chunk results are reassembled in submission order, so the result never depends
+    on scheduling or on the number of workers.
+    """
+    per_source = [data.get('items', []) for _, data in sources]
+    total = sum(len(items) for items in per_source)
+    if workers == 1 or total < PROCESS_POOL_MIN_ITEMS:
+        return [_normalize_chunk(items) for items in per_source]
+
+    chunk_size = max(1, PROCESS_POOL_MIN_ITEMS // 4)
+    chunks: List[Tuple[int, List[Dict[str, Any]]]] = []
+    for idx, items in enumerate(per_source):
+        for start in range(0, len(items), chunk_size):
+            chunks.append((idx, items[start:start + chunk_size]))
+
+    results: List[List[Normalization]] = [[] for _ in per_source]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for (idx, _), normalized in zip(chunks, pool.map(_normalize_chunk, [c for _, c in chunks])):
+            results[idx].extend(normalized)
+    return results
+
+
+def merge_items(
+    sources: List[Tuple[str, Dict[str, Any]]],
+    normalized: List[List[Normalization]] | None = None,
+    decisions: DecisionLog | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Merge items across sources, preserving per-source payloads.
+    ``normalized`` is the output of ``normalize_sources``; when omitted, items are
+    normalised inline.
+    Items sharing an item_id or a source article URL are candidate pairs; each
+    pair is merged or kept apart according to ``decisions`` (scored, or replayed
+    from a saved log). An item kept apart from one with the same id gets the id
+    ``<item_id>@<source file stem>`` and keeps the original in ``source_item_id``.
     Returns (items_sorted, items_by_id)
     """
     items_by_id: Dict[str, Dict[str, Any]] = {}
-
-    for source_name, data in sources:
-        for item in data.get('items', []):
+    if normalized is None:
+        normalized = normalize_sources(sources, workers=1)
+    if decisions is None:
+        decisions = DecisionLog()
+    # Blocking key ('id:...' / 'url:...') -> merged ids that share it
+    blocks: Dict[str, List[str]] = {}
+
+    for (source_name, data), source_normalized in zip(sources, normalized):
+        for item, (category, labels) in zip(data.get('items', []), source_normalized):
             item_id = item.get('item_id')
             if not item_id:
                 # Create synthetic id if missing (should not happen in given inputs)
                 item_id = f"SYN-{source_name}-{len(items_by_id) + 1}"
                 item['item_id'] = item_id
 
-            if item_id not in items_by_id:
+            url = article_url(item)
+            keys = [f'id:{item_id}'] + ([f'url:{url}'] if url else [])
+            target = None
+            seen = set()
+            for block in keys:
+                for candidate in blocks.get(block, []):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    existing = items_by_id[candidate]
+                    verdict = decisions.decide(
+                        block,
+                        existing, existing['origin_sources'][0], existing['normalized_category'],
+                        item, source_name, category,
+                    )
+                    if verdict == MERGE:
+                        target = candidate
+                        break
+                if target is not None:
+                    break
+
+            if target is None:
+                merged_id = item_id
+                if merged_id in items_by_id:
+                    merged_id = f"{item_id}@{Path(source_name).stem}"
+                    suffix = 2
+                    while merged_id in items_by_id:
+                        merged_id = f"{item_id}@{Path(source_name).stem}-{suffix}"
+                        suffix += 1
                 merged = dict(item)
+                if merged_id != item_id:
+                    merged['item_id'] = merged_id
+                    merged['source_item_id'] = item_id
                 merged['origin_sources'] = [source_name]
                 merged['origin_payloads'] = {source_name: item}
-                merged['normalized_category'] = normalize_category(item)
-                merged['compliance_labels'] = collect_compliance_labels(item)
-                items_by_id[item_id] = merged
+                merged['normalized_category'] = category
+                merged['compliance_labels'] = list(labels)
+                items_by_id[merged_id] = merged
+                for block in keys:
+                    blocks.setdefault(block, []).append(merged_id)
             else:
-                existing = items_by_id[item_id]
+                existing = items_by_id[target]
                 if source_name not in existing['origin_sources']:
                     existing['origin_sources'].append(source_name)
                 existing['origin_payloads'][source_name] = item
@@ -130,11 +256,17 @@ def merge_items(sources: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Dict[st
                         existing[k] = v
                 # Union compliance labels
                 existing_labels = set(existing.get('compliance_labels', []))
-                existing_labels.update(collect_compliance_labels(item))
+                existing_labels.update(labels)
                 existing['compliance_labels'] = sorted(existing_labels)
                 # Normalize category if previously uncategorized
                 if existing.get('normalized_category') in (None, '', 'uncategorized'):
-                    existing['normalized_category'] = normalize_category(item)
+                    existing['normalized_category'] = category
+                for block in keys:
+                    members = blocks.setdefault(block, [])
+                    if target not in members:
+                        members.append(target)
+
+    normalize_dates(items_by_id.values())
 
     # Order: rank asc (if present), then publication_date desc, then headline asc
     def sort_key(it: Dict[str, Any]):
@@ -143,36 +275,29 @@ def merge_items(sources: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Dict[st
             rank_val = int(rank) if rank is not None else 10_000
         except Exception:
             rank_val = 10_000
-        pub = parse_date(it.get('publication_date')) or datetime.min
+        ordinal = it.get('date_ordinal')
         head = it.get('headline') or ''
-        # Negative date for descending within tuple by invert later using sort params
-        return (rank_val, -int(pub.timestamp()) if pub != datetime.min else 0, head)
+        # Negated ordinal sorts newest first; undated items go after dated ones
+        return (rank_val, -ordinal if ordinal else 0, head)
 
     items_sorted = sorted(items_by_id.values(), key=sort_key)
     return items_sorted, items_by_id
 
 
-def build_clusters(items_sorted: List[Dict[str, Any]]) -> Dict[str, Any]:
-    clusters: Dict[str, Any] = {
-        'by_normalized_category': defaultdict(list),
-        'by_jurisdiction': defaultdict(list),
-        'by_legal_stage': defaultdict(list),
-        'by_compliance_label': defaultdict(list),
-    }
-    for it in items_sorted:
-        item_id = it.get('item_id')
-        clusters['by_normalized_category'][it.get('normalized_category', 'uncategorized')].append(item_id)
-        jur = it.get('jurisdiction') or 'Unspecified'
-        clusters['by_jurisdiction'][jur].append(item_id)
-        stage = it.get('legal_stage') or 'Unspecified'
-        clusters['by_legal_stage'][stage].append(item_id)
-        for lbl in it.get('compliance_labels', []):
-            clusters['by_compliance_label'][lbl].append(item_id)
-    # Convert defaultdicts to dicts
-    for k in list(clusters.keys()):
-        if isinstance(clusters[k], defaultdict):
-            clusters[k] = dict(clusters[k])
-    return clusters
+# Legacy ``clusters`` block name -> facet of the persisted FacetIndex
+CLUSTER_FACETS = {
+    'by_normalized_category': 'category',
+    'by_jurisdiction': 'jurisdiction',
+    'by_country': 'country',
+    'by_legal_stage': 'legal_stage',
+    'by_compliance_label': 'compliance_label',
+    'by_publication_month': 'publication_month',
+}
+
+
+def build_clusters(index: FacetIndex) -> Dict[str, Any]:
+    """Item-id clusters derived from the facet index (each id at most once per cluster)."""
+    return {name: index.clusters(facet) for name, facet in CLUSTER_FACETS.items()}
 
 
 def merge_metadata(source_payloads: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
@@ -244,11 +369,7 @@ def merge_executive_summary(source_payloads: List[Tuple[str, Dict[str, Any]]]) -
     }
 
 
-def build_analytics(items_sorted: List[Dict[str, Any]], items_by_id: Dict[str, Dict[str, Any]], source_payloads: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
-    categories = Counter(it.get('normalized_category', 'uncategorized') for it in items_sorted)
-    jurisdictions = Counter((it.get('jurisdiction') or 'Unspecified') for it in items_sorted)
-    stages = Counter((it.get('legal_stage') or 'Unspecified') for it in items_sorted)
-
+def build_analytics(items_sorted: List[Dict[str, Any]], items_by_id: Dict[str, Dict[str, Any]], source_payloads: List[Tuple[str, Dict[str, Any]]], index: FacetIndex) -> Dict[str, Any]:
     source_items = {name: len(data.get('items', [])) for name, data in source_payloads}
 
     source_analytics = {name: data.get('analytics') for name, data in source_payloads if data.get('analytics')}
@@ -260,9 +381,11 @@ def build_analytics(items_sorted: List[Dict[str, Any]], items_by_id: Dict[str, D
             'source_items': source_items,
         },
         'distributions': {
-            'normalized_category': dict(categories),
-            'jurisdiction': dict(jurisdictions),
-            'legal_stage': dict(stages),
+            'normalized_category': index.counts('category'),
+            'jurisdiction': index.counts('jurisdiction'),
+            'country': index.counts('country'),
+            'legal_stage': index.counts('legal_stage'),
+            'compliance_label': index.counts('compliance_label'),
         },
         'source_analytics': source_analytics,
     }
@@ -280,7 +403,52 @@ def build_sources_block(source_payloads: List[Tuple[str, Dict[str, Any]]]) -> Di
     return sources
 
 
+def pop_option(argv: List[str], name: str) -> str | None:
+    """Remove ``name VALUE`` or ``name=VALUE`` from argv and return VALUE."""
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            value = argv[i + 1]
+            del argv[i:i + 2]
+            return value
+        if arg.startswith(name + '='):
+            del argv[i]
+            return arg.split('=', 1)[1]
+    return None
+
+
 def main(argv: List[str]) -> int:
+    argv = list(argv)
+    workers_opt = pop_option(argv, '--workers')
+    try:
+        workers = int(workers_opt) if workers_opt is not None else None
+    except ValueError:
+        print(f'Error: --workers expects an integer, got {workers_opt!r}')
+        return 2
+    if workers is not None and workers < 1:
+        print('Error: --workers must be at least 1')
+        return 2
+    since_opt = pop_option(argv, '--since')
+    until_opt = pop_option(argv, '--until')
+    since = date_ordinal(since_opt) if since_opt else None
+    until = date_ordinal(until_opt) if until_opt else None
+    if (since_opt and since is None) or (until_opt and until is None):
+        print('Error: --since/--until expect a date such as DD-MM-YYYY')
+        return 2
+    log_opt = pop_option(argv, '--decision-log')
+    replay_opt = pop_option(argv, '--replay')
+    threshold_opt = pop_option(argv, '--threshold')
+    try:
+        decisions = DecisionLog(float(threshold_opt)) if threshold_opt is not None else DecisionLog()
+    except ValueError:
+        print(f'Error: --threshold expects a number, got {threshold_opt!r}')
+        return 2
+    if replay_opt:
+        if not Path(replay_opt).exists():
+            print(f'Error: replay log not found: {replay_opt}')
+            return 2
+        loaded = decisions.load_replay(Path(replay_opt))
+        print(f'Replaying {loaded} merge decisions from {replay_opt}')
+
     root = Path('.')
     art_law_dir = root / 'data' / 'art-law'
     default_output = art_law_dir / 'arte_derecho_report_2025_08_20_all_merged.json'
@@ -290,7 +458,8 @@ def main(argv: List[str]) -> int:
     
     if len(argv) in (0, 1):
         # Auto-discover all JSON files in art-law directory
-        inputs = list(art_law_dir.glob('*.json'))
+        # Sorted so the merge order does not depend on directory listing order
+        inputs = sorted(art_law_dir.glob('*.json'))
         # Exclude the output file if it already exists
         inputs = [p for p in inputs if not p.name.startswith('arte_derecho_report_2025_08_20_all_merged')]
         if not inputs:
@@ -305,23 +474,30 @@ def main(argv: List[str]) -> int:
         inputs = args[:-1] if len(args) > 1 and not args[-1].suffix == '.json' else args
         output = args[-1] if len(args) > 1 and not args[-1].suffix == '.json' else default_output
 
-    # Load sources
-    source_payloads: List[Tuple[str, Dict[str, Any]]] = []
     for p in inputs:
         if not p.exists():
             print(f'Error: input not found: {p}')
             return 2
-        source_payloads.append((str(p).replace('\\', '/'), load_json(p)))
+
+    # Load and normalise sources concurrently; the merge below is the
+    # deterministic, input-ordered reduce step
+    source_payloads = load_sources(inputs, workers)
+    normalized = normalize_sources(source_payloads, workers)
 
     # Merge items
-    items_sorted, items_by_id = merge_items(source_payloads)
-    # Build clusters
-    clusters = build_clusters(items_sorted)
+    items_sorted, items_by_id = merge_items(source_payloads, normalized, decisions)
+    print(f'Merge decisions: {decisions.scored} scored, {decisions.replayed} replayed')
+    if since is not None or until is not None:
+        items_sorted = filter_by_date_range(items_sorted, since, until)
+        items_by_id = {it['item_id']: it for it in items_sorted}
+    # Index facets once; clusters and distributions are read from the index
+    facet_index = FacetIndex.build(items_sorted)
+    clusters = build_clusters(facet_index)
     # Merge metadata and executive summary
     metadata = merge_metadata(source_payloads)
     executive_summary = merge_executive_summary(source_payloads)
     # Build analytics
-    analytics = build_analytics(items_sorted, items_by_id, source_payloads)
+    analytics = build_analytics(items_sorted, items_by_id, source_payloads, facet_index)
     # Sources block
     sources_block = build_sources_block(source_payloads)
 
@@ -330,17 +506,23 @@ def main(argv: List[str]) -> int:
         'executive_summary': executive_summary,
         'items': items_sorted,
         'clusters': clusters,
+        'facet_index': facet_index.to_dict(),
+        'merge_decisions': decisions.to_dict(),
         'analytics': analytics,
         'sources': sources_block,
-        'generated_at': datetime.utcnow().isoformat() + 'Z',
+        'generated_at': build_time().strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
         'generator': 'merge_artlaw_reports.py',
         'version': '1.0',
     }
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    with output.open('w', encoding='utf-8') as f:
-        json.dump(merged, f, ensure_ascii=False, indent=2)
+    write_if_changed(output, canonical_json(merged, indent=2))
+    # Converters use the persisted index for exactly this file content
+    FacetIndex.record(output)
     print(f'Wrote merged report: {output}')
+    if log_opt:
+        decisions.save(Path(log_opt))
+        print(f'Wrote merge decision log: {log_opt}')
     return 0
 
 
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Similarity scoring and the replayable decision log of the merge engine.
+
+An incoming item that shares an ``item_id`` or a source article URL with an
+item already merged forms a *candidate pair*. Each pair gets a verdict:
+``merge`` (same story, fold the payloads together) or ``distinct`` (another
+story reusing the id, or citing the same round-up article). The verdict comes
+from a weighted similarity score against a threshold, or from a saved log.
+
+Pairs are keyed by the content signatures of both items rather than their
+ids, so a saved log keeps applying when the same stories reappear in next
+week's inputs: replayed pairs skip scoring entirely. Editorial overrides are
+made by editing a pair's ``verdict`` in the log and replaying it.
+
+Records follow the ``merge_decisions`` block of the sovereign merged reports
+(``signature``, ``sources``, ``score``, ``components``, headlines) plus the
+``pair``, ``verdict`` and ``origin`` fields that replay needs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse
+
+from entities import item_entities
+from output_files import canonical_json, write_if_changed
+
+LOG_VERSION = 1
+DEFAULT_THRESHOLD = 0.45
+
+MERGE = 'merge'
+DISTINCT = 'distinct'
+
+# Weights of the similarity components; they sum to 1
+WEIGHTS = {
+    'jaccard': 0.35,
+    'cosine_like': 0.25,
+    'numeric_overlap': 0.15,
+    'country_overlap': 0.15,
+    'category_overlap': 0.10,
+}
+
+_WORD_RE = re.compile(r'\w{3,}')
+_NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)*')
+
+
+def _fold(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    content = item.get('content')
+    summary = content.get('summary', '') if isinstance(content, dict) else (content or '')
+    return f"{item.get('headline') or item.get('title') or ''} {summary}"
+
+
+def article_url(item: Dict[str, Any]) -> str | None:
+    """Normalised source article URL, or None for missing/homepage-only URLs."""
+    source = item.get('source')
+    url = (source.get('original_url') or source.get('url')) if isinstance(source, dict) else item.get('url')
+    if not isinstance(url, str) or not url.strip():
+        return None
+    parsed = urlparse(url.strip())
+    path = parsed.path.rstrip('/')
+    if not parsed.netloc or not path:
+        return None
+    return f"{parsed.netloc.lower().removeprefix('www.')}{path}"
+
+
+def item_signature(item: Dict[str, Any]) -> str:
+    """Stable content signature: headline, date and article URL."""
+    basis = '|'.join((
+        ' '.join(_WORD_RE.findall(_fold(str(item.get('headline') or item.get('title') or '')))),
+        str(item.get('publication_date') or item.get('date') or ''),
+        article_url(item) or '',
+    ))
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()[:16]
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def similarity_components(existing: Dict[str, Any], new: Dict[str, Any], existing_category: str, new_category: str) -> Dict[str, float]:
+    text_a, text_b = _fold(item_text(existing)), _fold(item_text(new))
+    words_a, words_b = Counter(_WORD_RE.findall(text_a)), Counter(_WORD_RE.findall(text_b))
+    dot = sum(count * words_b[word] for word, count in words_a.items())
+    norm = math.sqrt(sum(c * c for c in words_a.values())) * math.sqrt(sum(c * c for c in words_b.values()))
+    return {
+        'jaccard': _jaccard(set(words_a), set(words_b)),
+        'cosine_like': dot / norm if norm else 0.0,
+        'numeric_overlap': _jaccard(set(_NUMBER_RE.findall(text_a)), set(_NUMBER_RE.findall(text_b))),
+        'country_overlap': _jaccard({e.code for e in item_entities(existing)}, {e.code for e in item_entities(new)}),
+        'category_overlap': 1.0 if existing_category == new_category else 0.0,
+    }
+
+
+def similarity_score(components: Dict[str, float]) -> float:
+    # A shared URL alone proves nothing: round-up articles cover several stories
+    return sum(WEIGHTS[name] * components[name] for name in WEIGHTS)
+
+
+class DecisionLog:
+    """Verdicts for candidate pairs, recorded while merging and replayable later."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.decisions: List[Dict[str, Any]] = []
+        self._replay: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.scored = 0
+        self.replayed = 0
+
+    @staticmethod
+    def pair_key(sig_a: str, sig_b: str) -> Tuple[str, str]:
+        return (sig_a, sig_b) if sig_a <= sig_b else (sig_b, sig_a)
+
+    def decide(
+        self,
+        signature: str,
+        existing: Dict[str, Any],
+        existing_source: str,
+        existing_category: str,
+        new: Dict[str, Any],
+        new_source: str,
+        new_category: str,
+    ) -> str:
+        """Verdict for one candidate pair; ``signature`` is the blocking key that paired them."""
+        key = self.pair_key(item_signature(existing), item_signature(new))
+        record: Dict[str, Any] = {
+            'signature': signature,
+            'pair': list(key),
+            'item_ids': [existing.get('item_id'), new.get('item_id')],
+            'sources': [existing_source, new_source],
+            'existing_headline': existing.get('headline'),
+            'new_headline': new.get('headline'),
+        }
+        if key in self._replay:
+            saved = self._replay[key]
+            # Keep the saved explanation; the verdict may be an editorial override
+            for field in ('score', 'components'):
+                if field in saved:
+                    record[field] = saved[field]
+            record['verdict'] = saved['verdict']
+            record['origin'] = 'replayed'
+            self.replayed += 1
+        else:
+            components = similarity_components(existing, new, existing_category, new_category)
+            score = similarity_score(components)
+            record['score'] = round(score, 4)
+            record['components'] = {name: round(value, 4) for name, value in components.items()}
+            record['verdict'] = MERGE if score >= self.threshold else DISTINCT
+            record['origin'] = 'scored'
+            self.scored += 1
+        self.decisions.append(record)
+        return record['verdict']
+
+    # -- persistence ----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': LOG_VERSION,
+            'threshold': self.threshold,
+            'weights': WEIGHTS,
+            'decisions': self.decisions,
+        }
+
+    def save(self, path: Path) -> None:
+        write_if_changed(path, canonical_json(self.to_dict(), indent=1))
+
+    def load_replay(self, path: Path) -> int:
+        """
+        Load verdicts from a saved log, or from the ``merge_decisions`` block of a
+        merged report. Records without a verdict (e.g. the sovereign reports) are
+        ignored. Returns the number of pairs loaded.
+        """
+        with path.open('r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if 'decisions' not in payload and isinstance(payload.get('merge_decisions'), dict):
+            payload = payload['merge_decisions']
+        loaded = 0
+        for record in payload.get('decisions', []):
+            pair, verdict = record.get('pair'), record.get('verdict')
+            if isinstance(pair, list) and len(pair) == 2 and verdict in (MERGE, DISTINCT):
+                self._replay[self.pair_key(*pair)] = record
+                loaded += 1
+        return loaded
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Write-if-changed output for generated files.
+
+Rewriting a page with the bytes it already has still bumps its mtime, so the
+build re-hashes it, the compress step recompresses it and git status and
+deploys look at it again. ``write_if_changed`` leaves a file whose content is
+already right untouched, and replaces the others atomically (a temp file in
+the same directory, then os.replace), so readers such as the preview server
+never see a half-written page.
+
+For reproducible builds, outputs take their timestamp from ``build_time``
+(SOURCE_DATE_EPOCH when set) and JSON is written by ``canonical_json``, so
+the same sources always produce the same bytes.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+Content = Union[str, bytes]
+
+
+def build_time() -> datetime:
+    """UTC time to stamp outputs with: SOURCE_DATE_EPOCH when set, otherwise now."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    return datetime.now(timezone.utc)
+
+
+def canonical_json(payload: Any, indent: Optional[int] = None) -> str:
+    """JSON text that depends only on ``payload``: unescaped UTF-8, fixed separators, no NaN.
+
+    Key order is kept; producers build their dicts in a deterministic order.
+    """
+    separators = (',', ':') if indent is None else (',', ': ')
+    return json.dumps(payload, ensure_ascii=False, indent=indent, separators=separators, allow_nan=False)
+
+
+def _encode(content: Content) -> bytes:
+    return content.encode('utf-8') if isinstance(content, str) else content
+
+
+def write_if_changed(path: Union[str, Path], content: Content) -> bool:
+    """Write ``content`` (str as UTF-8) to ``path`` unless it already holds it; True when written."""
+    path = Path(path)
+    data = _encode(content)
+    try:
+        # Only a file of the same size can hold the same bytes
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_outputs(outputs: Dict[Path, Content]) -> List[Path]:
+    """Write each path's content if it changed; the paths actually written, in order."""
+    return [path for path, content in outputs.items() if write_if_changed(path, content)]
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Cross-issue trend analytics for a newsletter.
+
+Builds dense issue x category, issue x country and issue x tag count matrices
+over every issue of a newsletter (oldest first) and derives, in vectorised
+NumPy form:
+  - shares: fraction of an issue's items carrying each term
+  - rolling means of the shares over a window of issues
+  - growth: mean share in the latest window against the window before it
+  - top movers: terms whose share rose or fell the most between those windows
+
+The result is rendered as a trends dashboard next to the per-issue meta pages
+(docs/<newsletter>/issues/trends_meta.html). scripts/build.py rebuilds it with
+the newsletter's issues (task trends:<newsletter>) and the landing page links it.
+
+Usage:
+  python scripts/converters/trend_analytics.py sovereign-debt
+  python scripts/converters/trend_analytics.py art-law --window 3 --top 8
+  python scripts/converters/trend_analytics.py data-governance --json trends.json --output trends.html
+
+Requires NumPy (pip install numpy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # reported by main(); the module stays importable without it
+    np = None
+
+from entities import display_name, item_entities
+from item_archive import item_category, item_facets, read_report, report_date
+from item_columns import ItemColumns, load_columns
+from output_files import canonical_json, write_if_changed
+
+DATA_DIR = Path('data')
+DOCS_DIR = Path('docs')
+DEFAULT_WINDOW = 4
+DEFAULT_TOP = 10
+
+LANGUAGES = {'art-law': 'es'}
+
+LABELS = {
+    'en': {
+        'title': 'Trends', 'subtitle': 'Cross-issue analytics', 'issues': 'Issues', 'items': 'Items',
+        'period': 'Period', 'window': 'Window (issues)', 'leaders': 'Most covered', 'rising': 'Rising',
+        'falling': 'Falling', 'none': 'No movement between windows.', 'new': 'new',
+        'category': 'Categories', 'country': 'Countries', 'tag': 'Tags',
+        'note': 'Shares are the fraction of an issue\'s items carrying a term. Movers compare the mean share '
+                'of the latest {w} issues with the {w} issues before them.',
+    },
+    'es': {
+        'title': 'Tendencias', 'subtitle': 'Analítica entre boletines', 'issues': 'Boletines', 'items': 'Noticias',
+        'period': 'Periodo', 'window': 'Ventana (boletines)', 'leaders': 'Más cubiertos', 'rising': 'En alza',
+        'falling': 'En descenso', 'none': 'Sin variación entre ventanas.', 'new': 'nuevo',
+        'category': 'Categorías', 'country': 'Países', 'tag': 'Etiquetas',
+        'note': 'La cuota es la fracción de noticias de un boletín que incluyen el término. Las variaciones '
+                'comparan la cuota media de los últimos {w} boletines con la de los {w} anteriores.',
+    },
+}
+
+
+class Issue(NamedTuple):
+    stem: str
+    ordinal: int
+    title: str
+    items: List[Dict[str, Any]]
+    columns: ItemColumns | None = None
+
+
+def _category_terms(item: Dict[str, Any]) -> Iterable[str]:
+    return [item_category(item) or 'uncategorized']
+
+
+def _country_terms(item: Dict[str, Any]) -> Iterable[str]:
+    return [entity.code for entity in item_entities(item)]
+
+
+def _tag_terms(item: Dict[str, Any]) -> Iterable[str]:
+    return item_facets(item)['tag']
+
+
+FACETS: Dict[str, Callable[[Dict[str, Any]], Iterable[str]]] = {
+    'category': _category_terms,
+    'country': _country_terms,
+    'tag': _tag_terms,
+}
+
+
+def load_issues(newsletter: str, data_dir: Path = DATA_DIR) -> List[Issue]:
+    """Every report of a newsletter with items, oldest first."""
+    issues = []
+    for path in sorted((data_dir / newsletter).glob('*.json')):
+        if path.stem.endswith('_all_merged'):
+            continue  # merged reports repeat the items of their sources
+        data = read_report(path)
+        items = [it for it in data.get('items') or [] if isinstance(it, dict)]
+        if not items:
+            continue
+        metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+        title = metadata.get('title') or metadata.get('report_title') or metadata.get('digest_title') or path.stem
+        issues.append(Issue(path.stem, report_date(data) or 0, title, items, load_columns(path)))
+    issues.sort(key=lambda issue: (issue.ordinal, issue.stem))
+    return issues
+
+
+class CountMatrix(NamedTuple):
+    terms: List[str]
+    counts: Any  # np.ndarray, issues x terms
+
+
+def count_matrix(issues: List[Issue], extract: Callable[[Dict[str, Any]], Iterable[str]],
+                 facet: str | None = None) -> CountMatrix:
+    """Dense issue x term matrix of item counts; an item counts once per term.
+
+    When ``facet`` is given and every issue carries cached columns, the counts
+    come from the column arrays instead of walking the items.
+    """
+    if facet is not None and issues and all(issue.columns is not None for issue in issues):
+        return _column_count_matrix(issues, facet)
+    term_ids: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, issue in enumerate(issues):
+        for item in issue.items:
+            for term in dict.fromkeys(str(v).strip() for v in extract(item) if v):
+                if term:
+                    rows.append(row)
+                    cols.append(term_ids.setdefault(term, len(term_ids)))
+    n_terms = len(term_ids)
+    flat = np.asarray(rows, dtype=np.int64) * n_terms + np.asarray(cols, dtype=np.int64)
+    counts = np.bincount(flat, minlength=len(issues) * n_terms).reshape(len(issues), n_terms)
+    return CountMatrix(list(term_ids), counts)
+
+
+def _column_count_matrix(issues: List[Issue], facet: str) -> CountMatrix:
+    """``count_matrix`` over cached columns: same terms, same order, same counts."""
+    term_ids: Dict[str, int] = {}
+    rows: List[Any] = []
+    cols: List[Any] = []
+    for row, issue in enumerate(issues):
+        columns = issue.columns
+        # Per-file codes -> global term ids (-1 drops terms that strip to nothing)
+        remap = np.array(
+            [term_ids.setdefault(t.strip(), len(term_ids)) if t.strip() else -1 for t in columns.vocab[facet]],
+            dtype=np.int64,
+        )
+        codes = remap[columns.codes(facet)]
+        keep = codes >= 0
+        if not keep.any():
+            continue
+        # An item counts once per term
+        span = len(term_ids)
+        pairs = np.unique(columns.rows(facet)[keep] * span + codes[keep])
+        cols.append(pairs % span)
+        rows.append(np.full(len(pairs), row, dtype=np.int64))
+    n_terms = len(term_ids)
+    flat = (np.concatenate(rows) * n_terms + np.concatenate(cols)) if rows else np.zeros(0, dtype=np.int64)
+    counts = np.bincount(flat, minlength=len(issues) * n_terms).reshape(len(issues), n_terms)
+    return CountMatrix(list(term_ids), counts)
+
+
+def compute_trends(matrix: CountMatrix, item_counts: Any, window: int = DEFAULT_WINDOW, top: int = DEFAULT_TOP) -> Dict[str, Any]:
+    """Shares, rolling means, growth and top movers of one count matrix."""
+    counts = matrix.counts.astype(np.float64)
+    n_issues = counts.shape[0]
+    totals_per_issue = np.asarray(item_counts, dtype=np.float64)[:, None]
+    shares = np.divide(counts, totals_per_issue, out=np.zeros_like(counts), where=totals_per_issue > 0)
+
+    w = max(1, min(window, n_issues))
+    cumulative = np.vstack([np.zeros((1, shares.shape[1])), np.cumsum(shares, axis=0)])
+    rolling = (cumulative[w:] - cumulative[:-w]) / w  # rolling[k] = mean share of issues k .. k+w-1
+
+    current = shares[n_issues - w:].mean(axis=0)
+    if n_issues > w:
+        previous = shares[max(0, n_issues - 2 * w):n_issues - w].mean(axis=0)
+    else:
+        previous = np.zeros_like(current)
+    delta = current - previous
+    # NaN growth marks terms absent from the previous window
+    growth = np.divide(delta, previous, out=np.full_like(delta, np.nan), where=previous > 0)
+    totals = matrix.counts.sum(axis=0)
+
+    def describe(indices: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                'term': matrix.terms[i],
+                'total': int(totals[i]),
+                'current_share': round(float(current[i]), 4),
+                'previous_share': round(float(previous[i]), 4),
+                'delta': round(float(delta[i]), 4),
+                'growth': None if np.isnan(growth[i]) else round(float(growth[i]), 4),
+                'series': [round(float(v), 4) for v in shares[:, i]],
+                'rolling': [round(float(v), 4) for v in rolling[:, i]],
+            }
+            for i in indices
+        ]
+
+    order_total = np.argsort(-totals, kind='stable')
+    order_up = np.argsort(-delta, kind='stable')
+    order_down = np.argsort(delta, kind='stable')
+    rising = order_up[delta[order_up] > 0][:top]
+    falling = order_down[delta[order_down] < 0][:top]
+    return {
+        'terms': len(matrix.terms),
+        'window': w,
+        'leaders': describe(order_total[:top]),
+        'rising': describe(rising),
+        'falling': describe(falling),
+    }
+
+
+def build_trends(issues: List[Issue], window: int = DEFAULT_WINDOW, top: int = DEFAULT_TOP) -> Dict[str, Any]:
+    item_counts = [len(issue.items) for issue in issues]
+    return {
+        'issues': [
+            {'stem': i.stem, 'date': date.fromordinal(i.ordinal).strftime('%d-%m-%Y') if i.ordinal else None,
+             'title': i.title, 'items': len(i.items)}
+            for i in issues
+        ],
+        'facets': {
+            facet: compute_trends(count_matrix(issues, extract, facet), item_counts, window, top)
+            for facet, extract in FACETS.items()
+        },
+    }
+
+
+# -- rendering ------------------------------------------------------------------
+
+def sparkline(values: List[float], width: int = 120, height: int = 28) -> str:
+    """Inline SVG polyline of a share series (0..max)."""
+    if not values:
+        return ''
+    peak = max(values) or 1.0
+    step = width / max(1, len(values) - 1)
+    points = ' '.join(
+        f'{i * step:.1f},{height - 2 - (v / peak) * (height - 4):.1f}' for i, v in enumerate(values)
+    )
+    return (f'<svg class="sparkline" width="{width}" height="{height}" viewBox="0 0 {width} {height}" aria-hidden="true">'
+            f'<polyline fill="none" stroke="#000" stroke-width="1.5" points="{points}"/></svg>')
+
+
+def _term_label(facet: str, term: str, lang: str) -> str:
+    return display_name(term, lang) if facet == 'country' else term
+
+
+def _rows_html(facet: str, rows: List[Dict[str, Any]], lang: str, mode: str, labels: Dict[str, str]) -> str:
+    if not rows:
+        return f'<p class="empty">{labels["none"]}</p>'
+    peak = max((abs(r['delta']) if mode != 'leaders' else r['total']) for r in rows) or 1
+    html = ''
+    for r in rows:
+        if mode == 'leaders':
+            width, value = r['total'] / peak * 100, str(r['total'])
+        else:
+            width = abs(r['delta']) / peak * 100
+            growth = labels['new'] if r['growth'] is None else f"{r['growth'] * 100:+.0f}%"
+            value = f"{r['delta'] * 100:+.1f} pp ({growth})"
+        html += f"""
+                    <div class="trend-row">
+                        <div class="chart-label">{escape(_term_label(facet, r['term'], lang))}</div>
+                        <div class="chart-bar-container"><div class="chart-bar {mode}" style="width: {width:.1f}%"></div></div>
+                        {sparkline(r['series'])}
+                        <div class="chart-value">{value}</div>
+                    </div>"""
+    return html
+
+
+def render_dashboard(newsletter: str, trends: Dict[str, Any], lang: str = 'en') -> str:
+    labels = LABELS.get(lang, LABELS['en'])
+    issues = trends['issues']
+    dated = [i['date'] for i in issues if i['date']]
+    period = f'{dated[0]} — {dated[-1]}' if dated else '—'
+    window = next(iter(trends['facets'].values()))['window'] if trends['facets'] else DEFAULT_WINDOW
+    sections = ''
+    for facet, result in trends['facets'].items():
+        sections += f"""
+        <h2 class="facet-title">{labels[facet]} <span>({result['terms']})</span></h2>
+        <div class="dashboard-grid">"""
+        for mode in ('leaders', 'rising', 'falling'):
+            sections += f"""
+            <div class="chart-card">
+                <h3>{labels[mode]}</h3>
+                <div class="chart-container">{_rows_html(facet, result[mode], lang, mode, labels)}
+                </div>
+            </div>"""
+        sections += """
+        </div>"""
+
+    return f"""<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{labels['title']} - {escape(newsletter)} | Kepler Karst</title>
+    <style>
+        :root {{
+            --e-global-color-primary: #000000;
+            --e-global-color-secondary: #F1EEA4;
+            --e-global-color-text: #000000;
+        }}
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{
+            font-family: "Sharp Grotesk", -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+            color: var(--e-global-color-text);
+            line-height: 1.6;
+            background-color: #f8f9fa;
+        }}
+        .header {{ background-color: white; padding: 2rem; text-align: center; border-bottom: 1px solid #e0e0e0; }}
+        .header h1 {{ font-family: Georgia, serif; font-size: 2.5rem; margin-bottom: 0.5rem; }}
+        .header .subtitle {{ font-size: 1.1rem; color: #666; }}
+        .container {{ max-width: 1400px; margin: 0 auto; padding: 2rem; }}
+        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 1rem; }}
+        .stat-card {{ background: white; padding: 1.5rem; border-radius: 8px; text-align: center; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        .stat-number {{ font-size: 1.6rem; font-weight: bold; margin-bottom: 0.5rem; }}
+        .stat-label {{ font-size: 0.9rem; color: #666; }}
+        .note {{ font-size: 0.85rem; color: #666; margin-bottom: 2rem; }}
+        .facet-title {{ font-family: Georgia, serif; margin: 2rem 0 1rem; }}
+        .facet-title span {{ font-size: 1rem; color: #666; font-weight: normal; }}
+        .dashboard-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(400px, 1fr)); gap: 2rem; }}
+        .chart-card {{ background: white; border-radius: 8px; padding: 1.5rem; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        .chart-card h3 {{ font-family: Georgia, serif; margin-bottom: 1rem; font-size: 1.2rem; }}
+        .trend-row {{ display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.5rem; }}
+        .chart-label {{ min-width: 140px; max-width: 140px; font-weight: 500; font-size: 0.85rem; overflow-wrap: anywhere; }}
+        .chart-bar-container {{ flex: 1; height: 16px; background-color: #f0f0f0; border-radius: 8px; overflow: hidden; border: 1px solid #e0e0e0; }}
+        .chart-bar {{ height: 100%; min-width: 4px; border-radius: 8px; background-color: var(--e-global-color-secondary); }}
+        .chart-bar.rising {{ background-color: #9fd49f; }}
+        .chart-bar.falling {{ background-color: #e8a5a5; }}
+        .chart-value {{ min-width: 110px; text-align: right; font-weight: bold; font-size: 0.85rem; }}
+        .sparkline {{ flex: none; }}
+        .empty {{ color: #666; font-size: 0.9rem; }}
+    </style>
+</head>
+<body>
+    <header class="header">
+        <h1>{labels['title']}</h1>
+        <p class="subtitle">{labels['subtitle']} — {escape(newsletter)}</p>
+    </header>
+    <main class="container">
+        <div class="stats-grid">
+            <div class="stat-card"><div class="stat-number">{len(issues)}</div><div class="stat-label">{labels['issues']}</div></div>
+            <div class="stat-card"><div class="stat-number">{sum(i['items'] for i in issues)}</div><div class="stat-label">{labels['items']}</div></div>
+            <div class="stat-card"><div class="stat-number">{period}</div><div class="stat-label">{labels['period']}</div></div>
+            <div class="stat-card"><div class="stat-number">{window}</div><div class="stat-label">{labels['window']}</div></div>
+        </div>
+        <p class="note">{labels['note'].format(w=window)}</p>
+        {sections}
+    </main>
+</body>
+</html>"""
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Cross-issue trend analytics for a newsletter.')
+    parser.add_argument('newsletter', help='data/<newsletter> directory name, e.g. sovereign-debt')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='issues per rolling window')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='terms per leaders/movers list')
+    parser.add_argument('--output', type=Path, help='dashboard path (default: docs/<newsletter>/issues/trends_meta.html)')
+    parser.add_argument('--json', type=Path, help='also write the computed trends as JSON')
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print('Error: trend analytics need NumPy. Install it with: pip install numpy')
+        return 2
+    if args.window < 1 or args.top < 1:
+        print('Error: --window and --top must be at least 1')
+        return 2
+    if not (DATA_DIR / args.newsletter).is_dir():
+        print(f'Error: no such newsletter directory: {DATA_DIR / args.newsletter}')
+        return 2
+
+    issues = load_issues(args.newsletter)
+    if not issues:
+        print(f'Error: no issues with items in {DATA_DIR / args.newsletter}')
+        return 2
+    trends = build_trends(issues, args.window, args.top)
+
+    output = args.output or DOCS_DIR / args.newsletter / 'issues' / 'trends_meta.html'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(output, render_dashboard(args.newsletter, trends, LANGUAGES.get(args.newsletter, 'en')))
+    if args.json:
+        write_if_changed(args.json, canonical_json(trends, indent=2))
+
+    print(f"✅ Trends dashboard generated: {output}")
+    print(f"📈 {len(issues)} issues, {sum(len(i.items) for i in issues)} items")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
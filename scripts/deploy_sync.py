@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Publish the built site to a mirror directory, moving only what changed.
+
+Reads the deploy manifest that scripts/build.py writes after every build
+(.cache/deploy_manifest.json: hash and size of every file under docs/) and
+compares it with the manifest the target recorded at its last sync
+(TARGET/.deploy-manifest.json). Added and changed files are copied in
+parallel, each through a temp file and an atomic rename, files gone from
+docs/ are deleted, and the target's manifest is written last, so an
+interrupted sync simply resumes next time. A target without a manifest is
+hashed once to find what it already holds.
+
+Every copied file is checked against the manifest's hash: a file edited
+after the build stops the sync instead of being published unrecorded.
+
+Usage:
+  python scripts/deploy_sync.py /srv/mirror/kepler
+  python scripts/deploy_sync.py /srv/mirror/kepler --dry-run
+  python scripts/deploy_sync.py /srv/mirror/kepler --jobs 16
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'converters'))
+
+from output_files import canonical_json, write_if_changed  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+DEPLOY_MANIFEST = ROOT / '.cache' / 'deploy_manifest.json'
+TARGET_MANIFEST = '.deploy-manifest.json'
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def deployed_files(target: Path) -> Dict[str, dict]:
+    """What the target holds: its recorded manifest, or a scan when it has none."""
+    try:
+        with (target / TARGET_MANIFEST).open('r', encoding='utf-8') as f:
+            return json.load(f)['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    files = {}
+    for path in sorted(target.rglob('*')):
+        if path.is_file() and path.name != TARGET_MANIFEST and not path.name.startswith('.'):
+            data = path.read_bytes()
+            files[path.relative_to(target).as_posix()] = {'sha256': _sha256(data), 'size': len(data)}
+    return files
+
+
+def copy_file(source_root: Path, target: Path, name: str, expected: dict) -> int:
+    data = (source_root / name).read_bytes()
+    if _sha256(data) != expected['sha256']:
+        raise RuntimeError(f"{source_root / name} changed since the build; rebuild before deploying")
+    write_if_changed(target / name, data)
+    return len(data)
+
+
+def remove_file(target: Path, name: str) -> None:
+    path = target / name
+    path.unlink(missing_ok=True)
+    # Drop directories the deletion left empty
+    parent = path.parent
+    while parent != target:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Sync the built site to a mirror directory')
+    parser.add_argument('target', help='mirror directory')
+    parser.add_argument('--manifest', default=str(DEPLOY_MANIFEST), help='deploy manifest written by build.py')
+    parser.add_argument('-j', '--jobs', type=int, default=8, help='parallel copies')
+    parser.add_argument('--dry-run', action='store_true', help='list what would be copied and deleted')
+    args = parser.parse_args()
+
+    try:
+        with open(args.manifest, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        print(f"❌ No deploy manifest at {args.manifest}; run scripts/build.py first")
+        return 2
+    source_root = ROOT / manifest['root']
+    target = Path(args.target)
+    target.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    files: Dict[str, dict] = manifest['files']
+    deployed = deployed_files(target)
+    uploads: List[str] = [name for name, entry in files.items() if deployed.get(name) != entry]
+    deletions: List[str] = sorted(name for name in deployed if name not in files)
+
+    if args.dry_run:
+        for name in uploads:
+            print(f"⬆️  {name} ({files[name]['size']} bytes)")
+        for name in deletions:
+            print(f"🗑️  {name}")
+        print(f"📦 Would copy {len(uploads)} and delete {len(deletions)} of {len(files)} files")
+        return 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            copied = sum(pool.map(lambda name: copy_file(source_root, target, name, files[name]), uploads))
+            list(pool.map(lambda name: remove_file(target, name), deletions))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    write_if_changed(target / TARGET_MANIFEST, canonical_json({'version': manifest['version'], 'files': files}, indent=1))
+    print(f"🚀 Copied {len(uploads)} files ({copied / 1024:.0f} KB), deleted {len(deletions)}, "
+          f"{len(files) - len(uploads)} unchanged ({time.perf_counter() - t0:.2f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
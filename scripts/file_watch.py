@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+File change notification for the build's watch mode.
+
+InotifyWatcher asks the Linux kernel for change events (through ctypes, so
+no extra dependency); PollingWatcher compares (size, mtime) snapshots of the
+watched trees and works everywhere. ``make_watcher`` picks inotify when it is
+available. Both return the set of changed paths from ``wait``; editor swap
+files, temp files and __pycache__ are ignored.
+"""
+
+import ctypes
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+IGNORED_SUFFIXES = ('~', '.tmp', '.swp', '.swx', '.pyc')
+
+
+def ignored(path: Path) -> bool:
+    return path.name.startswith('.') or path.name.endswith(IGNORED_SUFFIXES) or '__pycache__' in path.parts
+
+
+class InotifyWatcher:
+    """Recursive inotify watches on a few directory trees."""
+
+    kind = 'inotify'
+
+    def __init__(self, roots: Iterable[Path]):
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.roots = [Path(root) for root in roots]
+        self.dirs: Dict[int, Path] = {}
+        for root in self.roots:
+            self._watch_tree(root)
+
+    def _watch_tree(self, root: Path) -> None:
+        for directory, subdirs, _ in os.walk(root):
+            subdirs[:] = [d for d in subdirs if not ignored(Path(directory) / d)]
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self.dirs[wd] = Path(directory)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Changed paths, or an empty set when nothing changed within ``timeout`` seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buf):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            name = buf[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: report every tree as changed
+                changed.update(self.roots)
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name)
+            if ignored(path):
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._watch_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback: stat every file of the watched trees every ``interval`` seconds."""
+
+    kind = 'polling'
+
+    def __init__(self, roots: Iterable[Path], interval: float = 0.2):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        stack = [root for root in self.roots if root.is_dir()]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    path = Path(entry.path)
+                    if ignored(path):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(path)
+                    else:
+                        st = entry.stat()
+                        snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+            current = self._scan()
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(roots: Iterable[Path], poll: bool = False):
+    """inotify on Linux unless ``poll`` is set or it is unavailable; stat polling otherwise."""
+    roots = [Path(root) for root in roots if Path(root).is_dir()]
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
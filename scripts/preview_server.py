@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Local preview server for the generated site (docs/).
+
+  - one thread per connection, HTTP/1.1 keep-alive, so many tabs never queue
+    behind each other or behind the reload streams
+  - precompressed siblings (page.html.br, page.html.gz, written by
+    scripts/build.py) are served when the browser accepts them; pages with
+    the live-reload script are compressed on the fly the same way
+  - ETag / Last-Modified with If-None-Match / If-Modified-Since answer 304
+  - single byte ranges (fonts, header images) answer 206 / 416
+  - live reload: HTML pages get a small script that listens on /__reload and
+    reloads when the page it shows was rebuilt
+
+Standalone it watches docs/ itself; ``python scripts/build.py --watch --serve``
+runs it inside the watch-mode build, which announces each finished build.
+
+Usage:
+  python scripts/preview_server.py
+  python scripts/preview_server.py --port 8000 --no-reload
+"""
+
+import argparse
+import email.utils
+import gzip
+import http.server
+import json
+import sys
+import threading
+from functools import lru_cache
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_PORT = 8000
+RELOAD_PATH = '/__reload'
+PING_INTERVAL = 15.0
+COPY_CHUNK = 64 * 1024
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# Live-reload pages are compressed on the fly, with the levels build.py uses for the siblings
+COMPRESSORS = {'gzip': lambda body: gzip.compress(body, compresslevel=9, mtime=0)}
+if brotli is not None:
+    COMPRESSORS['br'] = brotli.compress
+
+RELOAD_SCRIPT = b'''<script>
+(function () {
+    var here = location.pathname.endsWith('/') ? location.pathname + 'index.html' : location.pathname;
+    var events = new EventSource('/__reload');
+    events.addEventListener('reload', function (event) {
+        var paths = JSON.parse(event.data);
+        if (!paths.length || paths.indexOf(decodeURI(here)) >= 0) location.reload();
+    });
+})();
+</script>
+'''
+
+
+class PreviewServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Every open tab holds a connection; let bursts of them queue instead of retrying
+    request_queue_size = 128
+
+
+class ReloadHub:
+    """Build generations that the reload streams wait on."""
+
+    def __init__(self):
+        self._changed = threading.Condition()
+        self.generation = 0
+        self.paths: List[str] = []
+
+    def broadcast(self, paths: Iterable[str] = ()) -> None:
+        """Tell every open page that a build finished; ``paths`` are the URL paths it rewrote."""
+        with self._changed:
+            self.generation += 1
+            self.paths = sorted(paths)
+            self._changed.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> Tuple[int, List[str]]:
+        with self._changed:
+            self._changed.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation, self.paths
+
+
+def url_paths(root: Path, files: Iterable[Path]) -> List[str]:
+    """Site URL paths of files under ``root`` (others are dropped)."""
+    root = root.resolve()
+    paths = []
+    for file in files:
+        try:
+            paths.append('/' + Path(file).resolve().relative_to(root).as_posix())
+        except ValueError:
+            continue
+    return paths
+
+
+@lru_cache(maxsize=256)
+def _with_reload_script(path: str, mtime_ns: int, size: int, encoding: Optional[str] = None) -> bytes:
+    if encoding is not None:
+        return COMPRESSORS[encoding](_with_reload_script(path, mtime_ns, size))
+    body = Path(path).read_bytes()
+    end = body.lower().rfind(b'</body>')
+    return body + RELOAD_SCRIPT if end < 0 else body[:end] + RELOAD_SCRIPT + body[end:]
+
+
+def _accepts(header: Optional[str], encoding: str) -> bool:
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        if name.strip() == encoding:
+            return params.replace(' ', '') not in ('q=0', 'q=0.0')
+    return False
+
+
+def _compressed_sibling(path: Path, mtime_ns: int, accept: Optional[str]) -> Optional[Tuple[str, Path]]:
+    """(encoding, file) of the first accepted precompressed sibling no older than ``path``."""
+    for name, suffix in ENCODINGS:
+        variant = path.with_name(path.name + suffix)
+        if _accepts(accept, name) and variant.is_file() and variant.stat().st_mtime_ns >= mtime_ns:
+            return name, variant
+    return None
+
+
+def _byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """(start, end inclusive) of a single ``bytes=`` range; None to send the whole body.
+
+    Raises ValueError for a range that cannot be satisfied.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None
+    start, _, end = header[len('bytes='):].strip().partition('-')
+    try:
+        if not start:
+            length = int(end)
+            if length <= 0:
+                raise ValueError(header)
+            return max(0, size - length), size - 1
+        first = int(start)
+        last = min(int(end), size - 1) if end else size - 1
+    except ValueError:
+        return None
+    if first >= size or first > last:
+        raise ValueError(header)
+    return first, last
+
+
+def make_preview_server(root: Path = Path('docs'), host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                        hub: Optional[ReloadHub] = None, quiet: bool = False) -> ThreadingHTTPServer:
+    """Preview server for ``root``; pages get live reload when ``hub`` is given."""
+    root = Path(root).resolve()
+
+    class PreviewHandler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(root), **kwargs)
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+        def do_GET(self):
+            self.serve(head=False)
+
+        def do_HEAD(self):
+            self.serve(head=True)
+
+        def serve(self, head: bool):
+            url_path = urlsplit(self.path).path
+            if url_path == RELOAD_PATH and hub is not None:
+                self.stream_reloads()
+                return
+            path = Path(self.translate_path(self.path))
+            if path.is_dir():
+                if not url_path.endswith('/'):
+                    self.send_response(301)
+                    self.send_header('Location', url_path + '/')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                path = path / 'index.html'
+            try:
+                st = path.stat()
+            except OSError:
+                self.send_error(404, "File not found")
+                return
+            if not path.is_file():
+                self.send_error(404, "File not found")
+                return
+
+            content_type = self.guess_type(str(path))
+            etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+            body: Optional[bytes] = None
+            body_path, encoding, size = path, None, st.st_size
+            sibling = None
+            if 'Range' not in self.headers:
+                sibling = _compressed_sibling(path, st.st_mtime_ns, self.headers.get('Accept-Encoding'))
+            if hub is not None and content_type == 'text/html':
+                # The page served is not the file on disk, so its sibling only says it is worth compressing
+                if sibling is not None and sibling[0] in COMPRESSORS:
+                    encoding = sibling[0]
+                body = _with_reload_script(str(path), st.st_mtime_ns, st.st_size, encoding)
+                size = len(body)
+                etag = etag[:-1] + '-r' + (f'-{encoding}"' if encoding else '"')
+            elif sibling is not None:
+                encoding, body_path = sibling
+                size = body_path.stat().st_size
+                etag = etag[:-1] + f'-{encoding}"'
+
+            headers = {
+                'ETag': etag,
+                'Last-Modified': self.date_time_string(int(st.st_mtime)),
+                'Cache-Control': 'no-cache',
+                'Vary': 'Accept-Encoding',
+            }
+            if self.not_modified(etag, int(st.st_mtime)):
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+
+            status, first, last = 200, 0, size - 1
+            if encoding is None and self.headers.get('If-Range', etag) == etag:
+                try:
+                    byte_range = _byte_range(self.headers.get('Range'), size)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if byte_range is not None:
+                    status, (first, last) = 206, byte_range
+
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(last - first + 1))
+            self.send_header('Accept-Ranges', 'bytes')
+            if status == 206:
+                self.send_header('Content-Range', f'bytes {first}-{last}/{size}')
+            if encoding is not None:
+                self.send_header('Content-Encoding', encoding)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if head:
+                return
+            if body is not None:
+                self.wfile.write(body[first:last + 1])
+                return
+            with open(body_path, 'rb') as f:
+                f.seek(first)
+                remaining = last - first + 1
+                while remaining > 0:
+                    chunk = f.read(min(COPY_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+        def not_modified(self, etag: str, mtime: int) -> bool:
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match is not None:
+                tags = [tag.strip() for tag in if_none_match.split(',')]
+                return '*' in tags or etag in tags or f'W/{etag}' in tags
+            if_modified_since = self.headers.get('If-Modified-Since')
+            if if_modified_since:
+                try:
+                    return mtime <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+                except (TypeError, ValueError):
+                    return False
+            return False
+
+        def stream_reloads(self):
+            # An event stream has no length: it ends when the connection does
+            self.close_connection = True
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            generation = hub.generation
+            try:
+                # A reconnecting page missed the builds since the event id it last saw
+                generation = int(self.headers.get('Last-Event-ID', generation))
+            except ValueError:
+                pass
+            try:
+                self.wfile.write(b'retry: 1000\n\n')
+                while True:
+                    current, paths = hub.wait(generation, PING_INTERVAL)
+                    if current == generation:
+                        self.wfile.write(b': ping\n\n')
+                        continue
+                    generation = current
+                    self.wfile.write(f'id: {current}\nevent: reload\ndata: {json.dumps(paths)}\n\n'.encode('utf-8'))
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return PreviewServer((host, port), PreviewHandler)
+
+
+def watch_docs(root: Path, hub: ReloadHub, poll: bool = False, debounce: float = 0.1) -> None:
+    """Announce changes under ``root`` to the open pages (standalone mode)."""
+    from file_watch import make_watcher
+
+    watcher = make_watcher([root], poll)
+    while True:
+        changed = watcher.wait()
+        while True:
+            more = watcher.wait(debounce)
+            if not more:
+                break
+            changed |= more
+        pages = [path for path in url_paths(root, changed) if not path.endswith(('.gz', '.br'))]
+        if pages:
+            hub.broadcast(pages)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Preview the generated site')
+    parser.add_argument('--root', default='docs', help='directory to serve (default: docs)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--no-reload', action='store_true', help='serve files verbatim, without live reload')
+    parser.add_argument('--poll', action='store_true', help='watch by polling file stats instead of inotify')
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    hub = None if args.no_reload else ReloadHub()
+    server = make_preview_server(root, args.host, args.port, hub)
+    if hub is not None:
+        threading.Thread(target=watch_docs, args=(root, hub, args.poll), daemon=True).start()
+    print(f"🌐 Previewing {root} at http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✅ Preview server stopped")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Live preview of client review drafts.
+
+Renders single EDITABLE blocks of a review draft with the merged converter's
+own generators, so the preview matches the published page:
+
+  ## EXECUTIVE SUMMARY   ->  generate_summary_html
+  ### Article N          ->  generate_item_html
+
+Rendered fragments are cached by heading and block content, so a keystroke
+burst only renders the block being edited and unchanged blocks are never
+rendered twice. PreviewHub fans fragments out to the server-sent event
+streams of everyone reviewing the same draft.
+"""
+
+import json
+import queue
+import re
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "converters"))
+
+from json_to_html_converter_merged import generate_item_html, generate_summary_html, get_human_cluster_title  # noqa: E402
+
+FIELD_RE = re.compile(r'^\*\*([A-Za-z ]+):\*\*\s?(.*)$')
+ARTICLE_RE = re.compile(r'^###\s+Article\s+(\d+)\s*$')
+SUMMARY_FIELDS = {
+    'Overview': 'overview',
+    'Key Findings': 'key_findings',
+    'Key Themes': 'key_themes',
+    'Geographical Focus': 'geographical_focus',
+    'Trend Analysis': 'trend_analysis',
+}
+SUMMARY_LISTS = {'key_findings', 'key_themes', 'geographical_focus'}
+# Article fields holding the lists of an item's structured content
+CONTENT_LISTS = {'Laws Invoked': 'laws_invoked', 'Institutions': 'institutions', 'Next Milestones': 'next_milestones'}
+
+
+def block_kind(heading: str) -> Tuple[Optional[str], int]:
+    """('article', N), ('summary', 0) or (None, 0) for blocks without a preview"""
+    heading = heading.strip()
+    match = ARTICLE_RE.match(heading)
+    if match:
+        return 'article', int(match.group(1))
+    if heading == '## EXECUTIVE SUMMARY':
+        return 'summary', 0
+    return None, 0
+
+
+def _list_entries(lines: List[str]) -> List[str]:
+    return [line[2:].strip() for line in lines if line.startswith('- ')]
+
+
+def parse_article(text: str) -> Dict[str, Any]:
+    """Rebuild the item fields an article block carries (see _json_to_markdown)"""
+    fields: Dict[str, List[str]] = {}
+    current = None
+    for line in text.strip('\n').split('\n'):
+        match = FIELD_RE.match(line)
+        if match:
+            current = match.group(1)
+            fields[current] = [match.group(2)] if match.group(2) else []
+        elif current is not None:
+            fields[current].append(line)
+
+    def field(name: str) -> str:
+        return '\n'.join(fields.get(name, [])).strip()
+
+    summary = field('Summary')
+    content: Any = summary
+    if any(label in fields for label in CONTENT_LISTS):
+        # Items with structured content carry its rendered lists as their own fields
+        content = {'summary': summary}
+        for label, key in CONTENT_LISTS.items():
+            content[key] = _list_entries(fields.get(label, [])) or field(label)
+
+    category = field('Category')
+    if category:
+        # Clustered like the published page, by the merger's normalised category
+        from merge_artlaw_reports import normalize_category
+        category = normalize_category({'classification': {'primary_category': category}})
+
+    return {
+        'headline': field('Title'),
+        'content': content,
+        'jurisdiction': field('Jurisdiction'),
+        'category': category,
+    }
+
+
+def parse_summary(text: str) -> Dict[str, Any]:
+    """Rebuild the executive_summary dict of the EXECUTIVE SUMMARY block"""
+    sections: Dict[str, List[str]] = {}
+    current = None
+    for line in text.strip('\n').split('\n'):
+        if line.startswith('### '):
+            current = SUMMARY_FIELDS.get(line[4:].strip())
+            if current is not None:
+                sections[current] = []
+        elif current is not None:
+            sections[current].append(line)
+
+    summary: Dict[str, Any] = {}
+    for key, lines in sections.items():
+        summary[key] = _list_entries(lines) if key in SUMMARY_LISTS else '\n'.join(lines).strip()
+    return summary
+
+
+@lru_cache(maxsize=1024)
+def render_block(heading: str, text: str) -> Optional[str]:
+    """HTML fragment of one EDITABLE block, or None when it has no preview"""
+    kind, number = block_kind(heading)
+    if kind == 'article':
+        item = parse_article(text)
+        return generate_item_html(item, number, get_human_cluster_title(item['category']) if item['category'] else '')
+    if kind == 'summary':
+        return generate_summary_html(parse_summary(text))
+    return None
+
+
+class PreviewHub:
+    """Per-draft subscriber queues for the server-sent event streams"""
+
+    def __init__(self, backlog: int = 256):
+        self.backlog = backlog
+        self._subscribers: Dict[str, List[queue.Queue]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, draft: str) -> queue.Queue:
+        events: queue.Queue = queue.Queue(self.backlog)
+        with self._lock:
+            self._subscribers.setdefault(draft, []).append(events)
+        return events
+
+    def unsubscribe(self, draft: str, events: queue.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(draft, [])
+            if events in subscribers:
+                subscribers.remove(events)
+            if not subscribers:
+                self._subscribers.pop(draft, None)
+
+    def publish(self, draft: str, fragments: Dict[int, str]) -> None:
+        message = json.dumps({'blocks': {str(index): html for index, html in fragments.items()}})
+        with self._lock:
+            subscribers = list(self._subscribers.get(draft, []))
+        for events in subscribers:
+            try:
+                events.put_nowait(message)
+            except queue.Full:
+                # A stalled stream drops fragments; the next edit re-sends its block
+                pass